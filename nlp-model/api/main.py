@@ -3,19 +3,28 @@ FastAPI server for NLP Text Analysis & Motivation System
 Provides REST API endpoints for text summarization, mood detection, and motivation.
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional
+import asyncio
 import sys
 import os
 
-# Add the models directory to the path
+# Add the models and utils directories to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 
 from summarizer import TextSummarizer
 from mood_detector import MoodDetector
 from motivator import Motivator
+from batching import MicroBatcher
+from inference_executor import InferenceExecutor, ExecutorBusyError
+from stage_graph import StageGraph, StageGraphResult
+from result_cache import CacheKey, create_result_cache, make_cache_key, result_model_version
+from process_memory import process_memory
+from component_loader import create_components, env_flag, model_settings, start_background_warmup
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -35,10 +44,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global model instances
-summarizer = None
-mood_detector = None
-motivator = None
+# Model options from NLP_INCREMENTAL, INFERENCE_BACKEND, MOOD_FUSED, SUMMARIZER_QUANTIZE
+# and SUMMARIZER_CORPUS_IDF, shared with the other server and the CLI
+MODEL_SETTINGS = model_settings()
+
+# Load and warm up every component in the background once the server is up
+MODEL_WARMUP = env_flag("MODEL_WARMUP", "1")
+
+# Model components; each one loads independently on first use, so cheap
+# endpoints (motivation, extractive summaries) never wait for the large models
+components = create_components(MODEL_SETTINGS)
+
+# Dedicated executor so model inference never blocks the event loop
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "2"))
+INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "32"))
+
+inference_executor = InferenceExecutor(
+    max_workers=INFERENCE_WORKERS,
+    max_queue_size=INFERENCE_QUEUE_SIZE
+)
+
+# Cache of analysis results for repeated texts, backed by a SQLite store shared
+# across workers (motivation is never cached so it stays varied)
+result_cache = create_result_cache()
+
+# Micro-batching of concurrent mood requests
+MOOD_BATCH_MAX_SIZE = int(os.getenv("MOOD_BATCH_MAX_SIZE", "16"))
+MOOD_BATCH_MAX_WAIT_MS = float(os.getenv("MOOD_BATCH_MAX_WAIT_MS", "10"))
+
+sentiment_batcher = None
+emotion_batcher = None
 
 # Request/Response Models
 class TextAnalysisRequest(BaseModel):
@@ -46,11 +81,11 @@ class TextAnalysisRequest(BaseModel):
     include_summary: bool = Field(True, description="Include text summarization")
     include_mood: bool = Field(True, description="Include mood detection")
     include_motivation: bool = Field(True, description="Include motivational content")
-    summary_type: str = Field("auto", description="Type of summary: auto, extractive, abstractive")
+    summary_type: str = Field("auto", description="Type of summary: auto, extractive, graph, abstractive")
 
 class SummaryRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=10000, description="Text to summarize")
-    summary_type: str = Field("auto", description="Type of summary: auto, extractive, abstractive")
+    summary_type: str = Field("auto", description="Type of summary: auto, extractive, graph, abstractive")
     num_sentences: int = Field(3, ge=1, le=10, description="Number of sentences for extractive summary")
 
 class MoodRequest(BaseModel):
@@ -91,26 +126,214 @@ class ComprehensiveAnalysisResponse(BaseModel):
     mood: Optional[MoodResponse] = None
     motivation: Optional[MotivationResponse] = None
     processing_time: float
+    stage_timings: Optional[Dict[str, float]] = None
     success: bool
     message: str
 
-# Dependency to initialize models
+class BatchAnalysisRequest(BaseModel):
+    items: List[TextAnalysisRequest] = Field(..., min_length=1, max_length=100, description="Texts to analyze, each with its own options")
+
+class BatchAnalysisResponse(BaseModel):
+    results: List[ComprehensiveAnalysisResponse]
+    processing_time: float
+    success: bool
+    message: str
+
+def build_summary_response(summary_result: Dict, key_phrases: List[str]) -> SummaryResponse:
+    return SummaryResponse(
+        summary=summary_result["summary"],
+        method=summary_result["method"],
+        original_length=summary_result["original_length"],
+        summary_length=summary_result["summary_length"],
+        compression_ratio=summary_result["compression_ratio"],
+        key_phrases=key_phrases
+    )
+
+def build_mood_response(mood_result: Dict) -> MoodResponse:
+    return MoodResponse(
+        overall_mood=mood_result["overall_mood"],
+        mood_category=mood_result["mood_category"],
+        confidence=mood_result["confidence"],
+        description=mood_result["description"],
+        suggestions=mood_result["suggestions"],
+        sentiment=mood_result["sentiment"],
+        emotions=mood_result["emotions"],
+        indicators=mood_result["indicators"]
+    )
+
+def build_motivation_response(motivation_result: Dict) -> MotivationResponse:
+    return MotivationResponse(
+        motivational_quote=motivation_result["motivational_quote"],
+        affirmations=motivation_result["affirmations"],
+        coping_strategies=motivation_result["coping_strategies"],
+        success_tip=motivation_result["success_tip"],
+        encouragement=motivation_result["encouragement"],
+        mood_addressed=motivation_result["mood_addressed"]
+    )
+
+# Load every component (blocking); used when all models must be resident up front
 def get_models():
-    global summarizer, mood_detector, motivator
+    return (
+        components["abstractive_model"].get(),
+        components["mood_detector"].get(),
+        components["motivator"].get()
+    )
+
+async def load_component(name: str):
+    """Return a component, loading it off the event loop if needed."""
+    component = components[name]
+    if component.loaded:
+        return component.peek()
+    return await asyncio.get_running_loop().run_in_executor(None, component.get)
+
+async def load_analysis_models(items: List[TextAnalysisRequest]) -> tuple:
+    """
+    Load only the components these analysis requests will use: the abstractive
+    model only if a summary may need it (as in /summarize), the mood models only
+    if mood is requested. Components that are not needed come back as None.
+    """
+    summary_items = [item for item in items if item.include_summary]
+    mood_items = [item for item in items if item.include_mood]
+    
+    if any(TextSummarizer.may_use_abstractive(item.text, item.summary_type) for item in summary_items):
+        summarizer_name = "abstractive_model"
+    else:
+        summarizer_name = "summarizer"
+    names = (
+        summarizer_name if summary_items else None,
+        "mood_detector" if mood_items else None,
+        "motivator" if any(item.include_motivation for item in mood_items) else None
+    )
+    
+    loaded = iter(await asyncio.gather(*(load_component(name) for name in names if name)))
+    return tuple(next(loaded) if name else None for name in names)
+
+# Dependencies that load only what an endpoint needs
+
+async def get_mood_detector():
+    return await load_component("mood_detector")
+
+async def get_motivator():
+    return await load_component("motivator")
+
+def get_mood_batchers(mood_detector_instance: MoodDetector):
+    global sentiment_batcher, emotion_batcher
+    
+    if sentiment_batcher is None:
+        sentiment_batcher = MicroBatcher(
+            mood_detector_instance.analyze_sentiment_advanced_batch,
+            max_batch_size=MOOD_BATCH_MAX_SIZE,
+            max_wait_ms=MOOD_BATCH_MAX_WAIT_MS,
+            name="sentiment",
+            runner=inference_executor.run
+        )
     
-    if summarizer is None:
-        print("Initializing Text Summarizer...")
-        summarizer = TextSummarizer()
+    if emotion_batcher is None:
+        emotion_batcher = MicroBatcher(
+            mood_detector_instance.detect_emotions_batch,
+            max_batch_size=MOOD_BATCH_MAX_SIZE,
+            max_wait_ms=MOOD_BATCH_MAX_WAIT_MS,
+            name="emotion",
+            runner=inference_executor.run
+        )
     
-    if mood_detector is None:
-        print("Initializing Mood Detector...")
-        mood_detector = MoodDetector()
+    return sentiment_batcher, emotion_batcher
+
+def cache_key(namespace: str, component, text: str, **options) -> CacheKey:
+    """Key a result by its text, the options that shape it and the component's model version."""
+    return make_cache_key(namespace, text, options, result_model_version(component, text, options))
+
+# The result cache reads and writes its SQLite store synchronously (including
+# periodic pruning), so every lookup and store runs on a thread, never on the loop
+async def cache_get_many(keys: List[CacheKey]) -> List:
+    """Look up several cached results in one trip off the event loop."""
+    if not keys:
+        return []
+    return await asyncio.to_thread(lambda: [result_cache.get(key) for key in keys])
+
+async def cache_get(key: CacheKey):
+    return (await cache_get_many([key]))[0]
+
+async def remember(key: CacheKey, value):
+    """Store a freshly computed result in the cache and pass it through."""
+    await asyncio.to_thread(result_cache.set, key, value)
+    return value
+
+async def run_cached(key: CacheKey, fn, *args, **kwargs):
+    """Return a cached result, or compute it on the inference executor and cache it."""
+    cached = await cache_get(key)
+    if cached is not None:
+        return cached
+    return await remember(key, await inference_executor.run(fn, *args, **kwargs))
+
+async def add_mood_stages(graph: StageGraph, mood_detector_instance: MoodDetector, text: str) -> StageGraph:
+    """
+    Add the mood detection stages to an analysis graph, ending in a "mood" stage.
+    Sentiment and emotion run concurrently and are batched with other requests.
+    """
+    mood_key = cache_key("mood", mood_detector_instance, text)
+    cached_mood = await cache_get(mood_key)
+    if cached_mood is not None:
+        return graph.add_stage("mood", lambda _: cached_mood)
     
-    if motivator is None:
-        print("Initializing Motivator...")
-        motivator = Motivator()
+    if not text or len(text.strip()) == 0:
+        return graph.add_stage(
+            "mood",
+            lambda _: run_cached(mood_key, mood_detector_instance.comprehensive_mood_analysis, text)
+        )
+    
+    sentiment_batcher_instance, emotion_batcher_instance = get_mood_batchers(mood_detector_instance)
+    processed_text = mood_detector_instance.preprocess_text(text)
+    
+    graph.add_stage("sentiment", lambda _: sentiment_batcher_instance.submit(processed_text))
+    graph.add_stage("emotions", lambda _: emotion_batcher_instance.submit(processed_text))
+    graph.add_stage("indicators", lambda _: mood_detector_instance.analyze_mood_indicators(processed_text))
+    graph.add_stage(
+        "mood",
+        lambda r: remember(
+            mood_key,
+            mood_detector_instance.build_mood_analysis(r["sentiment"], r["emotions"], r["indicators"])
+        ),
+        after=["sentiment", "emotions", "indicators"]
+    )
+    return graph
+
+def raise_if_busy(result: StageGraphResult):
+    """Surface executor back-pressure from any stage as a 503 instead of a partial result."""
+    for error in result.errors.values():
+        if isinstance(error, ExecutorBusyError):
+            raise error
+
+async def run_mood_analysis(mood_detector_instance: MoodDetector, text: str) -> Dict:
+    """
+    Run comprehensive mood analysis, batching the transformer calls with concurrent requests.
+    """
+    graph = await add_mood_stages(StageGraph(), mood_detector_instance, text)
+    result = await graph.run_async()
+    raise_if_busy(result)
     
-    return summarizer, mood_detector, motivator
+    if not result.ok("mood"):
+        raise next(iter(result.errors.values()))
+    return result.get("mood")
+
+@app.exception_handler(ExecutorBusyError)
+async def executor_busy_handler(request: Request, exc: ExecutorBusyError):
+    return JSONResponse(
+        status_code=503,
+        content={"error": "Server busy", "message": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
+@app.on_event("startup")
+def start_model_warmup():
+    if MODEL_WARMUP:
+        start_background_warmup(
+            components[name] for name in ("motivator", "summarizer", "mood_detector", "abstractive_model")
+        )
+
+@app.on_event("shutdown")
+def shutdown_executor():
+    inference_executor.shutdown(wait=False)
 
 # Health check endpoint
 @app.get("/")
@@ -122,10 +345,13 @@ async def root():
         "endpoints": [
             "/docs - API documentation",
             "/analyze - Comprehensive text analysis",
+            "/analyze/batch - Comprehensive analysis of many texts at once",
             "/summarize - Text summarization only",
             "/mood - Mood detection only",
             "/motivate - Motivational content generation",
-            "/daily-motivation - Daily motivational content"
+            "/daily-motivation - Daily motivational content",
+            "/cache/stats - Result cache statistics",
+            "/ready - Per-model readiness"
         ]
     }
 
@@ -133,12 +359,25 @@ async def root():
 async def health_check():
     return {"status": "healthy", "message": "API is running successfully"}
 
+# Readiness endpoint: 200 once every model is loaded (and warmed up), 503 before
+@app.get("/ready")
+async def readiness_check():
+    if MODEL_WARMUP:
+        ready = all(component.state == "ready" for component in components.values())
+    else:
+        ready = all(component.loaded for component in components.values())
+    
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "components": {name: component.status() for name, component in components.items()}
+        }
+    )
+
 # Main comprehensive analysis endpoint
 @app.post("/analyze", response_model=ComprehensiveAnalysisResponse)
-async def analyze_text(
-    request: TextAnalysisRequest,
-    models: tuple = Depends(get_models)
-):
+async def analyze_text(request: TextAnalysisRequest):
     """
     Perform comprehensive text analysis including summarization, mood detection, and motivation.
     """
@@ -146,7 +385,7 @@ async def analyze_text(
     start_time = time.time()
     
     try:
-        summarizer_instance, mood_detector_instance, motivator_instance = models
+        summarizer_instance, mood_detector_instance, motivator_instance = await load_analysis_models([request])
         
         response = ComprehensiveAnalysisResponse(
             processing_time=0.0,
@@ -154,69 +393,71 @@ async def analyze_text(
             message="Analysis completed successfully"
         )
         
-        # Text Summarization
+        # Independent stages run concurrently; motivation starts as soon as mood is ready
+        graph = StageGraph()
+        
         if request.include_summary:
-            try:
-                summary_result = summarizer_instance.smart_summarize(
-                    request.text, 
-                    summary_type=request.summary_type
-                )
-                key_phrases = summarizer_instance.get_key_phrases(request.text)
-                
-                response.summary = SummaryResponse(
-                    summary=summary_result["summary"],
-                    method=summary_result["method"],
-                    original_length=summary_result["original_length"],
-                    summary_length=summary_result["summary_length"],
-                    compression_ratio=summary_result["compression_ratio"],
-                    key_phrases=key_phrases
+            graph.add_stage("summary", lambda _: run_cached(
+                cache_key("summary", summarizer_instance, request.text, summary_type=request.summary_type),
+                summarizer_instance.smart_summarize,
+                request.text,
+                summary_type=request.summary_type
+            ))
+            graph.add_stage("key_phrases", lambda _: run_cached(
+                cache_key("key_phrases", summarizer_instance, request.text, num_phrases=5),
+                summarizer_instance.get_key_phrases,
+                request.text
+            ))
+        
+        if request.include_mood:
+            await add_mood_stages(graph, mood_detector_instance, request.text)
+            
+            if request.include_motivation:
+                graph.add_stage(
+                    "motivation",
+                    lambda r: motivator_instance.get_motivational_content(
+                        r["mood"]["overall_mood"],
+                        r["mood"]["mood_category"]
+                    ),
+                    after=["mood"]
                 )
+        
+        result = await graph.run_async()
+        raise_if_busy(result)
+        
+        for stage, error in result.errors.items():
+            print(f"Analysis stage '{stage}' error: {error}")
+        
+        # Text Summarization
+        if result.ok("summary") and result.ok("key_phrases"):
+            try:
+                response.summary = build_summary_response(result.get("summary"), result.get("key_phrases"))
             except Exception as e:
                 print(f"Summarization error: {e}")
                 response.summary = None
         
         # Mood Detection
-        if request.include_mood:
+        if result.ok("mood"):
             try:
-                mood_result = mood_detector_instance.comprehensive_mood_analysis(request.text)
-                
-                response.mood = MoodResponse(
-                    overall_mood=mood_result["overall_mood"],
-                    mood_category=mood_result["mood_category"],
-                    confidence=mood_result["confidence"],
-                    description=mood_result["description"],
-                    suggestions=mood_result["suggestions"],
-                    sentiment=mood_result["sentiment"],
-                    emotions=mood_result["emotions"],
-                    indicators=mood_result["indicators"]
-                )
+                response.mood = build_mood_response(result.get("mood"))
             except Exception as e:
                 print(f"Mood detection error: {e}")
                 response.mood = None
         
         # Motivational Content
-        if request.include_motivation and response.mood:
+        if result.ok("motivation") and response.mood:
             try:
-                motivation_result = motivator_instance.get_motivational_content(
-                    response.mood.overall_mood,
-                    response.mood.mood_category
-                )
-                
-                response.motivation = MotivationResponse(
-                    motivational_quote=motivation_result["motivational_quote"],
-                    affirmations=motivation_result["affirmations"],
-                    coping_strategies=motivation_result["coping_strategies"],
-                    success_tip=motivation_result["success_tip"],
-                    encouragement=motivation_result["encouragement"],
-                    mood_addressed=motivation_result["mood_addressed"]
-                )
+                response.motivation = build_motivation_response(result.get("motivation"))
             except Exception as e:
                 print(f"Motivation generation error: {e}")
                 response.motivation = None
         
+        response.stage_timings = result.get_timings()
         response.processing_time = round(time.time() - start_time, 3)
         return response
         
+    except ExecutorBusyError:
+        raise
     except Exception as e:
         processing_time = round(time.time() - start_time, 3)
         raise HTTPException(
@@ -228,30 +469,199 @@ async def analyze_text(
             }
         )
 
+async def run_batch_isolated(batch_fn, single_fn, inputs: List) -> List:
+    """
+    Run a batched model call, retrying item by item if the batch fails.
+    
+    Returns one entry per input: the result, or the exception raised for that item.
+    """
+    if not inputs:
+        return []
+    
+    try:
+        return await inference_executor.run(batch_fn, inputs)
+    except ExecutorBusyError:
+        raise
+    except Exception as e:
+        print(f"Batch call failed, retrying per item: {e}")
+    
+    results = []
+    for item in inputs:
+        try:
+            results.append(await inference_executor.run(single_fn, item))
+        except ExecutorBusyError:
+            raise
+        except Exception as e:
+            results.append(e)
+    return results
+
+async def run_batch_cached(keys: List[CacheKey], batch_fn, single_fn, inputs: List) -> List:
+    """
+    Like run_batch_isolated, but serve cached items directly and batch only the misses.
+    """
+    results = await cache_get_many(keys)
+    missing = [j for j, result in enumerate(results) if result is None]
+    
+    computed = await run_batch_isolated(batch_fn, single_fn, [inputs[j] for j in missing])
+    fresh = []
+    for j, value in zip(missing, computed):
+        results[j] = value
+        if not isinstance(value, Exception):
+            fresh.append((keys[j], value))
+    
+    if fresh:
+        await asyncio.to_thread(lambda: [result_cache.set(key, value) for key, value in fresh])
+    return results
+
+# Batch analysis endpoint
+@app.post("/analyze/batch", response_model=BatchAnalysisResponse)
+async def analyze_batch(request: BatchAnalysisRequest):
+    """
+    Analyze many texts at once, sharing batched model calls across items.
+    Results are returned in request order; a failing item does not fail the batch.
+    """
+    import time
+    start_time = time.time()
+    
+    try:
+        items = request.items
+        summarizer_instance, mood_detector_instance, motivator_instance = await load_analysis_models(items)
+        
+        responses = [
+            ComprehensiveAnalysisResponse(
+                processing_time=0.0,
+                success=True,
+                message="Analysis completed successfully"
+            )
+            for _ in items
+        ]
+        errors: List[List[str]] = [[] for _ in items]
+        
+        # Text Summarization (abstractive summaries share one model call)
+        summary_positions = [i for i, item in enumerate(items) if item.include_summary]
+        if summary_positions:
+            summary_results = await run_batch_cached(
+                [cache_key("summary", summarizer_instance, items[i].text, summary_type=items[i].summary_type)
+                 for i in summary_positions],
+                lambda pairs: summarizer_instance.smart_summarize_batch(
+                    [text for text, _ in pairs], [summary_type for _, summary_type in pairs]
+                ),
+                lambda pair: summarizer_instance.smart_summarize(pair[0], summary_type=pair[1]),
+                [(items[i].text, items[i].summary_type) for i in summary_positions]
+            )
+            key_phrase_results = await run_batch_cached(
+                [cache_key("key_phrases", summarizer_instance, items[i].text, num_phrases=5) for i in summary_positions],
+                summarizer_instance.get_key_phrases_batch,
+                summarizer_instance.get_key_phrases,
+                [items[i].text for i in summary_positions]
+            )
+            for i, summary_result, key_phrases in zip(summary_positions, summary_results, key_phrase_results):
+                try:
+                    for result in (summary_result, key_phrases):
+                        if isinstance(result, Exception):
+                            raise result
+                    responses[i].summary = build_summary_response(summary_result, key_phrases)
+                except Exception as e:
+                    print(f"Summarization error (item {i}): {e}")
+                    errors[i].append(f"summarization failed: {e}")
+        
+        # Mood Detection (sentiment and emotion models run once for the whole batch)
+        mood_positions = [i for i, item in enumerate(items) if item.include_mood]
+        if mood_positions:
+            mood_results = await run_batch_cached(
+                [cache_key("mood", mood_detector_instance, items[i].text) for i in mood_positions],
+                mood_detector_instance.comprehensive_mood_analysis_batch,
+                mood_detector_instance.comprehensive_mood_analysis,
+                [items[i].text for i in mood_positions]
+            )
+            for i, mood_result in zip(mood_positions, mood_results):
+                try:
+                    if isinstance(mood_result, Exception):
+                        raise mood_result
+                    responses[i].mood = build_mood_response(mood_result)
+                except Exception as e:
+                    print(f"Mood detection error (item {i}): {e}")
+                    errors[i].append(f"mood detection failed: {e}")
+        
+        # Motivational Content
+        for i, item in enumerate(items):
+            if item.include_motivation and responses[i].mood:
+                try:
+                    motivation_result = motivator_instance.get_motivational_content(
+                        responses[i].mood.overall_mood,
+                        responses[i].mood.mood_category
+                    )
+                    responses[i].motivation = build_motivation_response(motivation_result)
+                except Exception as e:
+                    print(f"Motivation generation error (item {i}): {e}")
+                    errors[i].append(f"motivation generation failed: {e}")
+        
+        processing_time = round(time.time() - start_time, 3)
+        for response, item_errors in zip(responses, errors):
+            response.processing_time = processing_time
+            if item_errors:
+                response.success = False
+                response.message = "; ".join(item_errors)
+        
+        failed = sum(1 for item_errors in errors if item_errors)
+        return BatchAnalysisResponse(
+            results=responses,
+            processing_time=processing_time,
+            success=failed == 0,
+            message=f"Analyzed {len(items) - failed}/{len(items)} items successfully"
+        )
+        
+    except ExecutorBusyError:
+        raise
+    except Exception as e:
+        processing_time = round(time.time() - start_time, 3)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "Internal server error during batch analysis",
+                "message": str(e),
+                "processing_time": processing_time
+            }
+        )
+
 # Individual endpoint for text summarization
 @app.post("/summarize", response_model=SummaryResponse)
 async def summarize_text(
-    request: SummaryRequest,
-    models: tuple = Depends(get_models)
+    request: SummaryRequest
 ):
     """
     Generate a summary of the provided text.
     """
     try:
-        summarizer_instance, _, _ = models
+        # Extractive summaries do not need to wait for the abstractive model
+        if TextSummarizer.may_use_abstractive(request.text, request.summary_type):
+            summarizer_instance = await load_component("abstractive_model")
+        else:
+            summarizer_instance = await load_component("summarizer")
         
-        if request.summary_type == "extractive":
-            summary = summarizer_instance.extractive_summarize(request.text, request.num_sentences)
+        if request.summary_type in ("extractive", "graph"):
+            summarize = (summarizer_instance.graph_summarize if request.summary_type == "graph"
+                         else summarizer_instance.extractive_summarize)
+            summary = await run_cached(
+                cache_key(f"{request.summary_type}_summary", summarizer_instance, request.text, num_sentences=request.num_sentences),
+                summarize,
+                request.text,
+                request.num_sentences
+            )
             result = {
                 "summary": summary,
-                "method": "extractive",
+                "method": request.summary_type,
                 "original_length": len(request.text.split()),
                 "summary_length": len(summary.split()),
                 "compression_ratio": 0
             }
             result["compression_ratio"] = round((1 - result["summary_length"] / result["original_length"]) * 100, 2) if result["original_length"] > 0 else 0
         elif request.summary_type == "abstractive":
-            summary = summarizer_instance.abstractive_summarize(request.text)
+            summary = await run_cached(
+                cache_key("abstractive_summary", summarizer_instance, request.text, summary_type="abstractive"),
+                summarizer_instance.abstractive_summarize,
+                request.text
+            )
             result = {
                 "summary": summary,
                 "method": "abstractive",
@@ -261,19 +671,23 @@ async def summarize_text(
             }
             result["compression_ratio"] = round((1 - result["summary_length"] / result["original_length"]) * 100, 2) if result["original_length"] > 0 else 0
         else:
-            result = summarizer_instance.smart_summarize(request.text, request.summary_type)
-        
-        key_phrases = summarizer_instance.get_key_phrases(request.text)
+            result = await run_cached(
+                cache_key("summary", summarizer_instance, request.text, summary_type=request.summary_type),
+                summarizer_instance.smart_summarize,
+                request.text,
+                request.summary_type
+            )
         
-        return SummaryResponse(
-            summary=result["summary"],
-            method=result["method"],
-            original_length=result["original_length"],
-            summary_length=result["summary_length"],
-            compression_ratio=result["compression_ratio"],
-            key_phrases=key_phrases
+        key_phrases = await run_cached(
+            cache_key("key_phrases", summarizer_instance, request.text, num_phrases=5),
+            summarizer_instance.get_key_phrases,
+            request.text
         )
         
+        return build_summary_response(result, key_phrases)
+        
+    except ExecutorBusyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -284,27 +698,18 @@ async def summarize_text(
 @app.post("/mood", response_model=MoodResponse)
 async def detect_mood(
     request: MoodRequest,
-    models: tuple = Depends(get_models)
+    mood_detector_instance: MoodDetector = Depends(get_mood_detector)
 ):
     """
     Analyze the mood and emotional state of the provided text.
     """
     try:
-        _, mood_detector_instance, _ = models
-        
-        result = mood_detector_instance.comprehensive_mood_analysis(request.text)
+        result = await run_mood_analysis(mood_detector_instance, request.text)
         
-        return MoodResponse(
-            overall_mood=result["overall_mood"],
-            mood_category=result["mood_category"],
-            confidence=result["confidence"],
-            description=result["description"],
-            suggestions=result["suggestions"],
-            sentiment=result["sentiment"],
-            emotions=result["emotions"],
-            indicators=result["indicators"]
-        )
+        return build_mood_response(result)
         
+    except ExecutorBusyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -315,27 +720,18 @@ async def detect_mood(
 @app.post("/motivate", response_model=MotivationResponse)
 async def generate_motivation(
     request: MotivationRequest,
-    models: tuple = Depends(get_models)
+    motivator_instance: Motivator = Depends(get_motivator)
 ):
     """
     Generate motivational content based on detected mood.
     """
     try:
-        _, _, motivator_instance = models
-        
         result = motivator_instance.get_motivational_content(
             request.mood,
             request.mood_category
         )
         
-        return MotivationResponse(
-            motivational_quote=result["motivational_quote"],
-            affirmations=result["affirmations"],
-            coping_strategies=result["coping_strategies"],
-            success_tip=result["success_tip"],
-            encouragement=result["encouragement"],
-            mood_addressed=result["mood_addressed"]
-        )
+        return build_motivation_response(result)
         
     except Exception as e:
         raise HTTPException(
@@ -345,13 +741,11 @@ async def generate_motivation(
 
 # Daily motivation endpoint
 @app.get("/daily-motivation")
-async def get_daily_motivation(models: tuple = Depends(get_models)):
+async def get_daily_motivation(motivator_instance: Motivator = Depends(get_motivator)):
     """
     Get daily motivational content (quotes, affirmations, tips).
     """
     try:
-        _, _, motivator_instance = models
-        
         result = motivator_instance.get_daily_motivation()
         
         return {
@@ -369,13 +763,11 @@ async def get_daily_motivation(models: tuple = Depends(get_models)):
 
 # Emergency support endpoint
 @app.get("/emergency-support")
-async def get_emergency_support(models: tuple = Depends(get_models)):
+async def get_emergency_support(motivator_instance: Motivator = Depends(get_motivator)):
     """
     Get crisis support resources and emergency help information.
     """
     try:
-        _, _, motivator_instance = models
-        
         result = motivator_instance.get_emergency_support()
         
         return result
@@ -386,6 +778,14 @@ async def get_emergency_support(models: tuple = Depends(get_models)):
             detail=f"Error getting emergency support info: {str(e)}"
         )
 
+# Result cache statistics endpoint
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """
+    Get hit/miss counters and occupancy of the analysis result cache.
+    """
+    return await asyncio.to_thread(result_cache.get_stats)
+
 # Model information endpoint
 @app.get("/models/info")
 async def get_model_info():
@@ -397,12 +797,20 @@ async def get_model_info():
             "summarizer": {
                 "description": "Text summarization using extractive and abstractive methods",
                 "capabilities": ["extractive", "abstractive", "auto", "key_phrases"],
-                "max_input_length": "10,000 characters"
+                "max_input_length": "10,000 characters",
+                "quantize_requested": MODEL_SETTINGS["quantize_summarizer"],
+                "precision": components["abstractive_model"].peek().precision if components["abstractive_model"].loaded else None,
+                "corpus_idf_documents": (
+                    components["summarizer"].peek().idf_table.num_documents
+                    if components["summarizer"].loaded and components["summarizer"].peek().idf_table else None
+                )
             },
             "mood_detector": {
                 "description": "Comprehensive mood and sentiment analysis",
                 "capabilities": ["sentiment", "emotions", "mood_indicators", "suggestions"],
-                "supported_moods": ["very_positive", "positive", "neutral", "negative", "very_negative", "angry", "stressed", "excited", "surprised"]
+                "supported_moods": ["very_positive", "positive", "neutral", "negative", "very_negative", "angry", "stressed", "excited", "surprised"],
+                "requested_backend": MODEL_SETTINGS["inference_backend"],
+                "backends": components["mood_detector"].peek().backends if components["mood_detector"].loaded else None
             },
             "motivator": {
                 "description": "Personalized motivational content generation",
@@ -410,8 +818,18 @@ async def get_model_info():
                 "content_types": ["quotes", "affirmations", "strategies", "tips", "encouragement"]
             }
         },
+        "inference_executor": inference_executor.get_stats(),
+        "result_cache": await asyncio.to_thread(result_cache.get_stats),
+        "process_memory": {"pid": os.getpid(), **process_memory()},
+        "startup_seconds": {name: component.load_seconds for name, component in components.items()},
+        "batching": {
+            "max_batch_size": MOOD_BATCH_MAX_SIZE,
+            "max_wait_ms": MOOD_BATCH_MAX_WAIT_MS,
+            "batchers": [b.get_stats() for b in (sentiment_batcher, emotion_batcher) if b is not None]
+        },
         "api_features": [
             "Comprehensive text analysis",
+            "Batch analysis with shared model calls",
             "Individual component analysis",
             "Real-time processing",
             "Mood-based motivation",
@@ -424,12 +842,7 @@ if __name__ == "__main__":
     import uvicorn
     
     print("Starting NLP Text Analysis & Motivation API...")
-    print("Loading models... This may take a few moments.")
-    
-    # Initialize models on startup
-    get_models()
-    
-    print("Models loaded successfully!")
+    print("Models load in the background; check /ready for their status.")
     print("API will be available at: http://localhost:8000")
     print("Documentation available at: http://localhost:8000/docs")
     
@@ -0,0 +1,191 @@
+"""
+Pre-fork launcher for the NLP Text Analysis & Motivation API
+Loads all models once in the parent process and forks uvicorn workers that share
+the model weights copy-on-write, instead of every worker loading its own copy.
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
+sys.path.append(os.path.dirname(__file__))
+
+import main
+from process_memory import process_memory
+
+
+def _torch_modules(component):
+    """Torch modules held by a model wrapper (pipelines, fused engine heads)."""
+    import torch
+
+    for value in vars(component).values():
+        engine = getattr(value, "engine", None)
+        for candidate in (value, getattr(value, "model", None),
+                          getattr(engine, "model", None), getattr(engine, "sentiment_head", None)):
+            if isinstance(candidate, torch.nn.Module):
+                yield candidate
+
+
+def prepare_models_for_fork():
+    """
+    Load every model and freeze it so forked workers never write to weight pages.
+
+    The parent only loads: no warm-up or other inference runs here. Torch
+    is limited to one thread first, so its OpenMP/intra-op thread pool is
+    never started before the fork (a pool inherited by a forked child can
+    deadlock it); each worker picks its own thread count.
+    """
+    try:
+        import torch
+        torch.set_num_threads(1)
+    except ImportError:
+        pass
+
+    for component in main.components.values():
+        component.get()
+
+    try:
+        import torch
+        torch.set_grad_enabled(False)
+        for component in (main.components["abstractive_model"].peek(), main.components["mood_detector"].peek()):
+            for module in _torch_modules(component):
+                module.eval()
+                module.requires_grad_(False)
+    except ImportError:
+        pass
+
+    # Move everything allocated so far out of the garbage collector's reach;
+    # otherwise the first collection in each worker touches (and copies) every
+    # page holding a tracked object
+    gc.collect()
+    gc.freeze()
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _worker_threads(workers: int) -> int:
+    """Torch threads per worker: TORCH_NUM_THREADS, else the CPUs split between the workers."""
+    return int(os.getenv("TORCH_NUM_THREADS", "0")) or max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def _run_worker(sock: socket.socket, log_level: str, threads: int):
+    import uvicorn
+
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+    # The parent loaded every model already; warming up again in each worker
+    # would write to the shared pages and undo the copy-on-write sharing
+    main.MODEL_WARMUP = False
+
+    config = uvicorn.Config(main.app, log_level=log_level)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _spawn_worker(sock: socket.socket, log_level: str, threads: int) -> int:
+    pid = os.fork()
+    if pid == 0:
+        # Restore default signal handling; uvicorn installs its own
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        exit_code = 0
+        try:
+            _run_worker(sock, log_level, threads)
+        except Exception as e:
+            print(f"Worker {os.getpid()} failed: {e}")
+            exit_code = 1
+        os._exit(exit_code)
+    return pid
+
+
+def report_memory(workers: Dict[int, int]):
+    """Print shared and private memory for the parent and every worker."""
+    rows = [("parent", os.getpid())] + [(f"worker {i}", pid) for pid, i in sorted(workers.items(), key=lambda x: x[1])]
+    print(f"{'process':<12}{'pid':>8}{'rss MB':>10}{'shared MB':>12}{'private MB':>12}{'pss MB':>10}")
+    total_pss = 0.0
+    for label, pid in rows:
+        stats = process_memory(pid)
+        if not stats:
+            print(f"{label:<12}{pid:>8}  (memory stats unavailable)")
+            continue
+        total_pss += stats["pss_mb"]
+        print(f"{label:<12}{pid:>8}{stats['rss_mb']:>10}{stats['shared_mb']:>12}{stats['private_mb']:>12}{stats['pss_mb']:>10}")
+    print(f"Combined footprint (sum of PSS): {round(total_pss, 1)} MB")
+
+
+def main_loop():
+    """Parse arguments, load models, fork workers and supervise them."""
+    parser = argparse.ArgumentParser(description="Run the API with models shared across pre-forked workers")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "2")))
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--report-interval", type=float, default=float(os.getenv("PREFORK_REPORT_INTERVAL", "0")),
+                        help="Seconds between memory reports (0 reports once after startup)")
+    args = parser.parse_args()
+
+    print("Loading models in the parent process...")
+    start_time = time.perf_counter()
+    prepare_models_for_fork()
+    print(f"Models loaded in {time.perf_counter() - start_time:.1f}s; forking {args.workers} workers")
+
+    sock = _bind_socket(args.host, args.port)
+    threads = _worker_threads(args.workers)
+    workers = {_spawn_worker(sock, args.log_level, threads): i for i in range(args.workers)}
+    print(f"API available at: http://{args.host}:{args.port}")
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    next_report = time.monotonic() + 10
+    while workers:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+
+        if pid:
+            index = workers.pop(pid)
+            if not stopping:
+                # The models are still loaded here, so a replacement worker starts instantly
+                print(f"Worker {index} (pid {pid}) exited with status {status}; restarting")
+                workers[_spawn_worker(sock, args.log_level, threads)] = index
+            continue
+
+        if next_report is not None and time.monotonic() >= next_report and not stopping:
+            report_memory(workers)
+            next_report = time.monotonic() + args.report_interval if args.report_interval > 0 else None
+
+        time.sleep(0.5)
+
+    sock.close()
+
+
+if __name__ == "__main__":
+    main_loop()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Journal Backfill
+Summarizes and mood-scores existing rows of the backend's journal_entries table offline,
+writing the results straight back to the SQLite database.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_JOURNAL_DB = os.path.join(BASE_DIR, '..', 'backend', 'database', 'antaraal.sqlite')
+
+# Mood results live in their own table: journal_entries.feeling is the user's own choice
+MOOD_TABLE = "journal_entry_moods"
+STATE_TABLE = "nlp_backfill_state"
+# Entries whose summary or mood failed; the checkpoint moves past them, so they are retried from here
+FAILURE_TABLE = "nlp_backfill_failures"
+JOB_NAME = "journal_entries"
+
+MISSING_SUMMARY = "(e.summary IS NULL OR TRIM(e.summary) = '')"
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """Open the database with a generous busy timeout so live writers are waited for, not failed."""
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Journal database not found: {db_path}")
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def ensure_tables(conn: sqlite3.Connection):
+    """Create the mood results, checkpoint and failure tables if they do not exist yet."""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MOOD_TABLE} (
+            entry_id INTEGER PRIMARY KEY REFERENCES journal_entries(id) ON DELETE CASCADE,
+            overall_mood TEXT NOT NULL,
+            mood_category TEXT NOT NULL,
+            confidence REAL NOT NULL,
+            analysis TEXT NOT NULL,
+            model_version TEXT NOT NULL,
+            analyzed_at DATETIME NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            job TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL,
+            updated_at DATETIME NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {FAILURE_TABLE} (
+            job TEXT NOT NULL,
+            entry_id INTEGER NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 1,
+            failed_at DATETIME NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (job, entry_id)
+        )
+    """)
+
+
+def load_checkpoint(conn: sqlite3.Connection) -> int:
+    row = conn.execute(f"SELECT last_id FROM {STATE_TABLE} WHERE job = ?", (JOB_NAME,)).fetchone()
+    return row["last_id"] if row else 0
+
+
+def _pending_columns(summaries: bool, moods: bool) -> Tuple[str, str]:
+    """SQL expressions for whether row ``e`` still needs a summary and a mood result."""
+    needs_summary = MISSING_SUMMARY if summaries else "0"
+    needs_mood = (
+        f"NOT EXISTS (SELECT 1 FROM {MOOD_TABLE} m WHERE m.entry_id = e.id AND m.model_version = :version)"
+        if moods else "0"
+    )
+    return needs_summary, needs_mood
+
+
+def fetch_chunk(conn: sqlite3.Connection, after_id: int, limit: int,
+                summaries: bool, moods: bool, mood_version: str) -> List[sqlite3.Row]:
+    """
+    Next rows after ``after_id`` (keyset pagination) that still need a summary or a mood result.
+
+    Each row carries ``needs_summary`` / ``needs_mood`` flags so only the missing work is done.
+    """
+    needs_summary, needs_mood = _pending_columns(summaries, moods)
+    return conn.execute(
+        f"""
+        SELECT e.id, e.content, {needs_summary} AS needs_summary, {needs_mood} AS needs_mood
+        FROM journal_entries e
+        WHERE e.id > :after_id AND ({needs_summary} OR {needs_mood})
+        ORDER BY e.id
+        LIMIT :limit
+        """,
+        {"after_id": after_id, "limit": limit, "version": mood_version}
+    ).fetchall()
+
+
+def fetch_failed(conn: sqlite3.Connection, summaries: bool, moods: bool, mood_version: str) -> List[sqlite3.Row]:
+    """
+    Rows that failed in earlier runs and still need work, shaped like fetch_chunk's.
+
+    Recorded failures that need nothing any more (the entry was deleted, or
+    the user wrote a summary in the meantime) are cleared.
+    """
+    needs_summary, needs_mood = _pending_columns(summaries, moods)
+    params = {"job": JOB_NAME, "version": mood_version}
+    conn.execute(
+        f"""
+        DELETE FROM {FAILURE_TABLE}
+        WHERE job = :job AND entry_id NOT IN (
+            SELECT e.id FROM journal_entries e WHERE {needs_summary} OR {needs_mood}
+        )
+        """,
+        params
+    )
+    return conn.execute(
+        f"""
+        SELECT e.id, e.content, {needs_summary} AS needs_summary, {needs_mood} AS needs_mood
+        FROM journal_entries e
+        JOIN {FAILURE_TABLE} f ON f.entry_id = e.id AND f.job = :job
+        ORDER BY e.id
+        """,
+        params
+    ).fetchall()
+
+
+def run_batched(batch_fn, single_fn, texts: List[str], batch_size: int) -> List:
+    """
+    Run a batched model call over ``texts`` in slices of ``batch_size``,
+    retrying a failed slice item by item. Failed items come back as None.
+    """
+    results = []
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        try:
+            results.extend(batch_fn(batch))
+            continue
+        except Exception as e:
+            print(f"Batch call failed, retrying per item: {e}")
+        for text in batch:
+            try:
+                results.append(single_fn(text))
+            except Exception as e:
+                print(f"Item failed: {e}")
+                results.append(None)
+    return results
+
+
+def write_chunk(conn: sqlite3.Connection, summaries: Dict[int, str], moods: Dict[int, Dict],
+                mood_version: str, last_id: Optional[int], processed_ids: Iterable[int] = (),
+                failed_ids: Iterable[int] = ()):
+    """
+    Write one chunk's results, record its failures and advance the checkpoint
+    in a single short transaction.
+
+    Summaries only fill rows that are still empty, so an entry edited while
+    the backfill was running keeps the user's summary.
+
+    Args:
+        last_id (int): Id the chunk ended at; None leaves the checkpoint alone (retried failures)
+        processed_ids (Iterable[int]): Entries of the chunk; earlier failures of those that succeeded are cleared
+        failed_ids (Iterable[int]): Entries whose summary or mood failed, to retry on the next run
+    """
+    failed_ids = set(failed_ids)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            f"UPDATE journal_entries AS e SET summary = ? WHERE e.id = ? AND {MISSING_SUMMARY}",
+            [(summary, entry_id) for entry_id, summary in summaries.items()]
+        )
+        conn.executemany(
+            f"""
+            INSERT OR REPLACE INTO {MOOD_TABLE}
+                (entry_id, overall_mood, mood_category, confidence, analysis, model_version)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (entry_id, mood["overall_mood"], mood["mood_category"], mood["confidence"],
+                 json.dumps(mood, ensure_ascii=False), mood_version)
+                for entry_id, mood in moods.items()
+            ]
+        )
+        conn.executemany(
+            f"DELETE FROM {FAILURE_TABLE} WHERE job = ? AND entry_id = ?",
+            [(JOB_NAME, entry_id) for entry_id in processed_ids if entry_id not in failed_ids]
+        )
+        conn.executemany(
+            f"""
+            INSERT INTO {FAILURE_TABLE} (job, entry_id) VALUES (?, ?)
+            ON CONFLICT(job, entry_id) DO UPDATE SET attempts = attempts + 1, failed_at = datetime('now')
+            """,
+            [(JOB_NAME, entry_id) for entry_id in sorted(failed_ids)]
+        )
+        if last_id is not None:
+            conn.execute(
+                f"""
+                INSERT INTO {STATE_TABLE} (job, last_id) VALUES (?, ?)
+                ON CONFLICT(job) DO UPDATE SET last_id = excluded.last_id, updated_at = datetime('now')
+                """,
+                (JOB_NAME, last_id)
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def backfill(db_path: str, chunk_size: int = 200, batch_size: int = 16, summaries: bool = True,
+             moods: bool = True, rows_per_second: float = 0, restart: bool = False,
+             max_rows: Optional[int] = None) -> Dict:
+    """
+    Fill missing summaries and mood results for the journal entries.
+
+    Rows are read in id order, ``chunk_size`` at a time, and every chunk's
+    results are committed together with the id it ended at. An interrupted
+    run therefore continues after the last committed chunk. Entries that
+    failed are recorded in the same transaction and retried first on the
+    next run, since the checkpoint has already moved past them.
+
+    Args:
+        db_path (str): Backend SQLite database
+        chunk_size (int): Rows read and written per transaction
+        batch_size (int): Texts per model call
+        summaries (bool): Fill empty summaries
+        moods (bool): Store mood results for rows without one from the current models
+        rows_per_second (float): Upper bound on throughput to leave room for live traffic; 0 for no limit
+        restart (bool): Ignore the checkpoint and scan from the first row
+        max_rows (int): Stop after this many rows (optional)
+
+    Returns:
+        Dict: Counters for the run
+    """
+    from summarizer import TextSummarizer
+    from mood_detector import MoodDetector
+
+    conn = connect(db_path)
+    ensure_tables(conn)
+    last_id = 0 if restart else load_checkpoint(conn)
+    if last_id:
+        print(f"↩️  Resuming after entry {last_id}")
+
+    corpus_idf = os.getenv("SUMMARIZER_CORPUS_IDF", "0").lower() in ("1", "true", "yes")
+    summarizer = TextSummarizer(corpus_idf=corpus_idf) if summaries else None
+    mood_detector = MoodDetector() if moods else None
+    mood_version = mood_detector.get_model_version() if mood_detector else ""
+
+    stats = {"rows": 0, "summaries": 0, "moods": 0, "failed": 0, "retried": 0}
+    start_time = time.perf_counter()
+
+    def process(rows: List[sqlite3.Row], checkpoint: Optional[int]):
+        """Analyze one chunk and commit its results (and the checkpoint, if given)."""
+        summary_rows = [row for row in rows if row["needs_summary"]]
+        summary_results = run_batched(
+            summarizer.smart_summarize_batch, summarizer.smart_summarize,
+            [row["content"] for row in summary_rows], batch_size
+        ) if summary_rows else []
+        new_summaries = {
+            row["id"]: result["summary"]
+            for row, result in zip(summary_rows, summary_results) if result is not None
+        }
+
+        mood_rows = [row for row in rows if row["needs_mood"]]
+        mood_results = run_batched(
+            mood_detector.comprehensive_mood_analysis_batch, mood_detector.comprehensive_mood_analysis,
+            [row["content"] for row in mood_rows], batch_size
+        ) if mood_rows else []
+        new_moods = {row["id"]: result for row, result in zip(mood_rows, mood_results) if result is not None}
+
+        failed_ids = [row["id"] for row in summary_rows if row["id"] not in new_summaries]
+        failed_ids += [row["id"] for row in mood_rows if row["id"] not in new_moods]
+        write_chunk(conn, new_summaries, new_moods, mood_version, checkpoint,
+                    [row["id"] for row in rows], failed_ids)
+
+        stats["rows"] += len(rows)
+        stats["summaries"] += len(new_summaries)
+        stats["moods"] += len(new_moods)
+        stats["failed"] += (len(summary_rows) - len(new_summaries)) + (len(mood_rows) - len(new_moods))
+
+    # Entries that failed in earlier runs first: the checkpoint is already past them
+    failed_rows = [] if restart else fetch_failed(conn, summaries, moods, mood_version)
+    if failed_rows:
+        print(f"🔁 Retrying {len(failed_rows)} entries that failed before")
+    for start in range(0, len(failed_rows), chunk_size):
+        process(failed_rows[start:start + chunk_size], None)
+        stats["retried"] += len(failed_rows[start:start + chunk_size])
+
+    while max_rows is None or stats["rows"] < max_rows:
+        limit = chunk_size if max_rows is None else min(chunk_size, max_rows - stats["rows"])
+        rows = fetch_chunk(conn, last_id, limit, summaries, moods, mood_version)
+        if not rows:
+            break
+        chunk_start = time.perf_counter()
+
+        last_id = rows[-1]["id"]
+        process(rows, last_id)
+
+        elapsed = time.perf_counter() - start_time
+        print(f"   Up to entry {last_id}: {stats['rows']} rows, "
+              f"{stats['rows'] / elapsed if elapsed > 0 else 0:.1f} rows/s")
+
+        # Throttle: never finish a chunk faster than the allowed rate
+        if rows_per_second > 0:
+            remaining = len(rows) / rows_per_second - (time.perf_counter() - chunk_start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    conn.close()
+    stats["seconds"] = round(time.perf_counter() - start_time, 2)
+    return stats
+
+
+def main():
+    """Run the backfill from the command line."""
+    parser = argparse.ArgumentParser(description="Backfill summaries and mood results for journal entries")
+    parser.add_argument("--db", default=os.getenv("JOURNAL_DB", DEFAULT_JOURNAL_DB), help="Backend SQLite database")
+    parser.add_argument("--chunk-size", type=int, default=200, help="Rows read and committed per transaction")
+    parser.add_argument("--batch-size", type=int, default=16, help="Texts per model call")
+    parser.add_argument("--rows-per-second", type=float, default=0, help="Throughput limit, to run next to live traffic (0: unlimited)")
+    parser.add_argument("--max-rows", type=int, help="Stop after this many rows")
+    parser.add_argument("--no-summary", action="store_true", help="Do not fill summaries")
+    parser.add_argument("--no-mood", action="store_true", help="Do not store mood results")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and scan every row again")
+    args = parser.parse_args()
+
+    if args.no_summary and args.no_mood:
+        print("❌ Nothing to do: both --no-summary and --no-mood given")
+        sys.exit(1)
+
+    print(f"📚 Backfilling {args.db}")
+    stats = backfill(
+        args.db,
+        chunk_size=max(1, args.chunk_size),
+        batch_size=max(1, args.batch_size),
+        summaries=not args.no_summary,
+        moods=not args.no_mood,
+        rows_per_second=args.rows_per_second,
+        restart=args.restart,
+        max_rows=args.max_rows
+    )
+    print(f"✅ {stats['rows']} rows in {stats['seconds']}s: {stats['summaries']} summaries, "
+          f"{stats['moods']} mood results, {stats['failed']} failed ({stats['retried']} earlier failures retried)")
+
+
+if __name__ == "__main__":
+    main()
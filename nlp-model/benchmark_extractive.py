@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Extractive Summary Benchmark
+Compares the TF-IDF sum ranking with the graph (LexRank + MMR) ranking on entries of
+10 to 500 sentences: latency, summary length and redundancy of the picked sentences.
+"""
+
+import os
+import sys
+import json
+import argparse
+import random
+import statistics
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
+
+from benchmark_quantization import SAMPLE_TEXTS
+
+SENTENCE_COUNTS = [10, 25, 50, 100, 250, 500]
+
+
+def build_entry(sentences: List[str], count: int, seed: int) -> str:
+    """A synthetic entry of ``count`` sentences drawn from the sample texts."""
+    rng = random.Random(seed)
+    return " ".join(rng.choice(sentences) for _ in range(count))
+
+
+def measure(summarizer, text: str, method: str, num_sentences: int, repeats: int) -> Dict:
+    """Median latency of one ranking method, from sentence splitting to picked sentences."""
+    from summarizer import DocumentAnalysis
+    from sentence_graph import sentence_similarity
+
+    timings = []
+    for _ in range(repeats):
+        # A fresh context per run so nothing is reused between runs
+        document = DocumentAnalysis(summarizer, text)
+        start_time = time.perf_counter()
+        # Bypass the layer's memo of recent splits so every run includes sentence splitting
+        document.set_parsed(summarizer.linguistics.parse(text))
+        if method == "graph":
+            picked = document.graph_sentences(num_sentences)
+        else:
+            picked = document.top_sentences(num_sentences)
+        timings.append(time.perf_counter() - start_time)
+
+    # Highest similarity between any two picked sentences (1.0 means a repeated sentence)
+    indices = [document.sentences.index(sentence) for sentence in picked]
+    similarity = sentence_similarity(document.tfidf()[0], threshold=0).toarray()
+    redundancy = max((similarity[a, b] for a in indices for b in indices if a < b), default=0.0)
+    if len(set(picked)) < len(picked):
+        redundancy = 1.0
+
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "summary_words": sum(len(sentence.split()) for sentence in picked),
+        "max_pair_similarity": round(float(redundancy), 3)
+    }
+
+
+def main():
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description="Compare TF-IDF and graph-based extractive summaries")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per entry and method")
+    parser.add_argument("--num-sentences", type=int, default=3, help="Sentences per summary")
+    parser.add_argument("--save", help="Save the report to a JSON file")
+    args = parser.parse_args()
+
+    from summarizer import TextSummarizer
+
+    summarizer = TextSummarizer(load_abstractive=False)
+    sentences = [sentence for split in summarizer.linguistics.sentences_batch(SAMPLE_TEXTS) for sentence in split]
+
+    report = {}
+    print(f"{'sentences':>10} | {'tfidf ms':>9} {'words':>6} {'redund.':>8} | {'graph ms':>9} {'words':>6} {'redund.':>8}")
+    for count in SENTENCE_COUNTS:
+        text = build_entry(sentences, count, seed=count)
+        tfidf = measure(summarizer, text, "tfidf", args.num_sentences, args.repeats)
+        graph = measure(summarizer, text, "graph", args.num_sentences, args.repeats)
+        report[count] = {"tfidf": tfidf, "graph": graph}
+        print(f"{count:>10} | {tfidf['median_ms']:>9.2f} {tfidf['summary_words']:>6} {tfidf['max_pair_similarity']:>8.3f} | "
+              f"{graph['median_ms']:>9.2f} {graph['summary_words']:>6} {graph['max_pair_similarity']:>8.3f}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Linguistic Layer Benchmark
+Throughput of the shared spaCy layer (nlp.pipe in batches, unused components disabled)
+against the per-text NLTK sent_tokenize / word_tokenize calls it replaces, on large batches.
+"""
+
+import os
+import sys
+import json
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
+
+from benchmark_quantization import SAMPLE_TEXTS
+
+
+def build_texts(count: int, seed: int = 0) -> List[str]:
+    """``count`` synthetic entries of one to four sample texts each."""
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(SAMPLE_TEXTS, rng.randint(1, 4))) for _ in range(count)]
+
+
+def measure(run: Callable[[List[str]], object], texts: List[str], repeats: int) -> Dict:
+    """Best-of-``repeats`` wall time of one method over the whole batch."""
+    timings = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        run(texts)
+        timings.append(time.perf_counter() - start_time)
+    best = min(timings)
+    return {
+        "seconds": round(best, 3),
+        "texts_per_second": round(len(texts) / best, 1) if best > 0 else None
+    }
+
+
+def main():
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description="Compare the spaCy linguistic layer with per-text NLTK calls")
+    parser.add_argument("--texts", type=int, nargs="+", default=[1000, 5000], help="Batch sizes (number of texts) to measure")
+    parser.add_argument("--batch-size", type=int, default=64, help="Texts per nlp.pipe batch")
+    parser.add_argument("--n-process", type=int, default=1, help="Worker processes for nlp.pipe")
+    parser.add_argument("--model", default=os.getenv("SPACY_MODEL", "en_core_web_sm"), help="spaCy pipeline")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per method")
+    parser.add_argument("--save", help="Save the report to a JSON file")
+    args = parser.parse_args()
+
+    from nltk.tokenize import sent_tokenize, word_tokenize
+    from linguistics import ALL_FEATURES, LEMMAS, SENTENCES, LinguisticLayer
+
+    layer = LinguisticLayer(args.model, batch_size=args.batch_size, n_process=args.n_process)
+    print(f"🧪 spaCy backend: {layer.get_version()}")
+
+    methods = {
+        "nltk sentences": lambda texts: [sent_tokenize(text) for text in texts],
+        "nltk sentences+words": lambda texts: [
+            [word_tokenize(sentence) for sentence in sent_tokenize(text)] for text in texts
+        ],
+        "spacy sentences": lambda texts: layer.parse_batch(texts, (SENTENCES,)),
+        "spacy sentences+lemmas": lambda texts: layer.parse_batch(texts, (SENTENCES, LEMMAS)),
+    }
+    if all(layer.supports(feature) for feature in ALL_FEATURES):
+        methods["spacy all features"] = lambda texts: layer.parse_batch(texts, ALL_FEATURES)
+
+    # Load the pipeline and warm up every method before timing
+    for name, run in list(methods.items()):
+        try:
+            run(SAMPLE_TEXTS)
+        except Exception as e:
+            print(f"⚠️  Skipping {name}: {' '.join(str(e).replace('*', '').split())[:120]}")
+            del methods[name]
+
+    report = {}
+    for count in args.texts:
+        texts = build_texts(count, seed=count)
+        print(f"\n📚 {count} texts")
+        report[count] = {}
+        for name, run in methods.items():
+            result = measure(run, texts, args.repeats)
+            report[count][name] = result
+            print(f"   {name:<24} {result['seconds']:>8.3f}s  {result['texts_per_second']:>10} texts/s")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
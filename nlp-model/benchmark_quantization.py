@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Quantization Benchmark
+Compares the int8 quantized summarizer against the fp32 model on a fixed sample set:
+load time, per-summary latency, peak RSS and ROUGE drift of the int8 summaries.
+"""
+
+import os
+import sys
+import json
+import argparse
+import resource
+import statistics
+import subprocess
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
+
+SAMPLE_TEXTS = [
+    "I had a really challenging day at work today. The presentation I've been preparing for weeks didn't go as well as I hoped, "
+    "and I received some tough feedback from my manager. I'm feeling a bit discouraged and wondering if I'm on the right track "
+    "with my career. However, I know that setbacks are part of growth, and I'm determined to learn from this experience and come back stronger.",
+    "Today was absolutely amazing! I got promoted at work after months of hard work, and my colleagues threw a surprise celebration "
+    "for me. I felt so appreciated and valued. The promotion comes with new responsibilities that I'm excited to take on. I can't wait "
+    "to see what new challenges and opportunities this brings. I'm feeling incredibly grateful for all the support from my team and family.",
+    "I'm feeling completely overwhelmed right now. There's so much work piling up on my desk, and the deadlines keep getting tighter. "
+    "I barely have time to eat lunch, let alone take a proper break. My boss keeps adding more tasks to my list, and I'm starting to "
+    "feel like I can't keep up. I'm stressed about disappointing everyone and worried that I might not be able to handle all these responsibilities.",
+    "Had a pretty ordinary day today. Woke up around 7 AM, had breakfast, and went to work. The commute was the usual 30 minutes. "
+    "At work, I attended a couple of meetings and worked on some reports. Lunch was decent - had a sandwich from the cafeteria. "
+    "The afternoon was spent reviewing some documents and responding to emails. Left work at 5 PM and came home to watch some TV before dinner.",
+    "We finally went on the hiking trip we had been planning all summer. The trail was steeper than we expected and it started raining "
+    "halfway up, so we were soaked and tired by the time we reached the lake. Still, the view from the top was breathtaking, and sitting "
+    "around the fire that evening, telling stories and laughing about the rain, made it one of the best weekends I can remember.",
+    "My grandmother has been in the hospital for a week now. The doctors say she is stable, but she seems smaller and more tired every "
+    "time I visit. I keep bringing her the crossword puzzles she loves, and yesterday she finished one for the first time since she was "
+    "admitted. It felt like a small victory. I'm trying to stay hopeful, but the uncertainty is exhausting and I haven't been sleeping well.",
+]
+
+
+def _rss_mb() -> float:
+    """Peak resident set size of this process in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _lcs_length(a: List[str], b: List[str]) -> int:
+    previous = [0] * (len(b) + 1)
+    for token_a in a:
+        current = [0]
+        for j, token_b in enumerate(b):
+            current.append(previous[j] + 1 if token_a == token_b else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def _f1(overlap: int, candidate_length: int, reference_length: int) -> float:
+    if not overlap:
+        return 0.0
+    precision = overlap / candidate_length
+    recall = overlap / reference_length
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_scores(candidate: str, reference: str) -> Dict[str, float]:
+    """ROUGE-1, ROUGE-2 and ROUGE-L F1 of a candidate summary against a reference."""
+    cand = candidate.lower().split()
+    ref = reference.lower().split()
+    if not cand or not ref:
+        return {"rouge1": 0.0, "rouge2": 0.0, "rougeL": 0.0}
+
+    def ngram_overlap(n: int) -> int:
+        cand_ngrams = [tuple(cand[i:i + n]) for i in range(len(cand) - n + 1)]
+        ref_ngrams = [tuple(ref[i:i + n]) for i in range(len(ref) - n + 1)]
+        remaining = list(ref_ngrams)
+        overlap = 0
+        for ngram in cand_ngrams:
+            if ngram in remaining:
+                remaining.remove(ngram)
+                overlap += 1
+        return overlap, len(cand_ngrams), len(ref_ngrams)
+
+    rouge1 = _f1(*ngram_overlap(1))
+    overlap2, cand2, ref2 = ngram_overlap(2)
+    rouge2 = _f1(overlap2, cand2, ref2) if cand2 and ref2 else 0.0
+    rougeL = _f1(_lcs_length(cand, ref), len(cand), len(ref))
+
+    return {"rouge1": round(rouge1, 4), "rouge2": round(rouge2, 4), "rougeL": round(rougeL, 4)}
+
+
+def run_mode(quantize: bool, repeats: int) -> Dict:
+    """Load the summarizer in one precision, summarize the samples and measure it."""
+    from summarizer import TextSummarizer
+
+    start_time = time.perf_counter()
+    summarizer = TextSummarizer(quantize=quantize)
+    load_time = time.perf_counter() - start_time
+
+    # Warm up once so the first call's lazy initialization is not timed
+    summarizer.abstractive_summarize(SAMPLE_TEXTS[0])
+
+    latencies = []
+    summaries = []
+    for text in SAMPLE_TEXTS:
+        for _ in range(repeats):
+            call_start = time.perf_counter()
+            summary = summarizer.abstractive_summarize(text)
+            latencies.append(time.perf_counter() - call_start)
+        summaries.append(summary)
+
+    return {
+        "precision": summarizer.precision,
+        "load_time_s": round(load_time, 2),
+        "mean_latency_s": round(statistics.mean(latencies), 3),
+        "p95_latency_s": round(sorted(latencies)[int(len(latencies) * 0.95) - 1], 3),
+        "peak_rss_mb": round(_rss_mb(), 1),
+        "summaries": summaries
+    }
+
+
+def _run_in_subprocess(quantize: bool, repeats: int) -> Dict:
+    # Each precision runs in a fresh process so peak RSS is not shared between them
+    command = [sys.executable, __file__, "--worker", "int8" if quantize else "fp32", "--repeats", str(repeats)]
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    """Run both precisions and print the comparison."""
+    parser = argparse.ArgumentParser(description="Compare the int8 quantized summarizer against fp32")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per sample text")
+    parser.add_argument("--save", help="Save the full report to a JSON file")
+    parser.add_argument("--worker", choices=["fp32", "int8"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_mode(args.worker == "int8", args.repeats)))
+        return
+
+    print("⏱️  Benchmarking fp32 summarizer...")
+    fp32 = _run_in_subprocess(False, args.repeats)
+    print("⏱️  Benchmarking int8 summarizer...")
+    int8 = _run_in_subprocess(True, args.repeats)
+
+    drift = [rouge_scores(q, f) for q, f in zip(int8["summaries"], fp32["summaries"])]
+    mean_drift = {metric: round(statistics.mean(d[metric] for d in drift), 4) for metric in ("rouge1", "rouge2", "rougeL")}
+
+    print("\n" + "=" * 60)
+    print("QUANTIZATION BENCHMARK")
+    print("=" * 60)
+    print(f"{'':20}{'fp32':>12}{'int8':>12}")
+    for label, key in (("Load time (s)", "load_time_s"), ("Mean latency (s)", "mean_latency_s"),
+                       ("p95 latency (s)", "p95_latency_s"), ("Peak RSS (MB)", "peak_rss_mb")):
+        print(f"{label:20}{fp32[key]:>12}{int8[key]:>12}")
+
+    if int8["precision"] != "int8":
+        print(f"\n⚠️  Quantized mode was not active (loaded as {int8['precision']})")
+
+    print("\nROUGE of int8 summaries against fp32 summaries (1.0 = identical):")
+    for metric, value in mean_drift.items():
+        print(f"   {metric}: {value}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({"fp32": fp32, "int8": int8, "rouge_vs_fp32": drift, "mean_rouge_vs_fp32": mean_drift}, f, indent=2)
+        print(f"\n💾 Report saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures cold-start time of each CLI mode and API endpoint, each in a fresh process,
+and optionally lists the slowest imports behind them.
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import time
+from typing import Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_TEXT = (
+    "I had a really challenging day at work today. The presentation I've been preparing for weeks "
+    "didn't go as well as I hoped, but I'm determined to learn from this experience and come back stronger."
+)
+
+CLI_MODES = {
+    "import": ["-c", "import nlp_analyzer"],
+    "daily": ["nlp_analyzer.py", "--daily"],
+    "summary-only": ["nlp_analyzer.py", SAMPLE_TEXT, "--no-mood", "--no-motivation"],
+    "mood-only": ["nlp_analyzer.py", SAMPLE_TEXT, "--no-summary", "--no-motivation"],
+    "full": ["nlp_analyzer.py", SAMPLE_TEXT],
+}
+
+API_ENDPOINTS = {
+    "GET /health": None,
+    "GET /daily-motivation": None,
+    "POST /motivate": {"mood": "neutral"},
+    "POST /summarize": {"text": SAMPLE_TEXT, "summary_type": "extractive"},
+    "POST /mood": {"text": SAMPLE_TEXT},
+    "POST /analyze": {"text": SAMPLE_TEXT},
+}
+
+
+def _environment() -> Dict[str, str]:
+    env = dict(os.environ)
+    # Measure real work: no persistent result cache and no background warm-up
+    env["NLP_CACHE_DB"] = ""
+    env["RESULT_CACHE_SIZE"] = "0"
+    env["MODEL_WARMUP"] = "0"
+    return env
+
+
+def slowest_imports(stderr: str, top: int) -> List[str]:
+    """Top-level imports with the largest cumulative time from ``-X importtime`` output."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            imports.append((int(cumulative), name.strip()))
+    imports.sort(reverse=True)
+    return [f"{name} ({cumulative / 1e6:.2f}s)" for cumulative, name in imports[:top]]
+
+
+def measure_cli(mode: str, top_imports: int) -> Dict:
+    """Wall time of one CLI invocation in a fresh interpreter."""
+    command = [sys.executable, "-X", "importtime"] + CLI_MODES[mode]
+    start_time = time.perf_counter()
+    completed = subprocess.run(command, cwd=BASE_DIR, env=_environment(),
+                               capture_output=True, text=True, stdin=subprocess.DEVNULL)
+    result = {
+        "seconds": round(time.perf_counter() - start_time, 2),
+        "exit_code": completed.returncode
+    }
+    if top_imports:
+        result["slowest_imports"] = slowest_imports(completed.stderr, top_imports)
+    return result
+
+
+def probe_endpoint(endpoint: str) -> Dict:
+    """Import the API and serve one request (runs inside the fresh process)."""
+    start_time = time.perf_counter()
+    sys.path.append(os.path.join(BASE_DIR, "api"))
+    from fastapi.testclient import TestClient
+    import main
+    import_seconds = time.perf_counter() - start_time
+
+    method, path = endpoint.split(" ", 1)
+    with TestClient(main.app) as client:
+        request_start = time.perf_counter()
+        response = client.request(method, path, json=API_ENDPOINTS[endpoint])
+        first_response_seconds = time.perf_counter() - request_start
+
+    return {
+        "import_seconds": round(import_seconds, 2),
+        "first_response_seconds": round(first_response_seconds, 2),
+        "total_seconds": round(time.perf_counter() - start_time, 2),
+        "status": response.status_code
+    }
+
+
+def measure_endpoint(endpoint: str) -> Dict:
+    """Cold start of one API endpoint, measured in a fresh interpreter."""
+    command = [sys.executable, os.path.abspath(__file__), "--probe-endpoint", endpoint]
+    completed = subprocess.run(command, cwd=BASE_DIR, env=_environment(), capture_output=True, text=True)
+    try:
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {"error": (completed.stderr.strip().splitlines() or ["no output"])[-1]}
+
+
+def main():
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description="Measure cold-start time of CLI modes and API endpoints")
+    parser.add_argument("--cli-only", action="store_true", help="Skip the API endpoints")
+    parser.add_argument("--api-only", action="store_true", help="Skip the CLI modes")
+    parser.add_argument("--top-imports", type=int, default=3, help="Slowest imports to list per CLI mode (0 to skip)")
+    parser.add_argument("--save", help="Save the report to a JSON file")
+    parser.add_argument("--probe-endpoint", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe_endpoint:
+        print(json.dumps(probe_endpoint(args.probe_endpoint)))
+        return
+
+    report: Dict[str, Optional[Dict]] = {"cli": {}, "api": {}}
+
+    if not args.api_only:
+        print("⏱️  CLI cold start (python nlp_analyzer.py ...)")
+        for mode in CLI_MODES:
+            result = measure_cli(mode, args.top_imports)
+            report["cli"][mode] = result
+            status = "" if result["exit_code"] == 0 else f"  (exit code {result['exit_code']})"
+            print(f"   {mode:<14}{result['seconds']:>8.2f}s{status}")
+            for entry in result.get("slowest_imports", []):
+                print(f"      {entry}")
+
+    if not args.cli_only:
+        print("\n⏱️  API cold start (import + first request, models loaded on demand)")
+        for endpoint in API_ENDPOINTS:
+            result = measure_endpoint(endpoint)
+            report["api"][endpoint] = result
+            if "error" in result:
+                print(f"   {endpoint:<24} failed: {result['error']}")
+            else:
+                print(f"   {endpoint:<24} import {result['import_seconds']:>6.2f}s   "
+                      f"first response {result['first_response_seconds']:>6.2f}s   (HTTP {result['status']})")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Build Fused Mood Model
+Distills the RoBERTa sentiment model into a linear head on the emotion classifier's
+encoder, so MoodDetector(fused=True) can score sentiment and emotions in one pass.
+"""
+
+import os
+import sys
+import argparse
+import random
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
+
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
+from fused_mood import BACKBONE_MODEL, DEFAULT_FUSED_HEAD, encode
+from linguistics import SENTENCES, get_linguistic_layer
+
+TEACHER_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+
+
+def load_corpus(paths: List[str]) -> List[str]:
+    """Texts to distill on: every sentence and every paragraph of the given files."""
+    paragraphs = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            paragraphs.extend(paragraph.strip() for paragraph in f.read().split('\n') if paragraph.strip())
+
+    # Split the way MoodDetector does at inference time, all paragraphs in one batched pass
+    texts = []
+    for paragraph, parsed in zip(paragraphs, get_linguistic_layer().parse_batch(paragraphs, (SENTENCES,))):
+        texts.append(paragraph)
+        texts.extend(parsed.sentences)
+    return list(dict.fromkeys(texts))
+
+
+def main():
+    """Distill the sentiment head and save it for the fused mood engine."""
+    parser = argparse.ArgumentParser(description="Build the sentiment head of the fused mood engine")
+    parser.add_argument("corpus", nargs="+", help="Text files with journal-style entries (one or more per line)")
+    parser.add_argument("--output", "-o", default=os.getenv("FUSED_MOOD_HEAD", DEFAULT_FUSED_HEAD), help="Where to save the head")
+    parser.add_argument("--epochs", type=int, default=300, help="Training epochs over the cached features")
+    parser.add_argument("--batch-size", type=int, default=32, help="Texts per encoder call")
+    args = parser.parse_args()
+
+    texts = load_corpus(args.corpus)
+    if len(texts) < 50:
+        print(f"❌ Only {len(texts)} texts found; provide a larger corpus")
+        sys.exit(1)
+    print(f"📚 Distilling on {len(texts)} texts")
+
+    teacher = pipeline("sentiment-analysis", model=TEACHER_MODEL)
+    labels = [teacher.model.config.id2label[i] for i in range(teacher.model.config.num_labels)]
+
+    tokenizer = AutoTokenizer.from_pretrained(BACKBONE_MODEL)
+    backbone = AutoModelForSequenceClassification.from_pretrained(BACKBONE_MODEL).eval()
+
+    features, targets = [], []
+    for start in range(0, len(texts), args.batch_size):
+        batch = texts[start:start + args.batch_size]
+        _, batch_features = encode(backbone, tokenizer, batch)
+        features.append(batch_features)
+
+        predictions = teacher(batch, top_k=None, truncation=True, batch_size=len(batch))
+        for prediction in predictions:
+            scores = {p['label']: p['score'] for p in prediction}
+            targets.append([scores[label] for label in labels])
+        print(f"   Encoded {min(start + args.batch_size, len(texts))}/{len(texts)}")
+
+    features = torch.cat(features)
+    targets = torch.tensor(targets)
+
+    # Hold out a fifth of the texts to report agreement with the teacher
+    order = list(range(len(texts)))
+    random.Random(0).shuffle(order)
+    split = len(order) // 5
+    holdout, train = torch.tensor(order[:split]), torch.tensor(order[split:])
+
+    head = torch.nn.Linear(features.shape[1], len(labels))
+    optimizer = torch.optim.Adam(head.parameters(), lr=1e-3, weight_decay=1e-4)
+    for epoch in range(args.epochs):
+        optimizer.zero_grad()
+        log_probs = torch.log_softmax(head(features[train]), dim=-1)
+        loss = -(targets[train] * log_probs).sum(dim=-1).mean()
+        loss.backward()
+        optimizer.step()
+        if (epoch + 1) % 50 == 0:
+            print(f"   Epoch {epoch + 1}: loss {loss.item():.4f}")
+
+    with torch.no_grad():
+        predicted = head(features[holdout]).argmax(dim=-1)
+        agreement = (predicted == targets[holdout].argmax(dim=-1)).float().mean().item()
+    print(f"✅ Holdout agreement with {TEACHER_MODEL}: {agreement:.1%}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    torch.save({
+        "backbone": BACKBONE_MODEL,
+        "teacher": TEACHER_MODEL,
+        "labels": labels,
+        "state_dict": head.state_dict(),
+        "holdout_agreement": agreement
+    }, args.output)
+    print(f"💾 Sentiment head saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Build IDF Table
+Counts document frequencies over the backend's journal entries and saves the corpus IDF
+table used by TextSummarizer. Re-running it adds only entries created since the last run.
+"""
+
+import os
+import sys
+import argparse
+from typing import Iterator
+
+sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
+
+from idf_table import DEFAULT_IDF_TABLE, IdfTable, default_tokenizer
+from backfill_journal import DEFAULT_JOURNAL_DB, connect
+
+
+def journal_entries(db_path: str, after_id: int, chunk_size: int = 500) -> Iterator[tuple]:
+    """(id, content) of journal entries after ``after_id``, read in keyset-paginated chunks."""
+    conn = connect(db_path)
+    try:
+        while True:
+            rows = conn.execute(
+                "SELECT id, content FROM journal_entries WHERE id > ? ORDER BY id LIMIT ?",
+                (after_id, chunk_size)
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row["id"], row["content"]
+            after_id = rows[-1]["id"]
+    finally:
+        conn.close()
+
+
+def main():
+    """Build or update the IDF table."""
+    parser = argparse.ArgumentParser(description="Build the corpus IDF table for extractive summaries and key phrases")
+    parser.add_argument("--db", default=os.getenv("JOURNAL_DB", DEFAULT_JOURNAL_DB), help="Backend SQLite database")
+    parser.add_argument("--corpus", help="Count a JSONL file or directory of text files instead of the database")
+    parser.add_argument("--output", "-o", default=os.getenv("IDF_TABLE_PATH", DEFAULT_IDF_TABLE), help="Table file to create or update")
+    parser.add_argument("--rebuild", action="store_true", help="Start from an empty table instead of updating the existing one")
+    args = parser.parse_args()
+
+    if os.path.exists(args.output) and not args.rebuild:
+        table = IdfTable.load(args.output)
+        print(f"📚 Updating table with {table.num_documents} documents (last entry {table.last_entry_id})")
+    else:
+        table = IdfTable()
+        print("📚 Building a new table")
+
+    tokenize = default_tokenizer()
+
+    if args.corpus:
+        from corpus import read_records
+
+        added = table.add_documents(
+            tokenize(record["text"]) for record in read_records(args.corpus) if "text" in record
+        )
+    else:
+        added = 0
+        for entry_id, content in journal_entries(args.db, table.last_entry_id):
+            added += table.add_documents([tokenize(content or "")])
+            table.last_entry_id = entry_id
+
+    table.save(args.output)
+    print(f"✅ Added {added} documents; {table.num_documents} documents, "
+          f"{len(table.document_frequency)} terms saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
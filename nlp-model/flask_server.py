@@ -7,22 +7,63 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import sys
 import os
+import threading
 
-# Add the models directory to the path
+# Add the models and utils directories to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
 from summarizer import TextSummarizer
 from mood_detector import MoodDetector
 from motivator import Motivator
+from result_cache import create_result_cache, make_cache_key, result_model_version
+from component_loader import create_components, env_flag, model_settings, start_background_warmup
 
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-# Global model instances
-summarizer = None
-mood_detector = None
-motivator = None
+# Model options from NLP_INCREMENTAL, INFERENCE_BACKEND, MOOD_FUSED, SUMMARIZER_QUANTIZE
+# and SUMMARIZER_CORPUS_IDF, shared with the other server and the CLI
+MODEL_SETTINGS = model_settings()
+
+# Load and warm up every component in the background once the server is up
+MODEL_WARMUP = env_flag("MODEL_WARMUP", "1")
+
+# Model components; each one loads independently on first use, so cheap
+# endpoints (motivation, extractive summaries) never wait for the large models
+components = create_components(MODEL_SETTINGS)
+
+# Analysis results cached in memory and in a SQLite store shared with the other servers
+result_cache = create_result_cache()
+
+# Process that started the warm-up; a worker forked after it (e.g. gunicorn --preload)
+# does not inherit the warm-up thread and starts its own
+_warmup_pid = None
+_warmup_lock = threading.Lock()
+
+def start_model_warmup():
+    """Load and warm up every component in the background, once per process."""
+    global _warmup_pid
+    if not MODEL_WARMUP:
+        return
+    with _warmup_lock:
+        if _warmup_pid == os.getpid():
+            return
+        _warmup_pid = os.getpid()
+    print("Models load in the background; check /ready for their status.")
+    start_background_warmup(
+        components[name] for name in ("motivator", "summarizer", "mood_detector", "abstractive_model")
+    )
+
+@app.before_request
+def ensure_model_warmup():
+    start_model_warmup()
+
+def cached(namespace, component, text, fn, *args, **options):
+    """Serve a result from the cache, or compute it with fn(*args) and cache it."""
+    key = make_cache_key(namespace, text, options, result_model_version(component, text, options))
+    return result_cache.get_or_compute(key, fn, *args)
 
 # Request/Response Models
 class TextAnalysisRequest:
@@ -71,23 +112,27 @@ class ComprehensiveAnalysisResponse:
         self.success = success
         self.message = message
 
-# Initialize models
+# Load every component needed for a full analysis
 def get_models():
-    global summarizer, mood_detector, motivator
-
-    if summarizer is None:
-        print("Initializing Text Summarizer...")
-        summarizer = TextSummarizer()
-
-    if mood_detector is None:
-        print("Initializing Mood Detector...")
-        mood_detector = MoodDetector()
-
-    if motivator is None:
-        print("Initializing Motivator...")
-        motivator = Motivator()
+    return (
+        components["abstractive_model"].get(),
+        components["mood_detector"].get(),
+        components["motivator"].get()
+    )
+
+def get_analysis_models(text_request):
+    """Load only the components one analysis request will use; the others come back as None."""
+    summarizer_instance = None
+    if text_request.include_summary:
+        if TextSummarizer.may_use_abstractive(text_request.text, text_request.summary_type):
+            summarizer_instance = components["abstractive_model"].get()
+        else:
+            summarizer_instance = components["summarizer"].get()
 
-    return summarizer, mood_detector, motivator
+    mood_detector_instance = components["mood_detector"].get() if text_request.include_mood else None
+    wants_motivation = text_request.include_mood and text_request.include_motivation
+    motivator_instance = components["motivator"].get() if wants_motivation else None
+    return summarizer_instance, mood_detector_instance, motivator_instance
 
 # Health check endpoint
 @app.route("/")
@@ -101,7 +146,8 @@ def root():
             "/analyze - Comprehensive text analysis",
             "/summarize - Text summarization only",
             "/mood - Mood detection only",
-            "/motivate - Motivational content generation"
+            "/motivate - Motivational content generation",
+            "/ready - Per-model readiness"
         ]
     })
 
@@ -109,6 +155,16 @@ def root():
 def health_check():
     return jsonify({"status": "healthy", "message": "API is running successfully"})
 
+# Readiness endpoint: 200 once every model is loaded, 503 before
+@app.route("/ready")
+def readiness_check():
+    ready = all(component.loaded for component in components.values())
+
+    return jsonify({
+        "ready": ready,
+        "components": {name: component.status() for name, component in components.items()}
+    }), 200 if ready else 503
+
 # Main comprehensive analysis endpoint
 @app.route("/analyze", methods=["POST"])
 def analyze_text():
@@ -128,7 +184,7 @@ def analyze_text():
             summary_type=data.get("summary_type", "auto")
         )
 
-        summarizer_instance, mood_detector_instance, motivator_instance = get_models()
+        summarizer_instance, mood_detector_instance, motivator_instance = get_analysis_models(text_request)
 
         response = {
             "summary": None,
@@ -142,11 +198,16 @@ def analyze_text():
         # Text Summarization
         if text_request.include_summary:
             try:
-                summary_result = summarizer_instance.smart_summarize(
-                    text_request.text,
+                summary_result = cached(
+                    "summary", summarizer_instance, text_request.text,
+                    summarizer_instance.smart_summarize, text_request.text, text_request.summary_type,
                     summary_type=text_request.summary_type
                 )
-                key_phrases = summarizer_instance.get_key_phrases(text_request.text)
+                key_phrases = cached(
+                    "key_phrases", summarizer_instance, text_request.text,
+                    summarizer_instance.get_key_phrases, text_request.text,
+                    num_phrases=5
+                )
 
                 response["summary"] = {
                     "summary": summary_result["summary"],
@@ -163,7 +224,10 @@ def analyze_text():
         # Mood Detection
         if text_request.include_mood:
             try:
-                mood_result = mood_detector_instance.comprehensive_mood_analysis(text_request.text)
+                mood_result = cached(
+                    "mood", mood_detector_instance, text_request.text,
+                    mood_detector_instance.comprehensive_mood_analysis, text_request.text
+                )
 
                 response["mood"] = {
                     "overall_mood": mood_result["overall_mood"],
@@ -219,20 +283,34 @@ def summarize_text():
     try:
         data = request.get_json()
 
-        summarizer_instance, _, _ = get_models()
-
-        if data.get("summary_type") == "extractive":
-            summary = summarizer_instance.extractive_summarize(data["text"], data.get("num_sentences", 3))
+        # Extractive summaries do not need to wait for the abstractive model
+        if TextSummarizer.may_use_abstractive(data["text"], data.get("summary_type", "auto")):
+            summarizer_instance = components["abstractive_model"].get()
+        else:
+            summarizer_instance = components["summarizer"].get()
+
+        if data.get("summary_type") in ("extractive", "graph"):
+            summarize = (summarizer_instance.graph_summarize if data["summary_type"] == "graph"
+                         else summarizer_instance.extractive_summarize)
+            summary = cached(
+                f"{data['summary_type']}_summary", summarizer_instance, data["text"],
+                summarize, data["text"], data.get("num_sentences", 3),
+                num_sentences=data.get("num_sentences", 3)
+            )
             result = {
                 "summary": summary,
-                "method": "extractive",
+                "method": data["summary_type"],
                 "original_length": len(data["text"].split()),
                 "summary_length": len(summary.split()),
                 "compression_ratio": 0
             }
             result["compression_ratio"] = round((1 - result["summary_length"] / result["original_length"]) * 100, 2) if result["original_length"] > 0 else 0
         elif data.get("summary_type") == "abstractive":
-            summary = summarizer_instance.abstractive_summarize(data["text"])
+            summary = cached(
+                "abstractive_summary", summarizer_instance, data["text"],
+                summarizer_instance.abstractive_summarize, data["text"],
+                summary_type="abstractive"
+            )
             result = {
                 "summary": summary,
                 "method": "abstractive",
@@ -242,9 +320,17 @@ def summarize_text():
             }
             result["compression_ratio"] = round((1 - result["summary_length"] / result["original_length"]) * 100, 2) if result["original_length"] > 0 else 0
         else:
-            result = summarizer_instance.smart_summarize(data["text"], data.get("summary_type", "auto"))
-
-        key_phrases = summarizer_instance.get_key_phrases(data["text"])
+            result = cached(
+                "summary", summarizer_instance, data["text"],
+                summarizer_instance.smart_summarize, data["text"], data.get("summary_type", "auto"),
+                summary_type=data.get("summary_type", "auto")
+            )
+
+        key_phrases = cached(
+            "key_phrases", summarizer_instance, data["text"],
+            summarizer_instance.get_key_phrases, data["text"],
+            num_phrases=5
+        )
 
         return jsonify({
             "summary": result["summary"],
@@ -269,9 +355,12 @@ def detect_mood():
     """
     try:
         data = request.get_json()
-        _, mood_detector_instance, _ = get_models()
+        mood_detector_instance = components["mood_detector"].get()
 
-        result = mood_detector_instance.comprehensive_mood_analysis(data["text"])
+        result = cached(
+            "mood", mood_detector_instance, data["text"],
+            mood_detector_instance.comprehensive_mood_analysis, data["text"]
+        )
 
         return jsonify({
             "overall_mood": result["overall_mood"],
@@ -290,6 +379,11 @@ def detect_mood():
             "message": str(e)
         }), 500
 
+# Result cache statistics endpoint
+@app.route("/cache/stats")
+def get_cache_stats():
+    return jsonify(result_cache.get_stats())
+
 # Individual endpoint for motivational content
 @app.route("/motivate", methods=["POST"])
 def generate_motivation():
@@ -298,7 +392,7 @@ def generate_motivation():
     """
     try:
         data = request.get_json()
-        _, _, motivator_instance = get_models()
+        motivator_instance = components["motivator"].get()
 
         result = motivator_instance.get_motivational_content(
             data["mood"],
@@ -320,14 +414,14 @@ def generate_motivation():
             "message": str(e)
         }), 500
 
+# Warm up as soon as the app is imported, as under gunicorn or any other WSGI server.
+# Run directly, only the debug reloader's serving process warms up, not its watcher.
+if __name__ != "__main__" or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+    start_model_warmup()
+
 if __name__ == "__main__":
     print("Starting NLP Text Analysis & Motivation API...")
-    print("Loading models... This may take a few moments.")
-
-    # Initialize models on startup
-    get_models()
 
-    print("Models loaded successfully!")
     print("API will be available at: http://localhost:8000")
     print("Documentation available at: http://localhost:8000")
 
@@ -0,0 +1,174 @@
+"""
+Fused Mood Engine
+One encoder pass per text produces both the sentiment and the emotion distributions.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+import torch
+from transformers import AutoModelForSequenceClassification
+
+from model_store import load_model
+
+DEFAULT_FUSED_HEAD = os.path.join(os.path.dirname(__file__), '..', 'cache', 'fused_mood', 'sentiment_head.pt')
+BACKBONE_MODEL = "j-hartmann/emotion-english-distilroberta-base"
+
+
+def encode(model, tokenizer, texts: List[str], max_length: int = 512) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Run the shared encoder once.
+
+    Returns:
+        Tuple: The encoder's hidden states and the first-token sentence features
+            the sentiment head is trained on
+    """
+    inputs = tokenizer(texts, padding=True, truncation=True, max_length=max_length, return_tensors="pt")
+    with torch.inference_mode():
+        hidden_states = model.base_model(**inputs).last_hidden_state
+    return hidden_states, hidden_states[:, 0, :]
+
+
+class FusedHead:
+    """
+    Pipeline-compatible view of one head of a ``FusedMoodEngine``.
+
+    Accepts the same calls ``MoodDetector`` makes on a transformers
+    text-classification pipeline (a single text or a list, ``top_k``,
+    ``truncation``, ``batch_size``) and returns results in the same shape.
+    """
+
+    def __init__(self, engine: "FusedMoodEngine", head: str, name_or_path: str):
+        self.engine = engine
+        self.head = head
+        self.name_or_path = name_or_path
+
+    def __call__(self, inputs, top_k=1, **kwargs):
+        single = isinstance(inputs, str)
+        texts = [inputs] if single else list(inputs)
+
+        results = []
+        for distribution in self.engine.distributions(texts, self.head):
+            ranked = [
+                {"label": label, "score": score}
+                for label, score in sorted(distribution.items(), key=lambda x: x[1], reverse=True)
+            ]
+            if top_k is not None:
+                ranked = ranked[:top_k]
+            # Pipelines return a bare dict per input for batched top-1 calls
+            results.append(ranked[0] if top_k == 1 and not single else ranked)
+
+        return results[0] if single else results
+
+
+class FusedMoodEngine:
+    """
+    Sentiment and emotion from one shared encoder.
+
+    The backbone is the emotion classifier, whose own head produces the
+    emotion distribution unchanged. A small linear sentiment head, distilled
+    from the RoBERTa sentiment model by ``build_fused_mood_model.py``, reads
+    the same hidden states, so each text is tokenized and encoded once and
+    only one set of encoder weights is resident.
+
+    Sentiment and emotion are requested separately (possibly concurrently);
+    the engine remembers the most recent texts' outputs, and a text already
+    being encoded by another call is waited for instead of encoded again.
+    """
+
+    def __init__(self, head_path: str = DEFAULT_FUSED_HEAD, batch_size: int = 32, max_recent: int = 512):
+        """
+        Load the backbone and the distilled sentiment head.
+
+        Args:
+            head_path (str): Path of the checkpoint written by build_fused_mood_model.py
+            batch_size (int): Maximum texts per encoder call
+            max_recent (int): Number of recent texts whose outputs are kept for the other head
+        """
+        # Names, labels and tensors only; never unpickle code from the checkpoint
+        checkpoint = torch.load(head_path, map_location="cpu", weights_only=True)
+
+        self.backbone_name = checkpoint["backbone"]
+        self.model, self.tokenizer = load_model(self.backbone_name, AutoModelForSequenceClassification)
+
+        self.sentiment_labels: List[str] = checkpoint["labels"]
+        self.sentiment_head = torch.nn.Linear(self.model.config.hidden_size, len(self.sentiment_labels))
+        self.sentiment_head.load_state_dict(checkpoint["state_dict"])
+        self.sentiment_head.eval()
+        self.emotion_labels = [self.model.config.id2label[i] for i in range(self.model.config.num_labels)]
+
+        self.batch_size = batch_size
+        self.max_recent = max_recent
+        self._recent: "OrderedDict[str, Dict[str, Dict[str, float]]]" = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+        self.sentiment = FusedHead(self, "sentiment", f"fused:{self.backbone_name}+{checkpoint['teacher']}")
+        self.emotion = FusedHead(self, "emotion", f"fused:{self.backbone_name}")
+
+    def distributions(self, texts: List[str], head: str) -> List[Dict[str, float]]:
+        """
+        Label distributions of one head for each text.
+
+        Args:
+            texts (List[str]): Texts to classify
+            head (str): "sentiment" or "emotion"
+
+        Returns:
+            List[Dict[str, float]]: Label -> probability, one per input text
+        """
+        outputs: Dict[str, Dict[str, Dict[str, float]]] = {}
+        owned: List[str] = []
+        waiting: Dict[str, Future] = {}
+
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                if text in self._recent:
+                    self._recent.move_to_end(text)
+                    outputs[text] = self._recent[text]
+                elif text in self._pending:
+                    waiting[text] = self._pending[text]
+                else:
+                    self._pending[text] = Future()
+                    owned.append(text)
+
+        for start in range(0, len(owned), self.batch_size):
+            batch = owned[start:start + self.batch_size]
+            try:
+                computed = self._forward(batch)
+            except Exception as e:
+                with self._lock:
+                    for text in owned[start:]:
+                        self._pending.pop(text).set_exception(e)
+                raise
+
+            with self._lock:
+                for text, output in zip(batch, computed):
+                    self._recent[text] = output
+                    self._pending.pop(text).set_result(output)
+                while len(self._recent) > self.max_recent:
+                    self._recent.popitem(last=False)
+            outputs.update(zip(batch, computed))
+
+        for text, future in waiting.items():
+            outputs[text] = future.result()
+
+        return [outputs[text][head] for text in texts]
+
+    def _forward(self, texts: List[str]) -> List[Dict[str, Dict[str, float]]]:
+        """One encoder pass feeding both heads."""
+        hidden_states, features = encode(self.model, self.tokenizer, texts)
+        with torch.inference_mode():
+            emotion_probs = torch.softmax(self.model.classifier(hidden_states), dim=-1).tolist()
+            sentiment_probs = torch.softmax(self.sentiment_head(features), dim=-1).tolist()
+
+        return [
+            {
+                "sentiment": dict(zip(self.sentiment_labels, sentiment)),
+                "emotion": dict(zip(self.emotion_labels, emotion))
+            }
+            for sentiment, emotion in zip(sentiment_probs, emotion_probs)
+        ]
@@ -0,0 +1,126 @@
+"""
+Corpus IDF Table
+Document frequencies of terms across the journal corpus, stored as a compact array file,
+for TF-IDF scoring of single entries without fitting a vectorizer per request.
+"""
+
+import math
+import os
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+DEFAULT_IDF_TABLE = os.path.join(os.path.dirname(__file__), '..', 'cache', 'idf_table.npz')
+
+
+def default_tokenizer():
+    """Tokenizer shared by the table builder and TextSummarizer (lowercased words, English stop words removed)."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    return TfidfVectorizer(stop_words='english').build_analyzer()
+
+
+class IdfTable:
+    """
+    Inverse document frequencies learned from a corpus of entries.
+
+    Each journal entry counts as one document, so a word that is common
+    across entries scores low even if it appears once in the entry being
+    summarized. Only document frequencies and the document count are stored;
+    IDF is derived from them (sklearn's smoothed formula), which is what lets
+    ``add_documents`` fold in new entries without refitting anything.
+
+    A loaded table is only read at request time, so one instance can be
+    shared by any number of threads. Updates are done offline by
+    ``build_idf_table.py`` and picked up on the next start.
+    """
+
+    def __init__(self, document_frequency: Dict[str, int] = None, num_documents: int = 0, last_entry_id: int = 0):
+        """
+        Initialize the table.
+
+        Args:
+            document_frequency (Dict[str, int]): Number of documents containing each term
+            num_documents (int): Number of documents counted
+            last_entry_id (int): Highest journal entry id counted, for incremental updates
+        """
+        self.document_frequency: Dict[str, int] = dict(document_frequency or {})
+        self.num_documents = num_documents
+        self.last_entry_id = last_entry_id
+
+    def add_documents(self, documents: Iterable[List[str]]) -> int:
+        """
+        Count new documents.
+
+        Args:
+            documents (Iterable[List[str]]): Tokens of each new document
+
+        Returns:
+            int: Number of documents added
+        """
+        added = 0
+        for tokens in documents:
+            for term in set(tokens):
+                self.document_frequency[term] = self.document_frequency.get(term, 0) + 1
+            added += 1
+        self.num_documents += added
+        return added
+
+    def idf(self, term: str) -> float:
+        """Smoothed IDF; terms never seen in the corpus get the highest weight."""
+        return math.log((1 + self.num_documents) / (1 + self.document_frequency.get(term, 0))) + 1
+
+    def transform(self, sentence_tokens: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        TF-IDF matrix of one document's sentences using the corpus IDF.
+
+        Rows are L2-normalized like sklearn's TfidfVectorizer, so the result can
+        be used in place of a per-document fit.
+
+        Args:
+            sentence_tokens (List[List[str]]): Tokens of each sentence
+
+        Returns:
+            Tuple: Sentence-term matrix and the term of each column
+        """
+        vocabulary: Dict[str, int] = {}
+        for tokens in sentence_tokens:
+            for term in tokens:
+                vocabulary.setdefault(term, len(vocabulary))
+
+        matrix = np.zeros((len(sentence_tokens), len(vocabulary)))
+        for row, tokens in enumerate(sentence_tokens):
+            for term, count in Counter(tokens).items():
+                matrix[row, vocabulary[term]] = count
+
+        matrix *= np.array([self.idf(term) for term in vocabulary])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return matrix / norms, np.array(list(vocabulary), dtype=object)
+
+    def save(self, path: str):
+        """Write the table as a compressed .npz of parallel term / frequency arrays."""
+        terms = sorted(self.document_frequency)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        # Write next to the target and rename, so a running server never reads a partial file
+        temp_path = f"{path}.tmp{os.getpid()}"
+        with open(temp_path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                terms=np.array(terms, dtype=np.str_),
+                document_frequency=np.array([self.document_frequency[t] for t in terms], dtype=np.int32),
+                num_documents=np.array(self.num_documents, dtype=np.int64),
+                last_entry_id=np.array(self.last_entry_id, dtype=np.int64)
+            )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IdfTable":
+        """Load a table written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                dict(zip(data["terms"].tolist(), data["document_frequency"].tolist())),
+                num_documents=int(data["num_documents"]),
+                last_entry_id=int(data["last_entry_id"])
+            )
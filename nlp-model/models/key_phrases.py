@@ -0,0 +1,205 @@
+"""
+Key Phrase Extraction
+Multi-word key phrases from statistical features (RAKE/YAKE style), scored for many
+documents at once with sparse matrix operations. No transformer models involved.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# Sentence and phrase boundaries; stop words also end a phrase
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+PHRASE_BOUNDARY = re.compile(r'[,;:()\[\]{}"“”…–—]|\s-\s|[.!?]')
+WORD = re.compile(r"[a-z][a-z'’-]*[a-z]|[a-z]")
+
+# Contractions and journal filler words that make poor key phrases
+EXTRA_STOP_WORDS = frozenset({
+    "i'm", "i've", "i'd", "i'll", "it's", "that's", "there's", "let's", "don't", "didn't", "doesn't",
+    "can't", "couldn't", "won't", "wouldn't", "shouldn't", "isn't", "wasn't", "aren't", "haven't",
+    "feel", "feeling", "feelings", "felt", "really", "just", "like", "got", "get", "getting", "bit",
+    "lot", "thing", "things", "going", "maybe", "pretty", "kind", "today", "im", "ive", "dont"
+})
+
+
+def _stem(word: str) -> str:
+    """Crude suffix stripping, only used to spot near-identical phrases."""
+    if len(word) > 4 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    for suffix in ("ing", "ed"):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            word = word[:-len(suffix)]
+            break
+    return word[:-1] if len(word) > 4 and word.endswith("e") else word
+
+
+class KeyPhraseExtractor:
+    """
+    Extracts key phrases of one to ``max_words`` words.
+
+    Candidates are the runs of words between stop words and punctuation
+    (runs longer than ``max_words`` contribute their ``max_words``-grams),
+    taken from the text's noun chunks and entities when a parse is given.
+    Each word is scored by its RAKE degree/frequency ratio, optionally
+    weighted by corpus IDF. A phrase scores the sum of its words, scaled up
+    by how often it occurs and down by how late it first appears (YAKE's
+    position feature). Near-identical phrases ("deadline" / "tight
+    deadlines") are collapsed into the best-scoring one.
+
+    All documents of a batch are scored together: occurrences, words and
+    phrases become rows and columns of sparse matrices, so the cost is a
+    few matrix products rather than a Python loop per phrase.
+    """
+
+    def __init__(self, max_words: int = 3, stop_words: Optional[frozenset] = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            max_words (int): Longest phrase, in words
+            stop_words (frozenset): Words that split phrases (defaults to English stop words plus journal fillers)
+        """
+        if stop_words is None:
+            from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+            stop_words = frozenset(ENGLISH_STOP_WORDS) | EXTRA_STOP_WORDS
+
+        self.max_words = max_words
+        self.stop_words = stop_words
+
+    def _runs(self, fragment: str) -> List[Tuple[str, ...]]:
+        """Runs of content words in a stretch of text without punctuation."""
+        grams: List[Tuple[str, ...]] = []
+        run: List[str] = []
+        for word in WORD.findall(fragment) + [None]:
+            if word is not None:
+                word = word.replace("’", "'")
+                if word.endswith("'s"):
+                    word = word[:-2]
+            if word is None or word in self.stop_words or len(word) < 3:
+                if 0 < len(run) <= self.max_words:
+                    grams.append(tuple(run))
+                elif run:
+                    grams.extend(tuple(run[i:i + self.max_words]) for i in range(len(run) - self.max_words + 1))
+                run = []
+            else:
+                run.append(word)
+        return grams
+
+    def _candidates(self, text: str) -> List[Tuple[Tuple[str, ...], int]]:
+        """Candidate phrases of a text with the index of the sentence they occur in."""
+        candidates = []
+        for sentence_index, sentence in enumerate(SENTENCE_BOUNDARY.split(text.lower())):
+            for fragment in PHRASE_BOUNDARY.split(sentence):
+                candidates.extend((gram, sentence_index) for gram in self._runs(fragment))
+        return candidates
+
+    def _parsed_candidates(self, parsed) -> List[Tuple[Tuple[str, ...], int]]:
+        """
+        Candidate phrases from the noun chunks and entities of a parsed text
+        (see linguistics.ParsedText), trimmed of stop words the same way.
+        """
+        spans = [(text, index) for text, index in parsed.noun_chunks]
+        spans.extend((text, index) for text, _, index in parsed.entities)
+        candidates = []
+        for span, sentence_index in spans:
+            for fragment in PHRASE_BOUNDARY.split(span.lower()):
+                candidates.extend((gram, sentence_index) for gram in self._runs(fragment))
+        return candidates
+
+    def extract(self, text: str, num_phrases: int = 5, idf: Optional[Callable[[str], float]] = None,
+                parsed=None) -> List[str]:
+        """
+        Key phrases of one text.
+
+        Args:
+            text (str): Input text
+            num_phrases (int): Number of phrases to return
+            idf (Callable): Optional corpus IDF lookup used to weight words
+            parsed (ParsedText): Optional noun chunks and entities of the text to draw candidates from
+
+        Returns:
+            List[str]: Phrases, best first
+        """
+        return self.extract_batch([text], num_phrases, idf, None if parsed is None else [parsed])[0]
+
+    def extract_batch(self, texts: List[str], num_phrases: int = 5,
+                      idf: Optional[Callable[[str], float]] = None, parsed: Optional[List] = None) -> List[List[str]]:
+        """
+        Key phrases of several texts, scored together.
+
+        Args:
+            texts (List[str]): Input texts
+            num_phrases (int): Number of phrases per text
+            idf (Callable): Optional corpus IDF lookup used to weight words
+            parsed (List[ParsedText]): Optional noun chunks and entities per text; candidates then
+                come from those instead of the stop-word split of the raw text
+
+        Returns:
+            List[List[str]]: Phrases per text, best first, in input order
+        """
+        # Words and phrases are keyed per document so statistics never mix across texts
+        word_ids: Dict[Tuple[int, str], int] = {}
+        phrase_ids: Dict[Tuple[int, Tuple[str, ...]], int] = {}
+        occurrence_phrase, occurrence_sentence, occurrence_length = [], [], []
+        rows, cols = [], []
+
+        for doc, text in enumerate(texts):
+            if parsed is not None and (parsed[doc].noun_chunks or parsed[doc].entities):
+                candidates = self._parsed_candidates(parsed[doc])
+            else:
+                candidates = self._candidates(text or "")
+            for phrase, sentence_index in candidates:
+                occurrence = len(occurrence_phrase)
+                occurrence_phrase.append(phrase_ids.setdefault((doc, phrase), len(phrase_ids)))
+                occurrence_sentence.append(sentence_index)
+                occurrence_length.append(len(phrase))
+                for word in phrase:
+                    rows.append(occurrence)
+                    cols.append(word_ids.setdefault((doc, word), len(word_ids)))
+
+        if not phrase_ids:
+            return [[] for _ in texts]
+
+        # Occurrence x word incidence: word frequency and RAKE degree (co-occurring words)
+        occurrences = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(occurrence_phrase), len(word_ids))
+        )
+        frequency = np.asarray(occurrences.sum(axis=0)).ravel()
+        degree = occurrences.T @ np.array(occurrence_length, dtype=float)
+        word_scores = degree / frequency
+        if idf is not None:
+            word_scores *= np.array([idf(word) for _, word in word_ids])
+
+        # Phrase x word incidence turns word scores into phrase scores
+        phrase_keys = list(phrase_ids)
+        phrase_rows = [i for i, (_, phrase) in enumerate(phrase_keys) for _ in phrase]
+        phrase_cols = [word_ids[(doc, word)] for doc, phrase in phrase_keys for word in phrase]
+        phrases = sparse.csr_matrix(
+            (np.ones(len(phrase_rows)), (phrase_rows, phrase_cols)), shape=(len(phrase_keys), len(word_ids))
+        )
+
+        occurrence_phrase = np.array(occurrence_phrase)
+        counts = np.bincount(occurrence_phrase, minlength=len(phrase_keys))
+        first_sentence = np.full(len(phrase_keys), np.iinfo(np.int64).max)
+        np.minimum.at(first_sentence, occurrence_phrase, np.array(occurrence_sentence))
+
+        scores = (phrases @ word_scores) * (1 + np.log(counts)) / np.log2(2 + first_sentence)
+
+        # Rank each document's phrases and drop near-duplicates of better ones
+        documents = np.array([doc for doc, _ in phrase_keys])
+        order = np.lexsort((-scores, documents))
+        results: List[List[str]] = [[] for _ in texts]
+        chosen_stems: List[List[frozenset]] = [[] for _ in texts]
+        for index in order:
+            doc, phrase = phrase_keys[index]
+            if len(results[doc]) >= num_phrases:
+                continue
+            stems = frozenset(_stem(word) for word in phrase)
+            if any(len(stems & other) / len(stems | other) >= 0.5 for other in chosen_stems[doc]):
+                continue
+            chosen_stems[doc].append(stems)
+            results[doc].append(" ".join(phrase))
+
+        return results
@@ -0,0 +1,256 @@
+"""
+Linguistic Layer
+Sentences, lemmas, noun chunks and entities for many texts at once, from one small spaCy
+pipeline run through nlp.pipe with the components a call does not need switched off.
+"""
+
+import os
+import threading
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sentence_cache import SentenceCache
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+
+SENTENCES = "sentences"
+LEMMAS = "lemmas"
+NOUN_CHUNKS = "noun_chunks"
+ENTITIES = "entities"
+ALL_FEATURES = (SENTENCES, LEMMAS, NOUN_CHUNKS, ENTITIES)
+
+# Components of the en_core_web_* pipelines each feature needs; sentence boundaries
+# come from the parser when it runs anyway, else from the much cheaper senter
+FEATURE_COMPONENTS: Dict[str, Set[str]] = {
+    SENTENCES: set(),
+    LEMMAS: {"tok2vec", "tagger", "attribute_ruler", "lemmatizer"},
+    NOUN_CHUNKS: {"tok2vec", "tagger", "attribute_ruler", "parser"},
+    ENTITIES: {"tok2vec", "ner"},
+}
+
+
+class ParsedText:
+    """Linguistic features of one text; features that were not requested stay empty."""
+
+    __slots__ = ("sentences", "lemmas", "noun_chunks", "entities")
+
+    def __init__(self, sentences: Optional[List[str]] = None, lemmas: Optional[List[str]] = None,
+                 noun_chunks: Optional[List[Tuple[str, int]]] = None,
+                 entities: Optional[List[Tuple[str, str, int]]] = None):
+        """
+        Args:
+            sentences (List[str]): Sentences in document order
+            lemmas (List[str]): Lowercased lemma of every alphabetic token
+            noun_chunks (List[Tuple[str, int]]): Chunk text and the index of its sentence
+            entities (List[Tuple[str, str, int]]): Entity text, label and the index of its sentence
+        """
+        self.sentences = sentences or []
+        self.lemmas = lemmas or []
+        self.noun_chunks = noun_chunks or []
+        self.entities = entities or []
+
+
+class LinguisticLayer:
+    """
+    Shared tokenization and parsing for the summarizer and the mood detector.
+
+    The spaCy pipeline is loaded once, on first use, and every call runs a
+    whole batch through ``nlp.pipe`` with only the components its features
+    need (sentences alone run just the senter). If the trained pipeline is
+    not installed, sentences come from spaCy's rule-based sentencizer; if
+    spaCy itself is missing, from NLTK. Only sentences and lemmas are
+    available in those fallbacks.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_SPACY_MODEL, batch_size: int = 64, n_process: int = 1,
+                 max_recent_splits: int = 256):
+        """
+        Initialize the layer (the pipeline itself is loaded lazily).
+
+        Args:
+            model_name (str): Installed spaCy pipeline, e.g. en_core_web_sm
+            batch_size (int): Texts per nlp.pipe batch
+            n_process (int): Worker processes for nlp.pipe (1 parses in the calling thread)
+            max_recent_splits (int): Texts whose sentence split is kept, so the summarizer
+                and the mood detector split a text only once between them when the same
+                component splits it for both
+        """
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.split_cache = SentenceCache(max_entries=max_recent_splits)
+        self.backend = "none"
+        self._nlp = None
+        self._sentence_component = None
+        self._load_lock = threading.Lock()
+
+    def _load(self):
+        """Load the pipeline once; falls back to the sentencizer, then to NLTK."""
+        if self.backend != "none":
+            return
+        with self._load_lock:
+            if self.backend != "none":
+                return
+            try:
+                import spacy
+            except ImportError as e:
+                print(f"Warning: spaCy is not installed, using NLTK for sentences: {e}")
+                self.backend = "nltk"
+                return
+
+            try:
+                nlp = spacy.load(self.model_name)
+                # The senter ships disabled; it splits sentences without running the parser
+                if "senter" in nlp.disabled:
+                    nlp.enable_pipe("senter")
+                self._sentence_component = "senter" if "senter" in nlp.pipe_names else "parser"
+                backend = f"spacy:{self.model_name}@{nlp.meta.get('version', 'unknown')}"
+            except Exception as e:
+                print(f"Warning: Could not load spaCy model {self.model_name}, "
+                      f"using the rule-based sentencizer: {e}")
+                nlp = spacy.blank("en")
+                nlp.add_pipe("sentencizer")
+                self._sentence_component = "sentencizer"
+                backend = "spacy:sentencizer"
+            # Publish the pipeline before the backend, which other threads check without the lock
+            self._nlp = nlp
+            self.backend = backend
+
+    def supports(self, feature: str) -> bool:
+        """Whether the loaded pipeline can produce a feature."""
+        self._load()
+        if feature in (SENTENCES, LEMMAS):
+            # Without a lemmatizer, lemmas fall back to the lowercased words
+            return True
+        return self._nlp is not None and FEATURE_COMPONENTS[feature] <= set(self._nlp.pipe_names)
+
+    def get_version(self) -> str:
+        """Identify the backend, e.g. for keying results that depend on the sentence split."""
+        self._load()
+        return self.backend
+
+    def _needed_components(self, features: Iterable[str]) -> Set[str]:
+        """Components one call runs."""
+        needed: Set[str] = set()
+        for feature in features:
+            needed |= FEATURE_COMPONENTS[feature]
+        if "parser" not in needed or "parser" not in self._nlp.pipe_names:
+            needed.add(self._sentence_component)
+        return needed
+
+    def _disabled_components(self, features: Iterable[str]) -> List[str]:
+        """Components to switch off for one call."""
+        needed = self._needed_components(features)
+        return [name for name in self._nlp.pipe_names if name not in needed]
+
+    def _splitter(self, features: Iterable[str]) -> str:
+        """Component that sets the sentence boundaries of one call."""
+        if self._nlp is None:
+            return "nltk"
+        needed = self._needed_components(features)
+        return "parser" if "parser" in needed and "parser" in self._nlp.pipe_names else self._sentence_component
+
+    def parse_batch(self, texts: List[str], features: Iterable[str] = (SENTENCES,)) -> List[ParsedText]:
+        """
+        Linguistic features of several texts from one pass over the batch.
+
+        Args:
+            texts (List[str]): Input texts
+            features (Iterable[str]): Any of SENTENCES, LEMMAS, NOUN_CHUNKS and ENTITIES
+
+        Returns:
+            List[ParsedText]: One result per input text, in input order
+        """
+        features = set(features)
+        unknown = features - set(ALL_FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown linguistic features: {sorted(unknown)}")
+        if not texts:
+            return []
+
+        self._load()
+        texts = [text or "" for text in texts]
+        if self._nlp is None:
+            parsed = [self._parse_with_nltk(text, features) for text in texts]
+        else:
+            docs = self._nlp.pipe(
+                texts,
+                batch_size=self.batch_size,
+                disable=self._disabled_components(features),
+                n_process=self.n_process
+            )
+            parsed = [self._from_doc(doc, features) for doc in docs]
+
+        # Remember the split for sentences_batch, e.g. so the mood detector reuses the
+        # summarizer's parse; only a split from the same component, since the parser's
+        # boundaries can differ from the senter's and results must not depend on call order
+        if SENTENCES in features and self._splitter(features) == self._splitter((SENTENCES,)):
+            for text, result in zip(texts, parsed):
+                self.split_cache.set(text, result.sentences)
+        return parsed
+
+    def parse(self, text: str, features: Iterable[str] = (SENTENCES,)) -> ParsedText:
+        """Linguistic features of one text."""
+        return self.parse_batch([text], features)[0]
+
+    def sentences_batch(self, texts: List[str]) -> List[List[str]]:
+        """Sentences of several texts; only texts not split recently are parsed."""
+        texts = [text or "" for text in texts]
+        split, missing = self.split_cache.get_many(texts)
+        if missing:
+            parsed = self.parse_batch([texts[i] for i in missing], (SENTENCES,))
+            for i, result in zip(missing, parsed):
+                split[i] = result.sentences
+        return split
+
+    def sentences(self, text: str) -> List[str]:
+        """Sentences of one text."""
+        return self.sentences_batch([text])[0]
+
+    def _from_doc(self, doc, features: Set[str]) -> ParsedText:
+        """Turn a spaCy Doc into plain Python values."""
+        # Whitespace-only "sentences" (blank lines) are dropped, so indices match parsed.sentences
+        sentence_spans = [span for span in doc.sents if span.text.strip()]
+        starts = [span.start for span in sentence_spans]
+        parsed = ParsedText()
+
+        if SENTENCES in features:
+            parsed.sentences = [span.text.strip() for span in sentence_spans]
+        if LEMMAS in features:
+            parsed.lemmas = [(token.lemma_ or token.text).lower() for token in doc if token.is_alpha]
+        if NOUN_CHUNKS in features and doc.has_annotation("DEP"):
+            parsed.noun_chunks = [(chunk.text, bisect_right(starts, chunk.start) - 1) for chunk in doc.noun_chunks]
+        if ENTITIES in features:
+            parsed.entities = [(ent.text, ent.label_, bisect_right(starts, ent.start) - 1) for ent in doc.ents]
+        return parsed
+
+    @staticmethod
+    def _parse_with_nltk(text: str, features: Set[str]) -> ParsedText:
+        """Sentences and (unlemmatized) words from NLTK when spaCy is not installed."""
+        from nltk.tokenize import sent_tokenize, word_tokenize
+
+        parsed = ParsedText(sentences=sent_tokenize(text))
+        if LEMMAS in features:
+            parsed.lemmas = [word.lower() for word in word_tokenize(text) if word.isalpha()]
+        return parsed
+
+
+_layers: Dict[str, LinguisticLayer] = {}
+_layers_lock = threading.Lock()
+
+
+def get_linguistic_layer(model_name: Optional[str] = None) -> LinguisticLayer:
+    """
+    The process-wide layer for a spaCy pipeline, so the summarizer and the
+    mood detector share one loaded model.
+
+    Args:
+        model_name (str): spaCy pipeline (defaults to SPACY_MODEL, else en_core_web_sm)
+
+    Returns:
+        LinguisticLayer: Shared layer
+    """
+    model_name = model_name or os.getenv("SPACY_MODEL", DEFAULT_SPACY_MODEL)
+    with _layers_lock:
+        if model_name not in _layers:
+            _layers[model_name] = LinguisticLayer(model_name)
+        return _layers[model_name]
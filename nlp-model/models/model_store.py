@@ -0,0 +1,150 @@
+"""
+Model Store
+Local copy of hub checkpoints as safetensors files, memory-mapped at load time.
+"""
+
+import contextlib
+import glob
+import os
+import shutil
+import time
+from typing import Any, Tuple
+
+from transformers import (
+    AutoConfig,
+    AutoModelForSeq2SeqLM,
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    pipeline,
+)
+
+DEFAULT_MODEL_STORE = os.path.join(os.path.dirname(__file__), '..', 'cache', 'model_store')
+
+MODEL_CLASSES = {
+    "summarization": AutoModelForSeq2SeqLM,
+    "sentiment-analysis": AutoModelForSequenceClassification,
+    "text-classification": AutoModelForSequenceClassification,
+}
+
+
+def model_store_enabled() -> bool:
+    """Whether models should be served from the local store (MODEL_STORE=1)."""
+    return os.getenv("MODEL_STORE", "0").lower() in ("1", "true", "yes")
+
+
+def _store_dir(model_name: str) -> str:
+    root = os.getenv("MODEL_STORE_DIR", DEFAULT_MODEL_STORE)
+    return os.path.join(root, model_name.replace("/", "__"))
+
+
+def _skip_init():
+    """Context that skips random weight init; every weight is replaced from the store anyway."""
+    try:
+        from transformers.modeling_utils import no_init_weights
+        return no_init_weights()
+    except ImportError:
+        return contextlib.nullcontext()
+
+
+def _export(model_name: str, model_cls, store_dir: str):
+    """Download a checkpoint once and save it as safetensors."""
+    print(f"Adding {model_name} to the model store (one-time)...")
+    model = model_cls.from_pretrained(model_name)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+    # Save to a private directory first so concurrent processes never load a half-written copy
+    staging_dir = f"{store_dir}.tmp{os.getpid()}"
+    model.save_pretrained(staging_dir, safe_serialization=True)
+    tokenizer.save_pretrained(staging_dir)
+    try:
+        os.rename(staging_dir, store_dir)
+    except OSError:
+        # Another process finished first
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def load_mapped_model(model_name: str, model_cls) -> Tuple[Any, Any]:
+    """
+    Load a model whose weights are memory-mapped from the store.
+
+    The module is built without initializing its weights, and the safetensors
+    tensors (backed by a private mmap of the file) are assigned in place of its
+    parameters rather than copied into them. Startup is mostly page-table
+    work, and all processes loading the same file share its page cache.
+
+    Args:
+        model_name (str): Hugging Face model id
+        model_cls: transformers Auto class, e.g. AutoModelForSeq2SeqLM
+
+    Returns:
+        Tuple: The model in eval mode and its tokenizer
+    """
+    from safetensors.torch import load_file
+
+    store_dir = _store_dir(model_name)
+    if not glob.glob(os.path.join(store_dir, "*.safetensors")):
+        _export(model_name, model_cls, store_dir)
+
+    config = AutoConfig.from_pretrained(store_dir)
+    with _skip_init():
+        model = model_cls.from_config(config)
+
+    state_dict = {}
+    for path in sorted(glob.glob(os.path.join(store_dir, "*.safetensors"))):
+        state_dict.update(load_file(path))
+
+    missing, _ = model.load_state_dict(state_dict, strict=False, assign=True)
+    # Tied weights (e.g. BART's shared embeddings / lm_head) are stored once
+    model.tie_weights()
+
+    loaded = {tensor.data_ptr() for tensor in state_dict.values()}
+    current = model.state_dict()
+    not_loaded = [key for key in missing if current[key].data_ptr() not in loaded]
+    if not_loaded:
+        raise ValueError(f"Model store copy of {model_name} is missing weights: {not_loaded[:5]}")
+
+    model.config._name_or_path = model_name
+    return model.eval(), AutoTokenizer.from_pretrained(store_dir)
+
+
+def load_model(model_name: str, model_cls) -> Tuple[Any, Any]:
+    """
+    Load a model and tokenizer, from the store if enabled, else from the hub cache.
+
+    Returns:
+        Tuple: The model in eval mode and its tokenizer
+    """
+    if model_store_enabled():
+        try:
+            return load_mapped_model(model_name, model_cls)
+        except Exception as e:
+            print(f"Warning: Could not load {model_name} from the model store: {e}")
+
+    return model_cls.from_pretrained(model_name).eval(), AutoTokenizer.from_pretrained(model_name)
+
+
+def load_pipeline(task: str, model_name: str):
+    """
+    Build a transformers pipeline, memory-mapping the weights from the store if enabled.
+
+    Args:
+        task (str): Pipeline task, e.g. "summarization"
+        model_name (str): Hugging Face model id
+
+    Returns:
+        A transformers pipeline
+    """
+    start_time = time.perf_counter()
+
+    if model_store_enabled():
+        try:
+            model, tokenizer = load_mapped_model(model_name, MODEL_CLASSES[task])
+            loaded = pipeline(task, model=model, tokenizer=tokenizer)
+            print(f"Loaded {model_name} from the model store in {time.perf_counter() - start_time:.2f}s")
+            return loaded
+        except Exception as e:
+            print(f"Warning: Could not load {model_name} from the model store: {e}")
+
+    loaded = pipeline(task, model=model_name, tokenizer=model_name)
+    print(f"Loaded {model_name} in {time.perf_counter() - start_time:.2f}s")
+    return loaded
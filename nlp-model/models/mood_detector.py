@@ -3,20 +3,40 @@ Mood Detection Model
 Analyzes text sentiment and emotional state to detect user mood.
 """
 
+import os
 import re
-from typing import Dict, List, Tuple
-from textblob import TextBlob
-from transformers import pipeline
-import numpy as np
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from typing import Dict, List, Optional, Tuple
+from sentence_cache import SentenceCache
+from linguistics import get_linguistic_layer
+
+# transformers, torch, textblob and nltk are imported where they are first
+# needed, so importing this module (e.g. for a motivation-only path) stays cheap
 
 class MoodDetector:
-    def __init__(self):
-        """Initialize the mood detector with sentiment analysis models."""
+    def __init__(self, incremental: bool = False, backend: str = "torch", fused: bool = False):
+        """
+        Initialize the mood detector with sentiment analysis models.
+        
+        Args:
+            incremental (bool): Score text sentence by sentence and aggregate cached
+                sentence scores, so re-analyzing an edited entry only runs the
+                models on new or changed sentences
+            backend (str): Inference backend for the transformer classifiers,
+                "torch" or "onnx" (falls back to torch if onnxruntime is missing)
+            fused (bool): Use the fused mood engine, which gets sentiment and emotions
+                from one shared encoder pass (needs the head built by
+                build_fused_mood_model.py; falls back to the separate models)
+        """
         self.sentiment_analyzer = None
         self.emotion_classifier = None
+        self.incremental = incremental
+        self.backend = backend
+        self.fused = fused
+        self.backends = {"sentiment": "none", "emotion": "none"}
+        self.sentence_sentiment_cache = SentenceCache()
+        self.sentence_emotion_cache = SentenceCache()
+        # Sentence splits, shared with the summarizer
+        self.linguistics = get_linguistic_layer()
         self._download_nltk_data()
         self._initialize_models()
         
@@ -39,10 +59,19 @@ class MoodDetector:
     
     def _download_nltk_data(self):
         """Download required NLTK data."""
+        import nltk
+        
         try:
-            nltk.data.find('tokenizers/punkt')
+            nltk.data.find('tokenizers/punkt_tab')
         except LookupError:
-            nltk.download('punkt')
+            try:
+                nltk.download('punkt_tab')
+            except:
+                # Fallback to punkt for older NLTK versions
+                try:
+                    nltk.data.find('tokenizers/punkt')
+                except LookupError:
+                    nltk.download('punkt')
         
         try:
             nltk.data.find('corpora/stopwords')
@@ -51,32 +80,69 @@ class MoodDetector:
     
     def _initialize_models(self):
         """Initialize pre-trained sentiment analysis models."""
+        if self.fused:
+            try:
+                from fused_mood import DEFAULT_FUSED_HEAD, FusedMoodEngine
+                engine = FusedMoodEngine(os.getenv("FUSED_MOOD_HEAD", DEFAULT_FUSED_HEAD))
+                self.sentiment_analyzer = engine.sentiment
+                self.emotion_classifier = engine.emotion
+                self.backends = {"sentiment": "fused", "emotion": "fused"}
+                return
+            except Exception as e:
+                print(f"Warning: Could not load fused mood engine, using separate models: {e}")
+        
         try:
+            from onnx_backend import load_classifier
+            
             # Initialize transformer-based sentiment analyzer
-            self.sentiment_analyzer = pipeline(
+            self.sentiment_analyzer, self.backends["sentiment"] = load_classifier(
                 "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest"
+                "cardiffnlp/twitter-roberta-base-sentiment-latest",
+                self.backend
             )
         except Exception as e:
             print(f"Warning: Could not load RoBERTa model: {e}")
             try:
                 # Fallback to DistilBERT
+                from transformers import pipeline
                 self.sentiment_analyzer = pipeline("sentiment-analysis")
+                self.backends["sentiment"] = "torch"
             except Exception as e2:
                 print(f"Warning: Could not load fallback sentiment model: {e2}")
                 self.sentiment_analyzer = None
         
         try:
+            from onnx_backend import load_classifier
+            
             # Initialize emotion classification model
-            self.emotion_classifier = pipeline(
+            self.emotion_classifier, self.backends["emotion"] = load_classifier(
                 "text-classification",
-                model="j-hartmann/emotion-english-distilroberta-base"
+                "j-hartmann/emotion-english-distilroberta-base",
+                self.backend
             )
         except Exception as e:
             print(f"Warning: Could not load emotion classifier: {e}")
             self.emotion_classifier = None
     
-    def _preprocess_text(self, text: str) -> str:
+    def get_model_version(self) -> str:
+        """Identify the models behind this detector, e.g. for keying cached results."""
+        names = []
+        for component in (self.sentiment_analyzer, self.emotion_classifier):
+            model = getattr(component, "model", None)
+            config = getattr(model, "config", None)
+            names.append(
+                getattr(component, "name_or_path", None)
+                or getattr(model, "name_or_path", None)
+                or getattr(config, "_name_or_path", None)
+                or "none"
+            )
+        # Only sentence-level scoring depends on how text is split into sentences
+        mode = f"incremental@{self.linguistics.get_version()}" if self.incremental else "document"
+        # ONNX and PyTorch scores differ slightly, so cached results are kept per backend
+        return (f"sentiment={names[0]}@{self.backends['sentiment']};"
+                f"emotion={names[1]}@{self.backends['emotion']};mode={mode}")
+    
+    def preprocess_text(self, text: str) -> str:
         """Preprocess text for better analysis."""
         # Remove URLs, mentions, and hashtags
         text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
@@ -90,6 +156,8 @@ class MoodDetector:
     
     def analyze_sentiment_basic(self, text: str) -> Dict:
         """Basic sentiment analysis using TextBlob."""
+        from textblob import TextBlob
+        
         blob = TextBlob(text)
         polarity = blob.sentiment.polarity  # -1 to 1
         subjectivity = blob.sentiment.subjectivity  # 0 to 1
@@ -115,77 +183,214 @@ class MoodDetector:
             return self.analyze_sentiment_basic(text)
         
         try:
-            result = self.sentiment_analyzer(text)
-            label = result[0]['label'].lower()
-            score = result[0]['score']
+            if self.incremental:
+                distribution = self._sentence_distributions(
+                    [text], self.sentiment_analyzer, self.sentence_sentiment_cache
+                )[0]
+                return self._format_sentiment(self._ranked_predictions(distribution)[0])
             
-            # Map model labels to standard format
-            if 'positive' in label or 'pos' in label:
-                sentiment = "positive"
-            elif 'negative' in label or 'neg' in label:
-                sentiment = "negative"
-            else:
-                sentiment = "neutral"
-            
-            return {
-                "sentiment": sentiment,
-                "confidence": round(score, 3),
-                "raw_label": result[0]['label'],
-                "raw_score": score
-            }
+            result = self.sentiment_analyzer(text)
+            return self._format_sentiment(result[0])
         
         except Exception as e:
             print(f"Advanced sentiment analysis failed: {e}")
             return self.analyze_sentiment_basic(text)
     
+    def analyze_sentiment_advanced_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Advanced sentiment analysis for several texts in one pipeline call.
+        
+        Args:
+            texts (List[str]): Texts to analyze
+            
+        Returns:
+            List[Dict]: One sentiment result per input text, in input order
+        """
+        if not texts:
+            return []
+        
+        if not self.sentiment_analyzer:
+            return [self.analyze_sentiment_basic(text) for text in texts]
+        
+        try:
+            if self.incremental:
+                distributions = self._sentence_distributions(
+                    texts, self.sentiment_analyzer, self.sentence_sentiment_cache
+                )
+                return [self._format_sentiment(self._ranked_predictions(d)[0]) for d in distributions]
+            
+            results = self.sentiment_analyzer(list(texts), batch_size=len(texts))
+            return [self._format_sentiment(self._first_prediction(r)) for r in results]
+        
+        except Exception as e:
+            # One bad input should not fail the whole batch
+            print(f"Batched sentiment analysis failed, retrying per text: {e}")
+            return [self.analyze_sentiment_advanced(text) for text in texts]
+    
+    def _format_sentiment(self, prediction: Dict) -> Dict:
+        """Map a raw sentiment pipeline prediction to the standard format."""
+        label = prediction['label'].lower()
+        score = prediction['score']
+        
+        # Map model labels to standard format
+        if 'positive' in label or 'pos' in label:
+            sentiment = "positive"
+        elif 'negative' in label or 'neg' in label:
+            sentiment = "negative"
+        else:
+            sentiment = "neutral"
+        
+        return {
+            "sentiment": sentiment,
+            "confidence": round(score, 3),
+            "raw_label": prediction['label'],
+            "raw_score": score
+        }
+    
+    @staticmethod
+    def _first_prediction(result) -> Dict:
+        """Pipelines return a dict per input for batches and a list for single texts."""
+        return result[0] if isinstance(result, list) else result
+    
     def detect_emotions(self, text: str) -> Dict:
         """Detect specific emotions in text."""
         emotions = {}
         
         if self.emotion_classifier:
             try:
-                # Use transformer-based emotion classification
-                result = self.emotion_classifier(text)
-                primary_emotion = result[0]['label'].lower()
-                confidence = result[0]['score']
-                
-                emotions = {
-                    "primary_emotion": primary_emotion,
-                    "confidence": round(confidence, 3),
-                    "all_emotions": [{
-                        "emotion": r['label'].lower(),
-                        "score": round(r['score'], 3)
-                    } for r in result]
-                }
+                if self.incremental:
+                    distribution = self._sentence_distributions(
+                        [text], self.emotion_classifier, self.sentence_emotion_cache
+                    )[0]
+                    emotions = self._format_emotions(self._ranked_predictions(distribution))
+                else:
+                    # Use transformer-based emotion classification
+                    result = self.emotion_classifier(text)
+                    emotions = self._format_emotions(result)
             
             except Exception as e:
                 print(f"Transformer emotion detection failed: {e}")
         
         # Fallback to keyword-based emotion detection
         if not emotions:
-            text_lower = text.lower()
-            emotion_scores = {}
+            emotions = self._detect_emotions_by_keywords(text)
+        
+        return emotions
+    
+    def detect_emotions_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Detect emotions for several texts in one classifier call.
+        
+        Args:
+            texts (List[str]): Texts to analyze
             
-            for emotion, keywords in self.emotion_keywords.items():
-                score = sum(1 for keyword in keywords if keyword in text_lower)
-                if score > 0:
-                    emotion_scores[emotion] = score
+        Returns:
+            List[Dict]: One emotion result per input text, in input order
+        """
+        if not texts:
+            return []
+        
+        if not self.emotion_classifier:
+            return [self._detect_emotions_by_keywords(text) for text in texts]
+        
+        try:
+            if self.incremental:
+                distributions = self._sentence_distributions(
+                    texts, self.emotion_classifier, self.sentence_emotion_cache
+                )
+                return [self._format_emotions(self._ranked_predictions(d)) for d in distributions]
             
-            if emotion_scores:
-                primary_emotion = max(emotion_scores.items(), key=lambda x: x[1])[0]
-                emotions = {
-                    "primary_emotion": primary_emotion,
-                    "confidence": min(emotion_scores[primary_emotion] / 10, 1.0),
-                    "detected_emotions": emotion_scores
-                }
-            else:
-                emotions = {
-                    "primary_emotion": "neutral",
-                    "confidence": 0.5,
-                    "detected_emotions": {}
-                }
+            results = self.emotion_classifier(list(texts), batch_size=len(texts))
+            return [
+                self._format_emotions(r if isinstance(r, list) else [r])
+                for r in results
+            ]
         
-        return emotions
+        except Exception as e:
+            print(f"Batched emotion detection failed, retrying per text: {e}")
+            return [self.detect_emotions(text) for text in texts]
+    
+    def _format_emotions(self, result: List[Dict]) -> Dict:
+        """Map raw emotion classifier predictions to the standard format."""
+        return {
+            "primary_emotion": result[0]['label'].lower(),
+            "confidence": round(result[0]['score'], 3),
+            "all_emotions": [{
+                "emotion": r['label'].lower(),
+                "score": round(r['score'], 3)
+            } for r in result]
+        }
+    
+    def _sentence_distributions(self, texts: List[str], classifier, cache: SentenceCache) -> List[Dict[str, float]]:
+        """
+        Label distribution per text, aggregated from per-sentence scores.
+        
+        Only sentences missing from the cache are sent to the classifier (in one
+        batch); each text's distribution is the word-count weighted average of
+        its sentences' distributions.
+        """
+        split = self.linguistics.sentences_batch(texts)
+        sentence_lists = [sentences or [text] for text, sentences in zip(texts, split)]
+        unique_sentences = list(dict.fromkeys(s for sentences in sentence_lists for s in sentences))
+        
+        distributions, missing = cache.get_many(unique_sentences)
+        if missing:
+            predictions = classifier(
+                [unique_sentences[i] for i in missing],
+                top_k=None,
+                truncation=True,
+                batch_size=len(missing)
+            )
+            for i, prediction in zip(missing, predictions):
+                prediction = prediction if isinstance(prediction, list) else [prediction]
+                distribution = {p['label']: p['score'] for p in prediction}
+                cache.set(unique_sentences[i], distribution)
+                distributions[i] = distribution
+        
+        by_sentence = dict(zip(unique_sentences, distributions))
+        aggregated = []
+        for sentences in sentence_lists:
+            weights = [max(1, len(sentence.split())) for sentence in sentences]
+            total = sum(weights)
+            distribution: Dict[str, float] = {}
+            for sentence, weight in zip(sentences, weights):
+                for label, score in by_sentence[sentence].items():
+                    distribution[label] = distribution.get(label, 0.0) + score * weight / total
+            aggregated.append(distribution)
+        
+        return aggregated
+    
+    @staticmethod
+    def _ranked_predictions(distribution: Dict[str, float]) -> List[Dict]:
+        """Turn a label distribution into pipeline-style predictions, best first."""
+        return [
+            {"label": label, "score": score}
+            for label, score in sorted(distribution.items(), key=lambda x: x[1], reverse=True)
+        ]
+    
+    def _detect_emotions_by_keywords(self, text: str) -> Dict:
+        """Keyword-based emotion detection used when no classifier is available."""
+        text_lower = text.lower()
+        emotion_scores = {}
+        
+        for emotion, keywords in self.emotion_keywords.items():
+            score = sum(1 for keyword in keywords if keyword in text_lower)
+            if score > 0:
+                emotion_scores[emotion] = score
+        
+        if emotion_scores:
+            primary_emotion = max(emotion_scores.items(), key=lambda x: x[1])[0]
+            return {
+                "primary_emotion": primary_emotion,
+                "confidence": min(emotion_scores[primary_emotion] / 10, 1.0),
+                "detected_emotions": emotion_scores
+            }
+        
+        return {
+            "primary_emotion": "neutral",
+            "confidence": 0.5,
+            "detected_emotions": {}
+        }
     
     def analyze_mood_indicators(self, text: str) -> Dict:
         """Analyze various mood indicators in text."""
@@ -229,15 +434,10 @@ class MoodDetector:
     def comprehensive_mood_analysis(self, text: str) -> Dict:
         """Perform comprehensive mood analysis combining multiple approaches."""
         if not text or len(text.strip()) == 0:
-            return {
-                "overall_mood": "neutral",
-                "confidence": 0.0,
-                "mood_category": "unknown",
-                "details": "No text provided for analysis."
-            }
+            return self._empty_mood_analysis()
         
         # Preprocess text
-        processed_text = self._preprocess_text(text)
+        processed_text = self.preprocess_text(text)
         
         # Get sentiment analysis
         sentiment = self.analyze_sentiment_advanced(processed_text)
@@ -248,6 +448,40 @@ class MoodDetector:
         # Get mood indicators
         indicators = self.analyze_mood_indicators(processed_text)
         
+        return self.build_mood_analysis(sentiment, emotions, indicators)
+    
+    def comprehensive_mood_analysis_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Comprehensive mood analysis for several texts, sharing model calls.
+        
+        Args:
+            texts (List[str]): Texts to analyze
+            
+        Returns:
+            List[Dict]: One mood analysis per input text, in input order
+        """
+        results: List[Optional[Dict]] = [None] * len(texts)
+        positions = []
+        processed_texts = []
+        
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) == 0:
+                results[i] = self._empty_mood_analysis()
+            else:
+                positions.append(i)
+                processed_texts.append(self.preprocess_text(text))
+        
+        sentiments = self.analyze_sentiment_advanced_batch(processed_texts)
+        emotions = self.detect_emotions_batch(processed_texts)
+        
+        for i, processed_text, sentiment, emotion in zip(positions, processed_texts, sentiments, emotions):
+            indicators = self.analyze_mood_indicators(processed_text)
+            results[i] = self.build_mood_analysis(sentiment, emotion, indicators)
+        
+        return results
+    
+    def build_mood_analysis(self, sentiment: Dict, emotions: Dict, indicators: Dict) -> Dict:
+        """Combine sentiment, emotion and indicator results into a full mood analysis."""
         # Determine overall mood
         overall_mood, mood_category = self._determine_overall_mood(sentiment, emotions, indicators)
         
@@ -268,6 +502,15 @@ class MoodDetector:
             "suggestions": self._get_mood_suggestions(overall_mood, indicators)
         }
     
+    def _empty_mood_analysis(self) -> Dict:
+        """Result returned when there is no text to analyze."""
+        return {
+            "overall_mood": "neutral",
+            "confidence": 0.0,
+            "mood_category": "unknown",
+            "details": "No text provided for analysis."
+        }
+    
     def _determine_overall_mood(self, sentiment: Dict, emotions: Dict, indicators: Dict) -> Tuple[str, str]:
         """Determine overall mood from analysis components."""
         sentiment_label = sentiment.get('sentiment', 'neutral')
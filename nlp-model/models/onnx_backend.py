@@ -0,0 +1,107 @@
+"""
+ONNX Runtime Backend
+Exports Hugging Face text classifiers to ONNX once and serves them through onnxruntime.
+"""
+
+import os
+import shutil
+from typing import Any, Tuple
+
+from transformers import AutoTokenizer, pipeline
+
+from model_store import load_pipeline
+
+DEFAULT_ONNX_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache', 'onnx')
+
+
+def onnx_available() -> bool:
+    """Whether onnxruntime and the optimum exporter are installed."""
+    try:
+        import onnxruntime  # noqa: F401
+        from optimum.onnxruntime import ORTModelForSequenceClassification  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _export_dir(model_name: str) -> str:
+    cache_dir = os.getenv("ONNX_CACHE_DIR", DEFAULT_ONNX_DIR)
+    return os.path.join(cache_dir, model_name.replace("/", "__"))
+
+
+def _is_complete_export(export_dir: str) -> bool:
+    """Whether a directory holds a finished export (graph and config)."""
+    return all(os.path.isfile(os.path.join(export_dir, name)) for name in ("model.onnx", "config.json"))
+
+
+def load_onnx_classifier(task: str, model_name: str):
+    """
+    Build a text classification pipeline backed by an onnxruntime session.
+
+    The model is exported to ONNX on first use and the artifacts are saved
+    under ONNX_CACHE_DIR, so later starts load the exported graph directly.
+
+    Args:
+        task (str): Pipeline task, e.g. "sentiment-analysis"
+        model_name (str): Hugging Face model id
+
+    Returns:
+        A transformers pipeline with the same call interface as the PyTorch one
+    """
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    export_dir = _export_dir(model_name)
+    if not _is_complete_export(export_dir):
+        print(f"Exporting {model_name} to ONNX (one-time)...")
+        model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        # Save to a private directory first so concurrent workers never load a half-written export
+        staging_dir = f"{export_dir}.tmp{os.getpid()}"
+        model.save_pretrained(staging_dir)
+        tokenizer.save_pretrained(staging_dir)
+
+        # A directory left behind by an interrupted export would make the rename fail on every start
+        if os.path.exists(export_dir) and not _is_complete_export(export_dir):
+            print(f"Warning: Removing incomplete ONNX export at {export_dir}")
+            shutil.rmtree(export_dir, ignore_errors=True)
+        try:
+            os.rename(staging_dir, export_dir)
+        except OSError:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            # Fine if another worker finished its export first
+            if not _is_complete_export(export_dir):
+                raise
+
+    model = ORTModelForSequenceClassification.from_pretrained(export_dir, session_options=session_options)
+    tokenizer = AutoTokenizer.from_pretrained(export_dir)
+    return pipeline(task, model=model, tokenizer=tokenizer)
+
+
+def load_classifier(task: str, model_name: str, backend: str = "torch") -> Tuple[Any, str]:
+    """
+    Load a text classifier with the requested backend.
+
+    Args:
+        task (str): Pipeline task, e.g. "text-classification"
+        model_name (str): Hugging Face model id
+        backend (str): "onnx" or "torch"; "onnx" falls back to PyTorch when
+            onnxruntime is not installed or the export fails
+
+    Returns:
+        Tuple: The pipeline and the backend actually used
+    """
+    if backend == "onnx":
+        if onnx_available():
+            try:
+                return load_onnx_classifier(task, model_name), "onnx"
+            except Exception as e:
+                print(f"Warning: Could not load {model_name} with ONNX Runtime, using PyTorch: {e}")
+        else:
+            print("Warning: onnxruntime/optimum not installed, using PyTorch")
+
+    return load_pipeline(task, model_name), "torch"
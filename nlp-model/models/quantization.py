@@ -0,0 +1,83 @@
+"""
+Summarizer Quantization
+Dynamic int8 quantization of seq2seq summarization models for CPU inference.
+"""
+
+import os
+import shutil
+
+import torch
+from transformers import AutoConfig, AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+
+DEFAULT_QUANTIZED_DIR = os.path.join(os.path.dirname(__file__), '..', 'cache', 'quantized')
+WEIGHTS_FILE = "quantized_state_dict.pt"
+
+
+def _quantized_dir(model_name: str) -> str:
+    cache_dir = os.getenv("QUANTIZED_MODEL_DIR", DEFAULT_QUANTIZED_DIR)
+    return os.path.join(cache_dir, model_name.replace("/", "__") + "__int8")
+
+
+def quantize_model(model):
+    """Replace the model's linear layers with dynamically quantized int8 ones."""
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _save_quantized(model, tokenizer, save_dir: str):
+    # Write to a private directory first so concurrent workers never load a half-written model
+    staging_dir = f"{save_dir}.tmp{os.getpid()}"
+    os.makedirs(staging_dir, exist_ok=True)
+    model.config.save_pretrained(staging_dir)
+    tokenizer.save_pretrained(staging_dir)
+    torch.save(model.state_dict(), os.path.join(staging_dir, WEIGHTS_FILE))
+    try:
+        os.rename(staging_dir, save_dir)
+    except OSError:
+        # Another worker finished first
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _load_saved_quantized(model_name: str, save_dir: str):
+    config = AutoConfig.from_pretrained(save_dir)
+    # Build the quantized module structure from the config alone; the fp32
+    # checkpoint is never downloaded or loaded again
+    model = quantize_model(AutoModelForSeq2SeqLM.from_config(config))
+    # Only the state dict is saved (int8 tensors, scales, dtypes), so the weights-only
+    # unpickler can read it and never runs code from the writable cache
+    model.load_state_dict(torch.load(os.path.join(save_dir, WEIGHTS_FILE), map_location="cpu", weights_only=True))
+    model.config._name_or_path = model_name
+    model.eval()
+    return model, AutoTokenizer.from_pretrained(save_dir)
+
+
+def load_quantized_summarizer(model_name: str):
+    """
+    Build a summarization pipeline whose linear layers run in int8.
+
+    The first start quantizes the fp32 model and saves the quantized weights
+    under QUANTIZED_MODEL_DIR; later starts load them directly and skip the
+    conversion.
+
+    Args:
+        model_name (str): Hugging Face model id, e.g. "facebook/bart-large-cnn"
+
+    Returns:
+        A transformers summarization pipeline running on CPU
+    """
+    save_dir = _quantized_dir(model_name)
+
+    model = None
+    if os.path.exists(os.path.join(save_dir, WEIGHTS_FILE)):
+        try:
+            model, tokenizer = _load_saved_quantized(model_name, save_dir)
+        except Exception as e:
+            print(f"Warning: Could not load the saved int8 weights, quantizing again: {e}")
+            shutil.rmtree(save_dir, ignore_errors=True)
+
+    if model is None:
+        print(f"Quantizing {model_name} to int8 (one-time)...")
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = quantize_model(AutoModelForSeq2SeqLM.from_pretrained(model_name).eval())
+        _save_quantized(model, tokenizer, save_dir)
+
+    return pipeline("summarization", model=model, tokenizer=tokenizer, device=-1)
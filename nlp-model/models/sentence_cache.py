@@ -0,0 +1,82 @@
+"""
+Sentence Cache
+Bounded LRU cache of per-sentence analysis results keyed by sentence hash.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class SentenceCache:
+    """
+    Thread-safe LRU cache for values computed from a single sentence.
+
+    Used by the incremental modes of ``MoodDetector`` and ``TextSummarizer``:
+    when an entry is edited, only sentences whose hash is not cached yet have
+    to go through the models again.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of cached sentences
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(sentence: str) -> str:
+        """Hash of the whitespace-normalized sentence."""
+        normalized = re.sub(r'\s+', ' ', sentence).strip()
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def get_many(self, sentences: List[str]) -> Tuple[List[Optional[Any]], List[int]]:
+        """
+        Look up several sentences at once.
+
+        Args:
+            sentences (List[str]): Sentences to look up
+
+        Returns:
+            Tuple: Cached values (None where missing) and the indices of the missing sentences
+        """
+        values: List[Optional[Any]] = []
+        missing: List[int] = []
+
+        with self._lock:
+            for i, sentence in enumerate(sentences):
+                key = self.key(sentence)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    values.append(self._entries[key])
+                    self.hits += 1
+                else:
+                    values.append(None)
+                    missing.append(i)
+                    self.misses += 1
+
+        return values, missing
+
+    def set(self, sentence: str, value: Any):
+        """Cache the value computed for a sentence."""
+        key = self.key(sentence)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics."""
+        with self._lock:
+            size = len(self._entries)
+        return {"size": size, "max_entries": self.max_entries, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,97 @@
+"""
+Sentence Graph Ranking
+LexRank-style centrality over a sparse sentence-similarity graph, with MMR selection
+so that the chosen sentences do not repeat each other.
+"""
+
+from typing import List
+
+import numpy as np
+from scipy import sparse
+
+
+def sentence_similarity(tfidf_matrix, threshold: float = 0.1) -> sparse.csr_matrix:
+    """
+    Cosine similarity between the sentences of one document as a sparse graph.
+
+    Args:
+        tfidf_matrix: Sentence-term matrix with L2-normalized rows (sparse or dense)
+        threshold (float): Similarities below this are dropped, which keeps the graph sparse
+
+    Returns:
+        sparse.csr_matrix: Symmetric sentence-sentence weights without self-loops
+    """
+    vectors = sparse.csr_matrix(tfidf_matrix)
+    similarity = (vectors @ vectors.T).tocsr()
+    similarity = similarity - sparse.diags(similarity.diagonal())
+    similarity.data[similarity.data < threshold] = 0
+    similarity.eliminate_zeros()
+    return similarity
+
+
+def lexrank_scores(similarity: sparse.csr_matrix, damping: float = 0.85,
+                   tolerance: float = 1e-6, max_iterations: int = 100) -> np.ndarray:
+    """
+    Centrality of each sentence by power iteration over the weighted graph.
+
+    Args:
+        similarity (sparse.csr_matrix): Graph from ``sentence_similarity``
+        damping (float): Probability of following an edge rather than jumping anywhere
+        tolerance (float): Stop when the scores change by less than this (L1)
+        max_iterations (int): Upper bound on iterations
+
+    Returns:
+        np.ndarray: One score per sentence, summing to 1
+    """
+    n = similarity.shape[0]
+    if n == 0:
+        return np.zeros(0)
+
+    out_weight = np.asarray(similarity.sum(axis=1)).ravel()
+    inverse = np.divide(1.0, out_weight, out=np.zeros(n), where=out_weight > 0)
+    # Column-stochastic transposed transition matrix; isolated sentences spread their score evenly
+    transition_t = (sparse.diags(inverse) @ similarity).T.tocsr()
+    isolated = out_weight == 0
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(max_iterations):
+        updated = damping * (transition_t @ scores + scores[isolated].sum() / n) + (1 - damping) / n
+        converged = np.abs(updated - scores).sum() < tolerance
+        scores = updated
+        if converged:
+            break
+    return scores
+
+
+def mmr_select(scores: np.ndarray, similarity: sparse.csr_matrix, count: int, diversity: float = 0.3) -> List[int]:
+    """
+    Pick sentences by maximal marginal relevance.
+
+    Each step takes the sentence with the best trade-off between its own
+    score and its similarity to the sentences already picked.
+
+    Args:
+        scores (np.ndarray): Sentence scores, e.g. from ``lexrank_scores``
+        similarity (sparse.csr_matrix): Sentence-sentence similarities
+        count (int): Number of sentences to pick
+        diversity (float): Weight of the redundancy penalty (0 ranks by score alone)
+
+    Returns:
+        List[int]: Indices of the picked sentences, in document order
+    """
+    n = len(scores)
+    top = scores.max() if n else 0
+    relevance = scores / top if top > 0 else scores
+
+    redundancy = np.zeros(n)
+    available = np.ones(n, dtype=bool)
+    selected = []
+    for _ in range(min(count, n)):
+        marginal = (1 - diversity) * relevance - diversity * redundancy
+        marginal[~available] = -np.inf
+        best = int(np.argmax(marginal))
+        selected.append(best)
+        available[best] = False
+        redundancy = np.maximum(redundancy, similarity.getrow(best).toarray().ravel())
+
+    return sorted(selected)
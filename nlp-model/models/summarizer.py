@@ -4,24 +4,168 @@ Provides extractive and abstractive summarization capabilities.
 """
 
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
-from sklearn.feature_extraction.text import TfidfVectorizer
-import numpy as np
+from sentence_cache import SentenceCache
+
+# transformers, torch, sklearn, nltk and numpy are imported where they are first
+# needed, so importing this module (e.g. for a motivation-only path) stays cheap
+
+def _pretokenized(tokens: List[str]) -> List[str]:
+    """Analyzer for documents that are already lists of tokens."""
+    return tokens
+
+class DocumentAnalysis:
+    """
+    Parse and TF-IDF matrix of one document, each computed at most once.
+    
+    The extractive summary ranks sentences by their rows of the matrix and the
+    key phrases rank terms by its columns (or draw candidates from the noun
+    chunks and entities of the same parse), so both come from a single
+    parse and a single TF-IDF fit.
+    """
+    
+    def __init__(self, summarizer: "TextSummarizer", text: str):
+        self.text = text
+        self._summarizer = summarizer
+        self._parsed = None
+        self._tfidf = None
+        self._lock = threading.Lock()
+    
+    @property
+    def parsed(self):
+        """linguistics.ParsedText with the features of TextSummarizer.document_features()."""
+        if self._parsed is None:
+            with self._lock:
+                if self._parsed is None:
+                    self._parsed = self._summarizer.parse_documents([self.text])[0]
+        return self._parsed
+    
+    @property
+    def sentences(self) -> List[str]:
+        return self.parsed.sentences
+    
+    def set_parsed(self, parsed):
+        """Use a parse made elsewhere (e.g. in a batch), unless already parsed."""
+        with self._lock:
+            if self._parsed is None:
+                self._parsed = parsed
+    
+    def tfidf(self):
+        """
+        Returns:
+            Tuple: Sentence-term TF-IDF matrix and the feature names
+        """
+        if self._tfidf is None:
+            sentences = self.sentences
+            with self._lock:
+                if self._tfidf is None:
+                    self._tfidf = self._summarizer._fit_tfidf(sentences)
+        return self._tfidf
+    
+    def top_sentences(self, num_sentences: int) -> List[str]:
+        """The highest-scoring sentences, in document order."""
+        import numpy as np
+        
+        tfidf_matrix, _ = self.tfidf()
+        sentence_scores = np.array(tfidf_matrix.sum(axis=1)).flatten()
+        
+        top_indices = sentence_scores.argsort()[-num_sentences:][::-1]
+        top_indices.sort()  # Maintain original order
+        return [self.sentences[i] for i in top_indices]
+    
+    def graph_sentences(self, num_sentences: int) -> List[str]:
+        """
+        The most central sentences by LexRank over the sentence-similarity
+        graph, chosen with an MMR penalty so they do not repeat each other.
+        """
+        from sentence_graph import lexrank_scores, mmr_select, sentence_similarity
+        
+        tfidf_matrix, _ = self.tfidf()
+        similarity = sentence_similarity(tfidf_matrix)
+        selected = mmr_select(lexrank_scores(similarity), similarity, num_sentences)
+        return [self.sentences[i] for i in selected]
+    
+    def top_terms(self, num_terms: int) -> List[str]:
+        """Terms with the highest average TF-IDF score across sentences."""
+        import numpy as np
+        
+        tfidf_matrix, feature_names = self.tfidf()
+        mean_scores = np.array(tfidf_matrix.mean(axis=0)).flatten()
+        
+        top_indices = mean_scores.argsort()[-num_terms:][::-1]
+        return [feature_names[i] for i in top_indices]
 
 class TextSummarizer:
-    def __init__(self):
-        """Initialize the summarizer with pre-trained models."""
+    # Reduce rounds before the remaining text is simply truncated to the model window
+    MAX_REDUCE_ROUNDS = 3
+    # "auto" summaries of texts longer than this use the abstractive model
+    AUTO_ABSTRACTIVE_MIN_WORDS = 200
+    # Recent documents whose sentences and TF-IDF are kept for the next call on the same text
+    MAX_RECENT_DOCUMENTS = 64
+    
+    def __init__(self, incremental: bool = False, chunk_token_budget: int = 900, quantize: bool = False,
+                 load_abstractive: bool = True, corpus_idf: bool = False):
+        """
+        Initialize the summarizer with pre-trained models.
+        
+        Args:
+            incremental (bool): Cache per-sentence tokenization by sentence hash so
+                re-analyzing an edited entry only tokenizes new or changed sentences.
+                Only tokenization is reused: sentence weights depend on the whole
+                document (its TF-IDF fit), so summaries and key phrases are still
+                scored from scratch
+            chunk_token_budget (int): Maximum tokens per abstractive model call (BART
+                reads at most 1024); longer texts are summarized chunk by chunk and
+                the chunk summaries summarized again
+            quantize (bool): Load the abstractive model with int8 dynamic quantization
+                of its linear layers (CPU only; faster and about a third of the memory)
+            load_abstractive (bool): Load the abstractive model now; if False, only
+                extractive methods are available until load_abstractive_model() is called
+            corpus_idf (bool): Weight sentences and key phrases by the corpus IDF table
+                written by build_idf_table.py (IDF_TABLE_PATH) instead of fitting TF-IDF
+                on the sentences of each text
+        """
+        from idf_table import default_tokenizer
+        from key_phrases import KeyPhraseExtractor
+        from linguistics import get_linguistic_layer
+        
         self.abstractive_model = None
-        self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
+        self.quantize = quantize
+        self.precision = "none"
+        self.incremental = incremental
+        self.sentence_token_cache = SentenceCache()
+        self.chunk_token_budget = chunk_token_budget
+        self.chunk_batch_size = 8
+        self.chunk_summary_cache = SentenceCache(max_entries=2000)
+        # Only the tokenizer is shared (a pure function); each TF-IDF fit gets its own
+        # vectorizer, so concurrent requests never touch each other's vocabulary
+        self._analyzer = default_tokenizer()
+        self.idf_table = self._load_idf_table() if corpus_idf else None
+        self.key_phrase_extractor = KeyPhraseExtractor()
+        # Sentence splits, noun chunks and entities, shared with the mood detector
+        self.linguistics = get_linguistic_layer()
+        self._documents: "OrderedDict[str, DocumentAnalysis]" = OrderedDict()
+        self._documents_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        self._models_initialized = False
         self._download_nltk_data()
-        self._initialize_models()
+        if load_abstractive:
+            self.load_abstractive_model()
+    
+    def load_abstractive_model(self) -> "TextSummarizer":
+        """Load the abstractive model if it has not been loaded yet."""
+        with self._model_lock:
+            if not self._models_initialized:
+                self._initialize_models()
+                self._models_initialized = True
+        return self
     
     def _download_nltk_data(self):
         """Download required NLTK data."""
+        import nltk
+        
         try:
             nltk.data.find('tokenizers/punkt_tab')
         except LookupError:
@@ -41,22 +185,130 @@ class TextSummarizer:
     
     def _initialize_models(self):
         """Initialize the pre-trained summarization models."""
+        if self.quantize:
+            try:
+                from quantization import load_quantized_summarizer
+                self.abstractive_model = load_quantized_summarizer("facebook/bart-large-cnn")
+                self.precision = "int8"
+                return
+            except Exception as e:
+                print(f"Warning: Could not load quantized BART model, using fp32: {e}")
+        
+        try:
+            from model_store import load_pipeline
+        except ImportError as e:
+            print(f"Warning: Could not load BART model: {e}")
+            self.abstractive_model = None
+            return
+        
         try:
             # Use a lightweight model for better performance
-            self.abstractive_model = pipeline(
-                "summarization", 
-                model="facebook/bart-large-cnn",
-                tokenizer="facebook/bart-large-cnn"
-            )
+            self.abstractive_model = load_pipeline("summarization", "facebook/bart-large-cnn")
+            self.precision = "fp32"
         except Exception as e:
             print(f"Warning: Could not load BART model: {e}")
             # Fallback to a smaller model
             try:
-                self.abstractive_model = pipeline("summarization", model="sshleifer/distilbart-cnn-12-6")
+                self.abstractive_model = load_pipeline("summarization", "sshleifer/distilbart-cnn-12-6")
+                self.precision = "fp32"
             except Exception as e2:
                 print(f"Warning: Could not load fallback model: {e2}")
                 self.abstractive_model = None
     
+    @staticmethod
+    def _load_idf_table():
+        """Load the corpus IDF table, or return None to fit TF-IDF per text."""
+        import os
+        from idf_table import DEFAULT_IDF_TABLE, IdfTable
+        
+        path = os.getenv("IDF_TABLE_PATH", DEFAULT_IDF_TABLE)
+        try:
+            table = IdfTable.load(path)
+            print(f"Loaded IDF table with {table.num_documents} documents from {path}")
+            return table
+        except Exception as e:
+            print(f"Warning: Could not load IDF table {path}, fitting TF-IDF per text: {e}")
+            return None
+    
+    def get_model_version(self, abstractive: bool = True) -> str:
+        """
+        Identify the models behind this summarizer, e.g. for keying cached results.
+        
+        Args:
+            abstractive (bool): Include the abstractive model, which is "none" until it
+                is loaded; leave it out for results that never come from it
+        """
+        extractive = f"tfidf+idf@{self.idf_table.num_documents}" if self.idf_table else "tfidf"
+        version = (f"extractive={extractive};key_phrases=rake;"
+                   f"linguistics={self.linguistics.get_version()}")
+        if not abstractive:
+            return version
+        
+        model = getattr(self.abstractive_model, "model", None)
+        name = getattr(model, "name_or_path", None) or "none"
+        return f"abstractive={name}@{self.precision};{version}"
+    
+    def get_result_version(self, text: str, summary_type: Optional[str] = None, **options) -> str:
+        """
+        Model version for one cached result. Only summaries that may come from the
+        abstractive model ("abstractive", or "auto" on a long text) depend on whether
+        and how it is loaded; extractive and graph summaries and key phrases keep
+        their keys when it loads later.
+        
+        Args:
+            text (str): Input text of the result
+            summary_type (str): Requested summary type; None for results that are not summaries
+            **options: Other result options (ignored)
+        """
+        abstractive = summary_type is not None and self.may_use_abstractive(text, summary_type)
+        return self.get_model_version(abstractive=abstractive)
+    
+    def analyze_document(self, text: str) -> DocumentAnalysis:
+        """
+        Shared per-document context for the extractive summary and key phrases.
+        
+        The summary and key phrases of one text are usually requested back to
+        back (or concurrently), so recent contexts are kept and reused.
+        """
+        with self._documents_lock:
+            document = self._documents.get(text)
+            if document is None:
+                document = DocumentAnalysis(self, text)
+                self._documents[text] = document
+                while len(self._documents) > self.MAX_RECENT_DOCUMENTS:
+                    self._documents.popitem(last=False)
+            else:
+                self._documents.move_to_end(text)
+            return document
+    
+    def document_features(self) -> tuple:
+        """
+        Linguistic features parsed for every document: sentences for the summary,
+        plus noun chunks and entities for the key phrases when the pipeline has them.
+        """
+        from linguistics import ENTITIES, NOUN_CHUNKS, SENTENCES
+        
+        return (SENTENCES,) + tuple(
+            feature for feature in (NOUN_CHUNKS, ENTITIES) if self.linguistics.supports(feature)
+        )
+    
+    def parse_documents(self, texts: List[str]) -> List:
+        """Parse several documents in one batched pass of the linguistic layer."""
+        return self.linguistics.parse_batch(texts, self.document_features())
+    
+    def analyze_documents(self, texts: List[str]) -> List[DocumentAnalysis]:
+        """
+        Contexts for several texts; every text not parsed yet is parsed in one
+        batched pass of the linguistic layer.
+        """
+        documents = [self.analyze_document(text) for text in texts]
+        pending = list({id(d): d for d in documents if d._parsed is None}.values())
+        if pending:
+            parsed = self.parse_documents([document.text for document in pending])
+            for document, result in zip(pending, parsed):
+                document.set_parsed(result)
+        return documents
+    
     def extractive_summarize(self, text: str, num_sentences: int = 3) -> str:
         """
         Create extractive summary by selecting top sentences based on TF-IDF scores.
@@ -71,28 +323,82 @@ class TextSummarizer:
         if not text or len(text.strip()) == 0:
             return "No content to summarize."
         
-        # Clean and tokenize text
-        sentences = sent_tokenize(text)
+        return self._extractive_summary(self.analyze_document(text), num_sentences)
+    
+    def _extractive_summary(self, document: DocumentAnalysis, num_sentences: int) -> str:
+        """Extractive summary of an already analyzed document."""
+        sentences = document.sentences
         
         if len(sentences) <= num_sentences:
-            return text
+            return document.text
         
-        # Calculate TF-IDF scores for sentences
+        # Rank sentences by their TF-IDF scores
         try:
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(sentences)
-            sentence_scores = np.array(tfidf_matrix.sum(axis=1)).flatten()
-            
-            # Get top sentences
-            top_indices = sentence_scores.argsort()[-num_sentences:][::-1]
-            top_indices.sort()  # Maintain original order
-            
-            summary_sentences = [sentences[i] for i in top_indices]
-            return ' '.join(summary_sentences)
+            return ' '.join(document.top_sentences(num_sentences))
             
         except Exception as e:
             # Fallback to first few sentences if TF-IDF fails
             return ' '.join(sentences[:num_sentences])
     
+    def graph_summarize(self, text: str, num_sentences: int = 3) -> str:
+        """
+        Create an extractive summary from the most central sentences of the
+        sentence-similarity graph (LexRank), avoiding redundant sentences.
+        
+        Args:
+            text (str): Input text to summarize
+            num_sentences (int): Number of sentences in summary
+            
+        Returns:
+            str: Extractive summary
+        """
+        if not text or len(text.strip()) == 0:
+            return "No content to summarize."
+        
+        return self._graph_summary(self.analyze_document(text), num_sentences)
+    
+    def _graph_summary(self, document: DocumentAnalysis, num_sentences: int) -> str:
+        """Graph-based summary of an already analyzed document."""
+        if len(document.sentences) <= num_sentences:
+            return document.text
+        
+        try:
+            return ' '.join(document.graph_sentences(num_sentences))
+        except Exception as e:
+            print(f"Graph summarization failed, using TF-IDF ranking: {e}")
+            return self._extractive_summary(document, num_sentences)
+    
+    def _fit_tfidf(self, sentences: List[str]):
+        """
+        TF-IDF over the sentences of one document: transform-only with the corpus
+        IDF table if one is loaded, else a fit over the document's own sentences.
+        
+        Safe to call from many threads at once: the vectorizer is local to the
+        call and only the stateless tokenizer and the read-only table are shared.
+        
+        Returns:
+            Tuple: Sentence-term TF-IDF matrix and the feature names
+        """
+        if self.idf_table is not None:
+            return self.idf_table.transform(self._sentence_tokens(sentences))
+        
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
+        vectorizer = TfidfVectorizer(analyzer=_pretokenized)
+        tfidf_matrix = vectorizer.fit_transform(self._sentence_tokens(sentences))
+        return tfidf_matrix, vectorizer.get_feature_names_out()
+    
+    def _sentence_tokens(self, sentences: List[str]) -> List[List[str]]:
+        """Tokens of each sentence; in incremental mode, only sentences not seen before are tokenized."""
+        if not self.incremental:
+            return [self._analyzer(sentence) for sentence in sentences]
+        
+        tokens, missing = self.sentence_token_cache.get_many(sentences)
+        for i in missing:
+            tokens[i] = self._analyzer(sentences[i])
+            self.sentence_token_cache.set(sentences[i], tokens[i])
+        return tokens
+    
     def abstractive_summarize(self, text: str, max_length: int = 150, min_length: int = 30) -> str:
         """
         Create abstractive summary using transformer model.
@@ -112,34 +418,158 @@ class TextSummarizer:
             return "No content to summarize."
         
         try:
-            # Truncate text if too long for model
-            max_input_length = 1024
-            if len(text.split()) > max_input_length:
-                words = text.split()
-                text = ' '.join(words[:max_input_length])
-            
-            # Generate summary
-            summary = self.abstractive_model(
-                text, 
-                max_length=max_length, 
-                min_length=min_length,
-                do_sample=False
-            )
-            
-            return summary[0]['summary_text']
+            return self._map_reduce_summarize([text], max_length, min_length)[0]
             
         except Exception as e:
             print(f"Abstractive summarization failed: {e}")
             # Fallback to extractive summarization
             return self.extractive_summarize(text)
     
+    def abstractive_summarize_batch(self, texts: List[str], max_length: int = 150, min_length: int = 30) -> List[str]:
+        """
+        Create abstractive summaries for several texts in one model call.
+        
+        Args:
+            texts (List[str]): Input texts to summarize
+            max_length (int): Maximum length of each summary
+            min_length (int): Minimum length of each summary
+            
+        Returns:
+            List[str]: One summary per input text, in input order
+        """
+        if not texts:
+            return []
+        
+        if not self.abstractive_model:
+            return [self.extractive_summarize(text) for text in texts]
+        
+        summaries: List[Optional[str]] = [None] * len(texts)
+        positions = []
+        model_inputs = []
+        
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) == 0:
+                summaries[i] = "No content to summarize."
+            else:
+                positions.append(i)
+                model_inputs.append(text)
+        
+        if model_inputs:
+            try:
+                results = self._map_reduce_summarize(model_inputs, max_length, min_length)
+                for i, result in zip(positions, results):
+                    summaries[i] = result
+            except Exception as e:
+                # One bad input should not fail the whole batch
+                print(f"Batched abstractive summarization failed, retrying per text: {e}")
+                for i in positions:
+                    summaries[i] = self.abstractive_summarize(texts[i], max_length, min_length)
+        
+        return summaries
+    
+    def _map_reduce_summarize(self, texts: List[str], max_length: int, min_length: int) -> List[str]:
+        """
+        Summarize texts of any length with bounded-size model calls.
+        
+        Texts that exceed the model's token budget are split into chunks on
+        sentence boundaries; all chunks of all long texts are summarized as one
+        batch (reusing cached chunk summaries) and the chunk summaries of each
+        text are concatenated. This repeats until every text fits, then the
+        final summaries are generated in one batch.
+        """
+        texts = list(texts)
+        
+        for _ in range(self.MAX_REDUCE_ROUNDS):
+            long_positions = [i for i, text in enumerate(texts) if self._count_tokens(text) > self.chunk_token_budget]
+            if not long_positions:
+                break
+            
+            sentence_lists = self.linguistics.sentences_batch([texts[i] for i in long_positions])
+            chunks_per_text = [self._chunk_text(sentences) for sentences in sentence_lists]
+            chunk_summaries = self._summarize_chunks(
+                [chunk for chunks in chunks_per_text for chunk in chunks],
+                max_length,
+                min(min_length, 30)
+            )
+            
+            offset = 0
+            for i, chunks in zip(long_positions, chunks_per_text):
+                texts[i] = ' '.join(chunk_summaries[offset:offset + len(chunks)])
+                offset += len(chunks)
+        
+        return self._generate_summaries(texts, max_length, min_length)
+    
+    def _summarize_chunks(self, chunks: List[str], max_length: int, min_length: int) -> List[str]:
+        """Summarize chunks in one batch, skipping chunks summarized before."""
+        cache_keys = [f"{max_length}:{min_length}:{chunk}" for chunk in chunks]
+        summaries, missing = self.chunk_summary_cache.get_many(cache_keys)
+        
+        if missing:
+            generated = self._generate_summaries([chunks[i] for i in missing], max_length, min_length)
+            for i, summary in zip(missing, generated):
+                self.chunk_summary_cache.set(cache_keys[i], summary)
+                summaries[i] = summary
+        
+        return summaries
+    
+    def _generate_summaries(self, texts: List[str], max_length: int, min_length: int) -> List[str]:
+        """Run the abstractive model over texts that fit its input window."""
+        if not texts:
+            return []
+        
+        results = self.abstractive_model(
+            texts,
+            max_length=max_length,
+            min_length=min_length,
+            do_sample=False,
+            truncation=True,
+            batch_size=min(len(texts), self.chunk_batch_size)
+        )
+        return [(r[0] if isinstance(r, list) else r)['summary_text'] for r in results]
+    
+    def _count_tokens(self, text: str) -> int:
+        """Number of model tokens in text (estimated from words if no tokenizer is available)."""
+        tokenizer = getattr(self.abstractive_model, "tokenizer", None)
+        if tokenizer is None:
+            return int(len(text.split()) * 4 / 3)
+        return len(tokenizer(text, add_special_tokens=False)["input_ids"])
+    
+    def _chunk_text(self, sentences: List[str]) -> List[str]:
+        """Group a text's sentences into chunks of at most chunk_token_budget tokens."""
+        chunks = []
+        current, current_tokens = [], 0
+        
+        for sentence in sentences:
+            sentence_tokens = self._count_tokens(sentence)
+            
+            # A single overlong sentence is split into word windows
+            if sentence_tokens > self.chunk_token_budget:
+                words = sentence.split()
+                window = max(1, int(len(words) * self.chunk_token_budget / sentence_tokens))
+                pieces = [' '.join(words[j:j + window]) for j in range(0, len(words), window)]
+            else:
+                pieces = [sentence]
+            
+            for piece in pieces:
+                piece_tokens = sentence_tokens if len(pieces) == 1 else self._count_tokens(piece)
+                if current and current_tokens + piece_tokens > self.chunk_token_budget:
+                    chunks.append(' '.join(current))
+                    current, current_tokens = [], 0
+                current.append(piece)
+                current_tokens += piece_tokens
+        
+        if current:
+            chunks.append(' '.join(current))
+        
+        return chunks
+    
     def smart_summarize(self, text: str, summary_type: str = "auto") -> Dict:
         """
         Intelligent summarization that chooses the best method based on text characteristics.
         
         Args:
             text (str): Input text to summarize
-            summary_type (str): Type of summary ("extractive", "abstractive", "auto")
+            summary_type (str): Type of summary ("extractive", "graph", "abstractive", "auto")
             
         Returns:
             Dict: Summary results with metadata
@@ -154,23 +584,82 @@ class TextSummarizer:
             }
         
         original_length = len(text.split())
+        method = self._choose_method(original_length, summary_type)
         
-        # Choose summarization method
-        if summary_type == "auto":
-            # Use abstractive for longer texts, extractive for shorter ones
-            if original_length > 200 and self.abstractive_model:
-                method = "abstractive"
-                summary = self.abstractive_summarize(text)
-            else:
-                method = "extractive"
-                summary = self.extractive_summarize(text)
-        elif summary_type == "abstractive":
-            method = "abstractive"
+        if method == "abstractive":
             summary = self.abstractive_summarize(text)
+        elif method == "graph":
+            summary = self.graph_summarize(text)
         else:
-            method = "extractive"
             summary = self.extractive_summarize(text)
         
+        return self._summary_result(summary, method, original_length)
+    
+    def smart_summarize_batch(self, texts: List[str], summary_types: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Summarize several texts, running all abstractive summaries as one batched model call.
+        
+        Args:
+            texts (List[str]): Input texts to summarize
+            summary_types (List[str]): Summary type per text (defaults to "auto" for all)
+            
+        Returns:
+            List[Dict]: One summary result per input text, in input order
+        """
+        if summary_types is None:
+            summary_types = ["auto"] * len(texts)
+        
+        results: List[Optional[Dict]] = [None] * len(texts)
+        abstractive_positions = []
+        extractive_positions = []
+        methods = {}
+        
+        for i, (text, summary_type) in enumerate(zip(texts, summary_types)):
+            if not text or len(text.strip()) == 0:
+                results[i] = self.smart_summarize(text)
+                continue
+            
+            methods[i] = self._choose_method(len(text.split()), summary_type)
+            if methods[i] == "abstractive":
+                abstractive_positions.append(i)
+            else:
+                extractive_positions.append(i)
+        
+        # All extractive texts are split into sentences in one pass of the linguistic layer
+        documents = self.analyze_documents([texts[i] for i in extractive_positions])
+        for i, document in zip(extractive_positions, documents):
+            if methods[i] == "graph":
+                summary = self._graph_summary(document, 3)
+            else:
+                summary = self._extractive_summary(document, 3)
+            results[i] = self._summary_result(summary, methods[i], len(texts[i].split()))
+        
+        summaries = self.abstractive_summarize_batch([texts[i] for i in abstractive_positions])
+        for i, summary in zip(abstractive_positions, summaries):
+            results[i] = self._summary_result(summary, "abstractive", len(texts[i].split()))
+        
+        return results
+    
+    @classmethod
+    def may_use_abstractive(cls, text: str, summary_type: str = "auto") -> bool:
+        """Whether summarizing this text could need the abstractive model."""
+        if summary_type == "auto":
+            return len(text.split()) > cls.AUTO_ABSTRACTIVE_MIN_WORDS
+        return summary_type == "abstractive"
+    
+    def _choose_method(self, original_length: int, summary_type: str) -> str:
+        """Choose the summarization method for a text of the given word count."""
+        if summary_type == "auto":
+            # Use abstractive for longer texts, extractive for shorter ones
+            if original_length > self.AUTO_ABSTRACTIVE_MIN_WORDS and self.abstractive_model:
+                return "abstractive"
+            return "extractive"
+        elif summary_type in ("abstractive", "graph"):
+            return summary_type
+        return "extractive"
+    
+    def _summary_result(self, summary: str, method: str, original_length: int) -> Dict:
+        """Build the summary result dictionary with length metadata."""
         summary_length = len(summary.split())
         compression_ratio = round((1 - summary_length / original_length) * 100, 2) if original_length > 0 else 0
         
@@ -184,7 +673,7 @@ class TextSummarizer:
     
     def get_key_phrases(self, text: str, num_phrases: int = 5) -> List[str]:
         """
-        Extract key phrases from text.
+        Extract key phrases (one to three words) from text.
         
         Args:
             text (str): Input text
@@ -196,26 +685,46 @@ class TextSummarizer:
         if not text:
             return []
         
+        return self.get_key_phrases_batch([text], num_phrases)[0]
+    
+    def get_key_phrases_batch(self, texts: List[str], num_phrases: int = 5) -> List[List[str]]:
+        """
+        Extract key phrases from several texts, scored together in one pass.
+        
+        Args:
+            texts (List[str]): Input texts
+            num_phrases (int): Number of key phrases per text
+            
+        Returns:
+            List[List[str]]: Key phrases per text, in input order
+        """
+        from linguistics import NOUN_CHUNKS
+        
+        idf = self.idf_table.idf if self.idf_table is not None else None
+        try:
+            parsed = None
+            if self.linguistics.supports(NOUN_CHUNKS):
+                # Candidates from noun chunks and entities of the parse the summary also uses,
+                # so a text summarized and then searched for key phrases is parsed only once
+                parsed = [document.parsed for document in self.analyze_documents(texts)]
+            return self.key_phrase_extractor.extract_batch(texts, num_phrases, idf, parsed)
+        except Exception as e:
+            print(f"Key phrase extraction failed, using TF-IDF terms: {e}")
+            return [self._top_terms(text, num_phrases) for text in texts]
+    
+    def _top_terms(self, text: str, num_phrases: int) -> List[str]:
+        """Single-word key phrases by average TF-IDF score across sentences."""
+        if not text:
+            return []
+        
         try:
-            # Simple key phrase extraction using TF-IDF
-            sentences = sent_tokenize(text)
-            if not sentences:
+            document = self.analyze_document(text)
+            if not document.sentences:
                 return []
             
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(sentences)
-            feature_names = self.tfidf_vectorizer.get_feature_names_out()
-            
-            # Get average TF-IDF scores for each word
-            mean_scores = np.array(tfidf_matrix.mean(axis=0)).flatten()
-            
-            # Get top scoring words
-            top_indices = mean_scores.argsort()[-num_phrases * 2:][::-1]
-            key_words = [feature_names[i] for i in top_indices]
-            
-            # Filter out single characters and very short words
-            key_phrases = [word for word in key_words if len(word) > 2][:num_phrases]
-            
-            return key_phrases
+            # Get top scoring words, filtering out very short ones
+            key_words = document.top_terms(num_phrases * 2)
+            return [word for word in key_words if len(word) > 2][:num_phrases]
             
         except Exception as e:
             print(f"Key phrase extraction failed: {e}")
@@ -7,34 +7,159 @@ import sys
 import os
 import argparse
 import json
-from typing import Dict, Any
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List
 
-# Add models directory to path
+# Add models and utils directories to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
 try:
     from summarizer import TextSummarizer
     from mood_detector import MoodDetector
     from motivator import Motivator
+    from stage_graph import StageGraph
+    from result_cache import ResultCache, create_result_cache, make_cache_key, result_model_version
+    from component_loader import create_components
+    from local_daemon import DaemonUnavailable, default_socket_path, is_running, request, serve
+    from corpus import CheckpointedWriter, ProgressReporter, batched, read_records
 except ImportError as e:
     print(f"❌ Error importing models: {e}")
     print("Please run 'python setup.py' first to set up the system.")
     sys.exit(1)
 
-class NLPAnalyzer:
-    """Main class for NLP text analysis and motivation."""
+def _get_timestamp() -> str:
+    """Get current timestamp."""
+    from datetime import datetime
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def format_results(results: Dict[str, Any]) -> str:
+    """
+    Format existing analysis results as a human-readable report.
+    
+    Args:
+        results (Dict): Results returned by NLPAnalyzer.analyze_text
+        
+    Returns:
+        str: Formatted analysis summary
+    """
+    output = []
+    output.append("=" * 60)
+    output.append("📊 QUICK NLP ANALYSIS")
+    output.append("=" * 60)
+    
+    # Summary
+    if "summary" in results and "error" not in results["summary"]:
+        output.append(f"\n📝 SUMMARY:")
+        output.append(f"   {results['summary']['text']}")
+        output.append(f"   Method: {results['summary']['method']}")
+        output.append(f"   Compression: {results['summary']['compression_ratio']}%")
+        if results['summary']['key_phrases']:
+            output.append(f"   Key phrases: {', '.join(results['summary']['key_phrases'][:3])}")
+    
+    # Mood
+    if "mood" in results and "error" not in results["mood"]:
+        output.append(f"\n🎭 MOOD ANALYSIS:")
+        output.append(f"   Mood: {results['mood']['overall_mood']} ({results['mood']['mood_category']})")
+        output.append(f"   Confidence: {results['mood']['confidence']:.2f}")
+        output.append(f"   {results['mood']['description']}")
+        
+        if results['mood']['suggestions']:
+            output.append(f"\n💡 SUGGESTIONS:")
+            for i, suggestion in enumerate(results['mood']['suggestions'][:2], 1):
+                output.append(f"   {i}. {suggestion}")
+    
+    # Motivation
+    if "motivation" in results and "error" not in results["motivation"]:
+        output.append(f"\n💪 MOTIVATION:")
+        output.append(f"   Quote: {results['motivation']['quote']}")
+        output.append(f"\n✨ ENCOURAGEMENT:")
+        output.append(f"   {results['motivation']['encouragement'][:200]}...")
+        
+        if results['motivation']['coping_strategies']:
+            output.append(f"\n🛠️  COPING STRATEGY:")
+            output.append(f"   {results['motivation']['coping_strategies'][0]}")
     
-    def __init__(self):
-        """Initialize all NLP components."""
-        print("🔄 Initializing NLP components...")
+    output.append("\n" + "=" * 60)
+    
+    return "\n".join(output)
+
+class AnalysisResult:
+    """
+    The results of one analysis. The text report, the JSON output and the
+    saved file are all rendered from the same results, so a text is analyzed
+    once however it is presented.
+    """
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return self.data
+    
+    def to_json(self) -> str:
+        return json.dumps(self.data, indent=2, ensure_ascii=False)
+    
+    def render_text(self) -> str:
+        return format_results(self.data)
+    
+    def save(self, filename: str = None) -> str:
+        """
+        Save the results to a JSON file.
+        
+        Args:
+            filename (str): Output filename (optional)
+            
+        Returns:
+            str: Saved filename
+        """
+        if filename is None:
+            timestamp = self.data.get("analysis_timestamp") or _get_timestamp()
+            filename = f"nlp_analysis_{timestamp.replace(':', '-').replace(' ', '_')}.json"
+        
         try:
-            self.summarizer = TextSummarizer()
-            self.mood_detector = MoodDetector()
-            self.motivator = Motivator()
-            print("✅ All components initialized successfully!")
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            
+            return filename
+            
         except Exception as e:
-            print(f"❌ Error initializing components: {e}")
-            raise
+            raise Exception(f"Error saving analysis: {e}")
+
+class NLPAnalyzer:
+    """Main class for NLP text analysis and motivation."""
+    
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize the analyzer. Each NLP component is loaded the first time it
+        is needed, so e.g. daily motivation never loads the transformer models.
+        The components are configured from the same environment variables as
+        the API servers (NLP_INCREMENTAL, INFERENCE_BACKEND, MOOD_FUSED, ...).
+        
+        Args:
+            use_cache (bool): Reuse results stored by earlier runs and by the API servers
+        """
+        self.result_cache = create_result_cache() if use_cache else ResultCache(max_entries=0)
+        self._components = create_components()
+    
+    @property
+    def summarizer(self) -> TextSummarizer:
+        return self._components["summarizer"].get()
+    
+    def _summarizer_for(self, texts: List[str]) -> TextSummarizer:
+        """The summarizer, with the abstractive model loaded if an "auto" summary of these texts needs it."""
+        if any(TextSummarizer.may_use_abstractive(text or "", "auto") for text in texts):
+            return self._components["abstractive_model"].get()
+        return self.summarizer
+    
+    @property
+    def mood_detector(self) -> MoodDetector:
+        return self._components["mood_detector"].get()
+    
+    @property
+    def motivator(self) -> Motivator:
+        return self._components["motivator"].get()
     
     def analyze_text(self, text: str, include_summary: bool = True, 
                     include_mood: bool = True, include_motivation: bool = True) -> Dict[str, Any]:
@@ -55,65 +180,243 @@ class NLPAnalyzer:
             "analysis_timestamp": self._get_timestamp()
         }
         
+        # Independent stages run in parallel; motivation waits only for mood
+        graph = self._build_analysis_graph(text, include_summary, include_mood, include_motivation)
+        stages = graph.run()
+        
         # Text Summarization
         if include_summary:
-            try:
-                summary_result = self.summarizer.smart_summarize(text)
-                key_phrases = self.summarizer.get_key_phrases(text, 5)
-                
-                results["summary"] = {
-                    "text": summary_result["summary"],
-                    "method": summary_result["method"],
-                    "original_length": summary_result["original_length"],
-                    "summary_length": summary_result["summary_length"],
-                    "compression_ratio": summary_result["compression_ratio"],
-                    "key_phrases": key_phrases
-                }
-            except Exception as e:
-                results["summary"] = {"error": f"Summarization failed: {e}"}
+            if stages.ok("summary") and stages.ok("key_phrases"):
+                results["summary"] = self._summary_section(stages.get("summary"), stages.get("key_phrases"))
+            else:
+                error = stages.errors.get("summary") or stages.errors.get("key_phrases")
+                results["summary"] = {"error": f"Summarization failed: {error}"}
         
         # Mood Detection
         if include_mood:
-            try:
-                mood_result = self.mood_detector.comprehensive_mood_analysis(text)
-                
-                results["mood"] = {
-                    "overall_mood": mood_result["overall_mood"],
-                    "mood_category": mood_result["mood_category"],
-                    "confidence": mood_result["confidence"],
-                    "description": mood_result["description"],
-                    "suggestions": mood_result["suggestions"],
-                    "sentiment": mood_result["sentiment"],
-                    "emotions": mood_result["emotions"],
-                    "indicators": mood_result["indicators"]
-                }
-            except Exception as e:
-                results["mood"] = {"error": f"Mood detection failed: {e}"}
+            if stages.ok("mood"):
+                results["mood"] = self._mood_section(stages.get("mood"))
+            else:
+                error = next((stages.errors[stage] for stage in ("sentiment", "emotions", "indicators", "mood")
+                              if stage in stages.errors), None)
+                results["mood"] = {"error": f"Mood detection failed: {error}"}
         
         # Motivational Content
         if include_motivation and "mood" in results and "error" not in results["mood"]:
-            try:
-                motivation_result = self.motivator.get_motivational_content(
-                    results["mood"]["overall_mood"],
-                    results["mood"]["mood_category"]
-                )
-                
-                results["motivation"] = {
-                    "quote": motivation_result["motivational_quote"],
-                    "affirmations": motivation_result["affirmations"],
-                    "coping_strategies": motivation_result["coping_strategies"],
-                    "success_tip": motivation_result["success_tip"],
-                    "encouragement": motivation_result["encouragement"],
-                    "mood_addressed": motivation_result["mood_addressed"]
-                }
-            except Exception as e:
-                results["motivation"] = {"error": f"Motivation generation failed: {e}"}
+            if stages.ok("motivation"):
+                results["motivation"] = self._motivation_section(stages.get("motivation"))
+            else:
+                results["motivation"] = {"error": f"Motivation generation failed: {stages.errors.get('motivation')}"}
+        
+        results["stage_timings"] = stages.get_timings()
+        
+        return results
+    
+    def analyze(self, text: str, include_summary: bool = True,
+                include_mood: bool = True, include_motivation: bool = True) -> AnalysisResult:
+        """Same as analyze_text, wrapped in an AnalysisResult for output and saving."""
+        return AnalysisResult(self.analyze_text(text, include_summary, include_mood, include_motivation))
+    
+    def analyze_batch(self, texts: List[str], include_summary: bool = True,
+                      include_mood: bool = True, include_motivation: bool = True) -> List[Dict[str, Any]]:
+        """
+        Analyze several texts, sharing batched model calls between them.
+        
+        Args:
+            texts (List[str]): Texts to analyze
+            include_summary (bool): Include text summarization
+            include_mood (bool): Include mood detection
+            include_motivation (bool): Include motivational content
+            
+        Returns:
+            List[Dict]: One result per text, in input order, shaped like analyze_text's
+        """
+        timestamp = self._get_timestamp()
+        batch_results = [{"original_text": text, "analysis_timestamp": timestamp} for text in texts]
+        
+        # Text Summarization (abstractive summaries share one model call)
+        if include_summary:
+            summarizer = self._summarizer_for(texts)
+            summaries = self._run_batch_cached(
+                [self._cache_key("summary", summarizer, text, summary_type="auto") for text in texts],
+                summarizer.smart_summarize_batch,
+                summarizer.smart_summarize,
+                texts
+            )
+            key_phrases = self._run_batch_cached(
+                [self._cache_key("key_phrases", summarizer, text, num_phrases=5) for text in texts],
+                summarizer.get_key_phrases_batch,
+                summarizer.get_key_phrases,
+                texts
+            )
+            for results, summary_result, phrases in zip(batch_results, summaries, key_phrases):
+                error = next((r for r in (summary_result, phrases) if isinstance(r, Exception)), None)
+                if error is not None:
+                    results["summary"] = {"error": f"Summarization failed: {error}"}
+                else:
+                    results["summary"] = self._summary_section(summary_result, phrases)
+        
+        # Mood Detection (sentiment and emotion models run once for the whole batch)
+        if include_mood:
+            moods = self._run_batch_cached(
+                [self._cache_key("mood", self.mood_detector, text) for text in texts],
+                self.mood_detector.comprehensive_mood_analysis_batch,
+                self.mood_detector.comprehensive_mood_analysis,
+                texts
+            )
+            for results, mood_result in zip(batch_results, moods):
+                if isinstance(mood_result, Exception):
+                    results["mood"] = {"error": f"Mood detection failed: {mood_result}"}
+                else:
+                    results["mood"] = self._mood_section(mood_result)
+        
+        # Motivational Content
+        if include_motivation:
+            for results in batch_results:
+                if "mood" not in results or "error" in results["mood"]:
+                    continue
+                try:
+                    results["motivation"] = self._motivation_section(self.motivator.get_motivational_content(
+                        results["mood"]["overall_mood"],
+                        results["mood"]["mood_category"]
+                    ))
+                except Exception as e:
+                    results["motivation"] = {"error": f"Motivation generation failed: {e}"}
+        
+        return batch_results
+    
+    def _run_batch_cached(self, keys: List, batch_fn, single_fn, inputs: List) -> List:
+        """
+        Serve cached items directly and compute the misses with one batched call,
+        retrying item by item if the batch fails.
+        
+        Returns one entry per input: the result, or the exception raised for that item.
+        """
+        results = [self.result_cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+        
+        try:
+            computed = batch_fn([inputs[i] for i in missing])
+        except Exception as e:
+            print(f"Batch call failed, retrying per item: {e}")
+            computed = []
+            for i in missing:
+                try:
+                    computed.append(single_fn(inputs[i]))
+                except Exception as item_error:
+                    computed.append(item_error)
+        
+        for i, value in zip(missing, computed):
+            results[i] = value
+            if not isinstance(value, Exception):
+                self.result_cache.set(keys[i], value)
         
         return results
     
+    @staticmethod
+    def _summary_section(summary_result: Dict, key_phrases: List[str]) -> Dict[str, Any]:
+        return {
+            "text": summary_result["summary"],
+            "method": summary_result["method"],
+            "original_length": summary_result["original_length"],
+            "summary_length": summary_result["summary_length"],
+            "compression_ratio": summary_result["compression_ratio"],
+            "key_phrases": key_phrases
+        }
+    
+    @staticmethod
+    def _mood_section(mood_result: Dict) -> Dict[str, Any]:
+        return {
+            "overall_mood": mood_result["overall_mood"],
+            "mood_category": mood_result["mood_category"],
+            "confidence": mood_result["confidence"],
+            "description": mood_result["description"],
+            "suggestions": mood_result["suggestions"],
+            "sentiment": mood_result["sentiment"],
+            "emotions": mood_result["emotions"],
+            "indicators": mood_result["indicators"]
+        }
+    
+    @staticmethod
+    def _motivation_section(motivation_result: Dict) -> Dict[str, Any]:
+        return {
+            "quote": motivation_result["motivational_quote"],
+            "affirmations": motivation_result["affirmations"],
+            "coping_strategies": motivation_result["coping_strategies"],
+            "success_tip": motivation_result["success_tip"],
+            "encouragement": motivation_result["encouragement"],
+            "mood_addressed": motivation_result["mood_addressed"]
+        }
+    
+    def _build_analysis_graph(self, text: str, include_summary: bool,
+                              include_mood: bool, include_motivation: bool) -> StageGraph:
+        """Build the stage graph for one analysis."""
+        graph = StageGraph()
+        
+        if include_summary:
+            summarizer = self._summarizer_for([text])
+            summary_key = self._cache_key("summary", summarizer, text, summary_type="auto")
+            key_phrases_key = self._cache_key("key_phrases", summarizer, text, num_phrases=5)
+            graph.add_stage("summary", lambda _: self.result_cache.get_or_compute(
+                summary_key, summarizer.smart_summarize, text
+            ))
+            graph.add_stage("key_phrases", lambda _: self.result_cache.get_or_compute(
+                key_phrases_key, summarizer.get_key_phrases, text, 5
+            ))
+        
+        if not include_mood:
+            return graph
+        
+        mood_key = self._cache_key("mood", self.mood_detector, text)
+        cached_mood = self.result_cache.get(mood_key)
+        
+        if cached_mood is not None:
+            graph.add_stage("mood", lambda _: cached_mood)
+        elif not text or len(text.strip()) == 0:
+            graph.add_stage("mood", lambda _: self.result_cache.get_or_compute(
+                mood_key, self.mood_detector.comprehensive_mood_analysis, text
+            ))
+        else:
+            processed_text = self.mood_detector.preprocess_text(text)
+            graph.add_stage("sentiment", lambda _: self.mood_detector.analyze_sentiment_advanced(processed_text))
+            graph.add_stage("emotions", lambda _: self.mood_detector.detect_emotions(processed_text))
+            graph.add_stage("indicators", lambda _: self.mood_detector.analyze_mood_indicators(processed_text))
+            graph.add_stage(
+                "mood",
+                lambda r: self._remember(
+                    mood_key,
+                    self.mood_detector.build_mood_analysis(r["sentiment"], r["emotions"], r["indicators"])
+                ),
+                after=["sentiment", "emotions", "indicators"]
+            )
+        
+        if include_motivation:
+            graph.add_stage(
+                "motivation",
+                lambda r: self.motivator.get_motivational_content(
+                    r["mood"]["overall_mood"],
+                    r["mood"]["mood_category"]
+                ),
+                after=["mood"]
+            )
+        
+        return graph
+    
+    def _cache_key(self, namespace: str, component, text: str, **options):
+        """Key a result by its text, options and the component's model version."""
+        return make_cache_key(namespace, text, options, result_model_version(component, text, options))
+    
+    def _remember(self, key, value):
+        """Cache a freshly computed result and pass it through."""
+        self.result_cache.set(key, value)
+        return value
+    
     def quick_analysis(self, text: str) -> str:
         """
-        Perform a quick analysis and return a formatted summary.
+        Analyze a text and return a formatted summary. To present results
+        that are already computed, use format_results instead.
         
         Args:
             text (str): Text to analyze
@@ -122,49 +425,7 @@ class NLPAnalyzer:
             str: Formatted analysis summary
         """
         try:
-            results = self.analyze_text(text)
-            
-            output = []
-            output.append("=" * 60)
-            output.append("📊 QUICK NLP ANALYSIS")
-            output.append("=" * 60)
-            
-            # Summary
-            if "summary" in results and "error" not in results["summary"]:
-                output.append(f"\n📝 SUMMARY:")
-                output.append(f"   {results['summary']['text']}")
-                output.append(f"   Method: {results['summary']['method']}")
-                output.append(f"   Compression: {results['summary']['compression_ratio']}%")
-                if results['summary']['key_phrases']:
-                    output.append(f"   Key phrases: {', '.join(results['summary']['key_phrases'][:3])}")
-            
-            # Mood
-            if "mood" in results and "error" not in results["mood"]:
-                output.append(f"\n🎭 MOOD ANALYSIS:")
-                output.append(f"   Mood: {results['mood']['overall_mood']} ({results['mood']['mood_category']})")
-                output.append(f"   Confidence: {results['mood']['confidence']:.2f}")
-                output.append(f"   {results['mood']['description']}")
-                
-                if results['mood']['suggestions']:
-                    output.append(f"\n💡 SUGGESTIONS:")
-                    for i, suggestion in enumerate(results['mood']['suggestions'][:2], 1):
-                        output.append(f"   {i}. {suggestion}")
-            
-            # Motivation
-            if "motivation" in results and "error" not in results["motivation"]:
-                output.append(f"\n💪 MOTIVATION:")
-                output.append(f"   Quote: {results['motivation']['quote']}")
-                output.append(f"\n✨ ENCOURAGEMENT:")
-                output.append(f"   {results['motivation']['encouragement'][:200]}...")
-                
-                if results['motivation']['coping_strategies']:
-                    output.append(f"\n🛠️  COPING STRATEGY:")
-                    output.append(f"   {results['motivation']['coping_strategies'][0]}")
-            
-            output.append("\n" + "=" * 60)
-            
-            return "\n".join(output)
-            
+            return format_results(self.analyze_text(text))
         except Exception as e:
             return f"❌ Error during quick analysis: {e}"
     
@@ -189,34 +450,186 @@ class NLPAnalyzer:
         except Exception as e:
             return f"❌ Error getting daily motivation: {e}"
     
-    def save_analysis(self, results: Dict[str, Any], filename: str = None) -> str:
+    def save_analysis(self, results, filename: str = None) -> str:
         """
         Save analysis results to a JSON file.
         
         Args:
-            results (Dict): Analysis results
+            results (AnalysisResult or Dict): Analysis results
             filename (str): Output filename (optional)
             
         Returns:
             str: Saved filename
         """
-        if filename is None:
-            timestamp = self._get_timestamp().replace(":", "-").replace(" ", "_")
-            filename = f"nlp_analysis_{timestamp}.json"
-        
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            
-            return filename
-            
-        except Exception as e:
-            raise Exception(f"Error saving analysis: {e}")
+        if not isinstance(results, AnalysisResult):
+            results = AnalysisResult(results)
+        return results.save(filename)
     
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return _get_timestamp()
+
+class DaemonAnalyzer(NLPAnalyzer):
+    """
+    NLPAnalyzer that forwards analysis to a running daemon (see --daemon), so
+    no models are loaded in this process. Results are still saved locally.
+    Falls back to analyzing in-process if the daemon goes away; the inherited
+    components are lazy, so nothing is loaded here unless that happens.
+    """
+    
+    def __init__(self, socket_path: str, use_cache: bool = True):
+        super().__init__(use_cache=use_cache)
+        self.socket_path = socket_path
+        self.use_cache = use_cache
+        self._warned_unavailable = False
+    
+    def _call(self, method: str, **kwargs):
+        try:
+            return request(self.socket_path, {"action": method, "use_cache": self.use_cache, **kwargs})
+        except DaemonUnavailable:
+            if not self._warned_unavailable:
+                print("⚠️  Daemon is not running; analyzing in this process")
+                self._warned_unavailable = True
+            return getattr(super(), method)(**kwargs)
+    
+    def analyze_text(self, text: str, include_summary: bool = True,
+                    include_mood: bool = True, include_motivation: bool = True) -> Dict[str, Any]:
+        return self._call("analyze_text", text=text, include_summary=include_summary,
+                          include_mood=include_mood, include_motivation=include_motivation)
+    
+    def get_daily_motivation(self) -> str:
+        return self._call("get_daily_motivation")
+
+def get_analyzer(socket_path: str, use_cache: bool = True, use_daemon: bool = True) -> NLPAnalyzer:
+    """Analyzer backed by the running daemon if there is one, else one that loads models here."""
+    if use_daemon and is_running(socket_path):
+        return DaemonAnalyzer(socket_path, use_cache=use_cache)
+    return NLPAnalyzer(use_cache=use_cache)
+
+def run_daemon(socket_path: str):
+    """Load every component once and serve analysis requests until stopped."""
+    analyzer = NLPAnalyzer()
+    # Same loaded components, for requests made with --no-cache
+    uncached_analyzer = NLPAnalyzer(use_cache=False)
+    uncached_analyzer._components = analyzer._components
+    
+    print("🔄 Loading models for the daemon...")
+    for component in analyzer._components.values():
+        try:
+            component.get()
+        except Exception as e:
+            # Served on demand instead; requests needing it report the error
+            print(f"Warning: Could not load {component.name}: {e}")
+    
+    actions = {"analyze_text", "get_daily_motivation"}
+    
+    def handle(message: Dict[str, Any]):
+        action = message.pop("action", None)
+        if action not in actions:
+            raise ValueError(f"Unknown action: {action}")
+        target = analyzer if message.pop("use_cache", True) else uncached_analyzer
+        return getattr(target, action)(**message)
+    
+    print(f"✅ Daemon listening on {socket_path} (stop it with --stop-daemon)")
+    serve(socket_path, handle)
+
+# Analyzer of a bulk worker process, created once per process
+_bulk_analyzer = None
+
+def _init_bulk_worker(use_cache: bool):
+    global _bulk_analyzer
+    _bulk_analyzer = NLPAnalyzer(use_cache=use_cache)
+
+def analyze_records(records: List[Dict[str, Any]], include_summary: bool = True,
+                    include_mood: bool = True, include_motivation: bool = True) -> List[Dict[str, Any]]:
+    """
+    Analyze one batch of corpus records in this process.
+    
+    Args:
+        records (List[Dict]): Records from corpus.read_records
+        
+    Returns:
+        List[Dict]: One output record per input record, in order: its id plus
+            the analysis (without the original text), or its id and an error
+    """
+    texts = [record["text"] for record in records if "text" in record]
+    analyses = iter(_bulk_analyzer.analyze_batch(texts, include_summary, include_mood, include_motivation)
+                    if texts else [])
+    
+    output = []
+    for record in records:
+        if "text" not in record:
+            output.append({"id": record["id"], "error": record["error"]})
+            continue
+        analysis = next(analyses)
+        analysis.pop("original_text", None)
+        output.append({"id": record["id"], **analysis})
+    return output
+
+def run_bulk(source: str, output_path: str, batch_size: int = 32, workers: int = 1, resume: bool = False,
+             use_cache: bool = True, text_field: str = "text", id_field: str = "id", **include) -> int:
+    """
+    Stream a corpus through the analyzer and append the results to a JSONL file.
+    
+    Records are read, batched and written one batch at a time, and at most a
+    few batches per worker are in flight, so memory stays flat however large
+    the corpus is. Results are written in input order and checkpointed after
+    every batch; ``resume`` continues an interrupted run.
+    
+    Args:
+        source (str): JSONL file, directory of text files, or "-" for stdin
+        output_path (str): Results JSONL file
+        batch_size (int): Records per batched model call
+        workers (int): Worker processes, each with its own models; 1 analyzes in this process
+        resume (bool): Continue from the output's checkpoint
+        include: include_summary / include_mood / include_motivation flags
+        
+    Returns:
+        int: Number of records analyzed in this run
+    """
+    writer = CheckpointedWriter(output_path, source, resume=resume)
+    if writer.finished:
+        print(f"✅ {source} was already fully analyzed into {output_path}", file=sys.stderr)
+        writer.close()
+        return 0
+    if writer.records_done:
+        print(f"↩️  Resuming after {writer.records_done} records", file=sys.stderr)
+    
+    records = read_records(source, text_field=text_field, id_field=id_field)
+    for _ in range(writer.records_done):
+        if next(records, None) is None:
+            break
+    batches = batched(records, batch_size)
+    
+    progress = ProgressReporter(already_done=writer.records_done)
+    
+    def write(results: List[Dict[str, Any]]):
+        writer.write_batch(results)
+        progress.update(len(results), failed=sum(1 for r in results if "error" in r))
+    
+    finished = False
+    try:
+        if workers <= 1:
+            _init_bulk_worker(use_cache)
+            for batch in batches:
+                write(analyze_records(batch, **include))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_bulk_worker,
+                                     initargs=(use_cache,)) as pool:
+                # Bounded window of batches in flight, collected in submission order
+                in_flight = deque()
+                for batch in batches:
+                    in_flight.append(pool.submit(analyze_records, batch, **include))
+                    if len(in_flight) >= workers * 2:
+                        write(in_flight.popleft().result())
+                while in_flight:
+                    write(in_flight.popleft().result())
+        finished = True
+    finally:
+        writer.close(finished=finished)
+        progress.report(final=True)
+    
+    return progress.records
 
 def main():
     """Main CLI interface."""
@@ -229,6 +642,8 @@ Examples:
   python nlp_analyzer.py --file input.txt --save output.json
   python nlp_analyzer.py --daily
   python nlp_analyzer.py "Stressed about work" --no-summary
+  python nlp_analyzer.py --daemon &    # keep models loaded for later invocations
+  python nlp_analyzer.py --bulk entries.jsonl --output results.jsonl --workers 4
         """
     )
     
@@ -240,13 +655,57 @@ Examples:
     parser.add_argument("--no-mood", action="store_true", help="Skip mood detection")
     parser.add_argument("--no-motivation", action="store_true", help="Skip motivation generation")
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not store cached results")
+    parser.add_argument("--daemon", action="store_true", help="Keep the models loaded and serve later invocations over a Unix socket")
+    parser.add_argument("--stop-daemon", action="store_true", help="Stop a running daemon")
+    parser.add_argument("--no-daemon", action="store_true", help="Analyze in this process even if a daemon is running")
+    
+    bulk = parser.add_argument_group("bulk mode")
+    bulk.add_argument("--bulk", metavar="SOURCE", help="Analyze a corpus: a JSONL file, a directory of .txt/.md files, or - for JSONL on stdin")
+    bulk.add_argument("--output", "-o", default="nlp_bulk_results.jsonl", help="Results JSONL file (default: nlp_bulk_results.jsonl)")
+    bulk.add_argument("--batch-size", type=int, default=32, help="Records per batched model call (default: 32)")
+    bulk.add_argument("--workers", type=int, default=1, help="Worker processes, each loading its own models (default: 1)")
+    bulk.add_argument("--resume", action="store_true", help="Continue an interrupted run from the output's checkpoint")
+    bulk.add_argument("--text-field", default="text", help="JSONL field holding the text (default: text)")
+    bulk.add_argument("--id-field", default="id", help="JSONL field holding the record id (default: id, else the line number)")
     
     args = parser.parse_args()
+    socket_path = os.getenv("NLP_DAEMON_SOCKET") or default_socket_path("nlp_analyzer")
+    
+    if args.daemon:
+        run_daemon(socket_path)
+        return
+    
+    if args.stop_daemon:
+        try:
+            request(socket_path, {"action": "shutdown"})
+            print("🛑 Daemon stopped")
+        except DaemonUnavailable:
+            print("No daemon is running")
+        return
+    
+    if args.bulk:
+        try:
+            run_bulk(
+                args.bulk, args.output,
+                batch_size=max(1, args.batch_size),
+                workers=args.workers,
+                resume=args.resume,
+                use_cache=not args.no_cache,
+                text_field=args.text_field,
+                id_field=args.id_field,
+                include_summary=not args.no_summary,
+                include_mood=not args.no_mood,
+                include_motivation=not args.no_motivation
+            )
+        except Exception as e:
+            print(f"❌ Error: {e}")
+        return
     
     # Handle daily motivation
     if args.daily:
         try:
-            analyzer = NLPAnalyzer()
+            analyzer = get_analyzer(socket_path, use_daemon=not args.no_daemon)
             print(analyzer.get_daily_motivation())
         except Exception as e:
             print(f"❌ Error: {e}")
@@ -278,11 +737,11 @@ Examples:
         return
     
     try:
-        # Initialize analyzer
-        analyzer = NLPAnalyzer()
+        # Reuse the daemon's loaded models when one is running
+        analyzer = get_analyzer(socket_path, use_cache=not args.no_cache, use_daemon=not args.no_daemon)
         
-        # Perform analysis
-        results = analyzer.analyze_text(
+        # Perform analysis once; every output below renders these results
+        result = analyzer.analyze(
             text,
             include_summary=not args.no_summary,
             include_mood=not args.no_mood,
@@ -291,13 +750,13 @@ Examples:
         
         # Output results
         if args.json:
-            print(json.dumps(results, indent=2, ensure_ascii=False))
+            print(result.to_json())
         else:
-            print(analyzer.quick_analysis(text))
+            print(result.render_text())
         
         # Save results if requested
         if args.save:
-            saved_file = analyzer.save_analysis(results, args.save)
+            saved_file = result.save(args.save)
             print(f"\n💾 Results saved to: {saved_file}")
     
     except Exception as e:
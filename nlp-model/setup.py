@@ -64,6 +64,27 @@ def download_nltk_data():
         print(f"❌ Error downloading NLTK data: {e}")
         return False
 
+def download_spacy_model():
+    """Download the spaCy pipeline behind the shared linguistic layer."""
+    model_name = os.getenv("SPACY_MODEL", "en_core_web_sm")
+    print(f"🔤 Downloading spaCy model {model_name}...")
+    
+    try:
+        result = subprocess.run([
+            sys.executable, "-m", "spacy", "download", model_name
+        ], capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            print("✅ spaCy model downloaded successfully!")
+            return True
+        else:
+            print(f"❌ Error downloading spaCy model: {result.stderr}")
+            return False
+            
+    except Exception as e:
+        print(f"❌ Error downloading spaCy model: {e}")
+        return False
+
 def test_model_loading():
     """Test if models can be loaded successfully."""
     print("🧪 Testing model loading...")
@@ -175,7 +196,7 @@ def main():
     print("=" * 60)
     
     success_count = 0
-    total_steps = 4
+    total_steps = 5
     
     # Step 1: Install requirements
     if install_requirements():
@@ -185,11 +206,15 @@ def main():
     if download_nltk_data():
         success_count += 1
     
-    # Step 3: Test model loading
+    # Step 3: Download spaCy model
+    if download_spacy_model():
+        success_count += 1
+    
+    # Step 4: Test model loading
     if test_model_loading():
         success_count += 1
     
-    # Step 4: Create sample files
+    # Step 5: Create sample files
     if create_sample_files():
         success_count += 1
     
@@ -220,7 +245,7 @@ def main():
         print("1. Make sure you have Python 3.8+ installed")
         print("2. Check your internet connection for downloading models")
         print("3. Try running: pip install --upgrade pip")
-        print("4. Install packages manually: pip install transformers torch nltk textblob scikit-learn")
+        print("4. Install packages manually: pip install transformers torch nltk spacy textblob scikit-learn")
     
     print("\n📚 For more information, check README.md")
 
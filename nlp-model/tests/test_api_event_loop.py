@@ -0,0 +1,113 @@
+"""
+Tests that the API's async endpoints keep model and cache calls off the event loop.
+"""
+
+import asyncio
+import importlib
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from component_loader import LazyComponent
+
+
+class RecordingSummarizer:
+    """Stand-in for TextSummarizer that records the thread of every model call."""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def get_model_version(self):
+        return "stub"
+
+    def extractive_summarize(self, text, num_sentences=3):
+        self.calls.append(("extractive_summarize", threading.current_thread()))
+        return text.split(". ")[0]
+
+    def get_key_phrases(self, text, num_phrases=5):
+        self.calls.append(("get_key_phrases", threading.current_thread()))
+        return ["presentation"]
+
+
+class RecordingCache:
+    """Stand-in for ResultCache that records the thread of every lookup and store."""
+
+    def __init__(self, calls):
+        self.calls = calls
+        self.values = {}
+
+    def get(self, key):
+        self.calls.append(("cache.get", threading.current_thread()))
+        return self.values.get(key.digest)
+
+    def set(self, key, value):
+        self.calls.append(("cache.set", threading.current_thread()))
+        self.values[key.digest] = value
+
+    def get_stats(self):
+        self.calls.append(("cache.get_stats", threading.current_thread()))
+        return {"size": len(self.values)}
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.setenv("MODEL_WARMUP", "0")
+    monkeypatch.setenv("NLP_CACHE_DB", str(tmp_path / "results.sqlite"))
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(__file__), '..', 'api'))
+    main = importlib.import_module("main")
+
+    # Thread objects, not idents: an ident can be reused once a loop's thread has exited
+    calls, loop_threads = [], []
+    monkeypatch.setitem(main.components, "summarizer", LazyComponent("summarizer", lambda: RecordingSummarizer(calls)))
+    monkeypatch.setattr(main, "result_cache", RecordingCache(calls))
+
+    # The response is built on the event loop, which tells us the loop's thread
+    build_summary_response = main.build_summary_response
+
+    def recording_build(*args):
+        loop_threads.append(threading.current_thread())
+        return build_summary_response(*args)
+
+    monkeypatch.setattr(main, "build_summary_response", recording_build)
+    return main, calls, loop_threads
+
+
+def test_summarize_runs_model_and_cache_calls_off_the_loop(api):
+    from fastapi.testclient import TestClient
+
+    main, calls, loop_threads = api
+    payload = {"text": "The presentation went badly today. Tomorrow I will try again.", "summary_type": "extractive"}
+
+    # No lifespan: its shutdown hook would stop the module's shared inference executor
+    client = TestClient(main.app)
+    first = client.post("/summarize", json=payload)
+    second = client.post("/summarize", json=payload)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert first.json()["key_phrases"] == ["presentation"]
+
+    names = [name for name, _ in calls]
+    # Computed once, then served from the cache
+    assert names.count("extractive_summarize") == names.count("get_key_phrases") == 1
+    assert names.count("cache.get") == 4 and names.count("cache.set") == 2
+
+    assert loop_threads
+    assert not any(thread is loop_thread for _, thread in calls for loop_thread in loop_threads)
+
+
+def test_cache_stats_are_read_off_the_loop(api):
+    main, calls, _ = api
+
+    async def scenario():
+        return await main.get_cache_stats(), threading.current_thread()
+
+    stats, loop_thread = asyncio.run(scenario())
+
+    assert stats == {"size": 0}
+    assert [name for name, _ in calls] == ["cache.get_stats"]
+    assert calls[0][1] is not loop_thread
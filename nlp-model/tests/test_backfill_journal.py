@@ -0,0 +1,111 @@
+"""
+Tests for the journal backfill, with stand-ins for the models.
+"""
+
+import os
+import sqlite3
+import sys
+import types
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import backfill_journal
+
+
+class FakeSummarizer:
+    def __init__(self, **kwargs):
+        pass
+
+    def smart_summarize(self, text):
+        return {"summary": text.split(".")[0]}
+
+    def smart_summarize_batch(self, texts):
+        return [self.smart_summarize(text) for text in texts]
+
+
+class FakeMoodDetector:
+    failing_words = set()
+
+    def get_model_version(self):
+        return "fake-v1"
+
+    def comprehensive_mood_analysis(self, text):
+        if any(word in text for word in self.failing_words):
+            raise RuntimeError("model error")
+        return {"overall_mood": "calm", "mood_category": "neutral", "confidence": 0.9}
+
+    def comprehensive_mood_analysis_batch(self, texts):
+        return [self.comprehensive_mood_analysis(text) for text in texts]
+
+
+@pytest.fixture
+def journal_db(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "summarizer", types.SimpleNamespace(TextSummarizer=FakeSummarizer))
+    monkeypatch.setitem(sys.modules, "mood_detector", types.SimpleNamespace(MoodDetector=FakeMoodDetector))
+    monkeypatch.setattr(FakeMoodDetector, "failing_words", set())
+
+    path = str(tmp_path / "journal.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE journal_entries (id INTEGER PRIMARY KEY, content TEXT, summary TEXT)")
+    conn.executemany(
+        "INSERT INTO journal_entries (id, content) VALUES (?, ?)",
+        [(i, f"Entry {i}. Something happened.") for i in range(1, 11)]
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def query(path, sql):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+def test_resumes_after_the_last_committed_chunk(journal_db):
+    first = backfill_journal.backfill(journal_db, chunk_size=3, max_rows=6)
+    assert first["rows"] == 6
+    assert query(journal_db, "SELECT last_id FROM nlp_backfill_state") == [(6,)]
+
+    second = backfill_journal.backfill(journal_db, chunk_size=3)
+    assert second["rows"] == 4
+    assert query(journal_db, "SELECT COUNT(*) FROM journal_entry_moods") == [(10,)]
+    assert query(journal_db, "SELECT COUNT(*) FROM journal_entries WHERE summary IS NULL") == [(0,)]
+
+
+def test_failed_entries_are_retried_on_the_next_run(journal_db, monkeypatch):
+    monkeypatch.setattr(FakeMoodDetector, "failing_words", {"Entry 4.", "Entry 7."})
+    first = backfill_journal.backfill(journal_db, chunk_size=3)
+
+    assert first["failed"] == 2
+    # The checkpoint moves past the failures, which are recorded instead
+    assert query(journal_db, "SELECT last_id FROM nlp_backfill_state") == [(10,)]
+    assert query(journal_db, "SELECT entry_id, attempts FROM nlp_backfill_failures ORDER BY entry_id") == [(4, 1), (7, 1)]
+
+    monkeypatch.setattr(FakeMoodDetector, "failing_words", {"Entry 7."})
+    second = backfill_journal.backfill(journal_db, chunk_size=3)
+    assert (second["retried"], second["moods"], second["failed"]) == (2, 1, 1)
+    assert query(journal_db, "SELECT entry_id, attempts FROM nlp_backfill_failures") == [(7, 2)]
+
+    monkeypatch.setattr(FakeMoodDetector, "failing_words", set())
+    backfill_journal.backfill(journal_db, chunk_size=3)
+    assert query(journal_db, "SELECT COUNT(*) FROM nlp_backfill_failures") == [(0,)]
+    assert query(journal_db, "SELECT COUNT(*) FROM journal_entry_moods") == [(10,)]
+
+
+def test_failures_that_need_no_work_are_cleared(journal_db, monkeypatch):
+    monkeypatch.setattr(FakeMoodDetector, "failing_words", {"Entry 4."})
+    backfill_journal.backfill(journal_db, chunk_size=3, summaries=False)
+
+    conn = sqlite3.connect(journal_db)
+    conn.execute("DELETE FROM journal_entries WHERE id = 4")
+    conn.commit()
+    conn.close()
+
+    stats = backfill_journal.backfill(journal_db, chunk_size=3, summaries=False)
+    assert stats["retried"] == 0
+    assert query(journal_db, "SELECT COUNT(*) FROM nlp_backfill_failures") == [(0,)]
@@ -0,0 +1,80 @@
+"""
+Tests for the micro-batching scheduler.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from batching import MicroBatcher
+
+
+def doubled(batches):
+    def process(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+    return process
+
+
+def test_concurrent_requests_share_one_batch():
+    batches = []
+    batcher = MicroBatcher(doubled(batches), max_batch_size=16, max_wait_ms=20)
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert asyncio.run(scenario()) == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2, 3, 4]]
+    assert batcher.get_stats()["largest_batch"] == 5
+
+
+def test_full_batches_flush_without_waiting():
+    batches = []
+    # A wait this long would time the test out if full batches waited for the timer
+    batcher = MicroBatcher(doubled(batches), max_batch_size=3, max_wait_ms=60000)
+
+    async def scenario():
+        return await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(6))), timeout=5)
+
+    assert asyncio.run(scenario()) == [0, 2, 4, 6, 8, 10]
+    assert batches == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_a_lone_request_is_flushed_after_the_wait():
+    batches = []
+    batcher = MicroBatcher(doubled(batches), max_batch_size=16, max_wait_ms=5)
+
+    assert asyncio.run(batcher.submit(21)) == 42
+    assert batches == [[21]]
+
+
+def test_batch_failure_reaches_every_waiting_request():
+    def failing(items):
+        raise ValueError("model error")
+
+    batcher = MicroBatcher(failing, max_batch_size=16, max_wait_ms=5)
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert batcher.get_stats()["batches_processed"] == 0
+
+
+def test_custom_runner_runs_the_batches():
+    calls = []
+
+    async def runner(fn, items):
+        calls.append(len(items))
+        return fn(items)
+
+    batcher = MicroBatcher(doubled([]), max_batch_size=2, max_wait_ms=5, runner=runner)
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+    assert asyncio.run(scenario()) == [0, 2, 4]
+    assert sorted(calls) == [1, 2]
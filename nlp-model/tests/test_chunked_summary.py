@@ -0,0 +1,81 @@
+"""
+Tests for chunked (map-reduce) abstractive summarization, with a stub model instead of BART.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from summarizer import TextSummarizer
+
+BUDGET = 40
+
+
+class StubSummarizationPipeline:
+    """Summarization-pipeline stand-in that keeps the first four words of each input."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, max_length=150, min_length=30, do_sample=False, truncation=True, batch_size=1):
+        self.calls.append(list(texts))
+        return [{"summary_text": " ".join(text.split()[:4])} for text in texts]
+
+
+def sentences(topic: str, count: int):
+    return [f"On day {i} the {topic} took most of my time and energy." for i in range(count)]
+
+
+@pytest.fixture
+def summarizer():
+    # No tokenizer on the stub, so tokens are estimated as 4/3 per word (16 per sentence above)
+    summarizer = TextSummarizer(load_abstractive=False, chunk_token_budget=BUDGET)
+    summarizer.abstractive_model = StubSummarizationPipeline()
+    return summarizer
+
+
+def test_long_text_is_summarized_chunk_by_chunk(summarizer):
+    text = " ".join(sentences("project", 6))
+
+    summary = summarizer.abstractive_summarize(text)
+
+    chunk_call, final_call = summarizer.abstractive_model.calls
+    assert len(chunk_call) == 3
+    assert all(summarizer._count_tokens(chunk) <= BUDGET for chunk in chunk_call)
+    # Two sentences per chunk, then one call over the joined chunk summaries
+    assert final_call == ["On day 0 the On day 2 the On day 4 the"]
+    assert summary == "On day 0 the"
+
+
+def test_short_text_is_summarized_in_one_call(summarizer):
+    summarizer.abstractive_summarize("A short entry about my day.")
+
+    assert summarizer.abstractive_model.calls == [["A short entry about my day."]]
+
+
+def test_chunks_of_a_batch_share_one_call_and_are_cached(summarizer):
+    texts = [" ".join(sentences("project", 6)), "A short entry.", " ".join(sentences("move", 4))]
+
+    first = summarizer.abstractive_summarize_batch(texts)
+    chunk_call, final_call = summarizer.abstractive_model.calls
+    assert len(chunk_call) == 5
+    assert len(final_call) == 3
+
+    # The chunk summaries are reused; only the final summaries run again
+    summarizer.abstractive_model.calls.clear()
+    assert summarizer.abstractive_summarize_batch(texts) == first
+    assert [len(call) for call in summarizer.abstractive_model.calls] == [3]
+
+
+def test_overlong_sentence_is_split_into_word_windows(summarizer):
+    sentence = " ".join(f"word{i}" for i in range(90))
+
+    chunks = summarizer._chunk_text([sentence])
+
+    assert len(chunks) > 1
+    assert " ".join(chunks).split() == sentence.split()
+    assert all(summarizer._count_tokens(chunk) <= BUDGET for chunk in chunks)
@@ -0,0 +1,45 @@
+"""
+Tests for the lazily loaded model components and their environment settings.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from component_loader import LazyComponent, create_components, model_settings
+
+
+def test_component_loads_once():
+    built = []
+    component = LazyComponent("thing", lambda: built.append(1) or object())
+
+    assert not component.loaded
+    assert component.get() is component.get()
+    assert built == [1]
+    assert component.state == "loaded"
+
+
+def test_settings_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv("NLP_INCREMENTAL", "true")
+    monkeypatch.setenv("INFERENCE_BACKEND", "ONNX")
+    monkeypatch.setenv("MOOD_FUSED", "1")
+    monkeypatch.delenv("SUMMARIZER_QUANTIZE", raising=False)
+
+    settings = model_settings()
+    assert settings["incremental"] is True
+    assert settings["inference_backend"] == "onnx"
+    assert settings["fused_mood"] is True
+    assert settings["quantize_summarizer"] is False
+
+
+def test_components_are_built_with_the_settings(monkeypatch):
+    monkeypatch.setenv("NLP_INCREMENTAL", "1")
+    components = create_components()
+
+    assert set(components) == {"motivator", "summarizer", "mood_detector", "abstractive_model"}
+    assert not any(component.loaded for component in components.values())
+    summarizer = components["summarizer"].get()
+    assert summarizer.incremental
+    assert summarizer.abstractive_model is None
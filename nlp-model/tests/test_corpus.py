@@ -0,0 +1,99 @@
+"""
+Tests for corpus streaming and resumable result output.
+"""
+
+import itertools
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from corpus import CheckpointedWriter, batched, read_records
+
+
+def read_output(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_resume_drops_output_after_the_last_checkpoint(tmp_path):
+    output = str(tmp_path / "results.jsonl")
+    writer = CheckpointedWriter(output, "journal.jsonl")
+    writer.write_batch([{"id": 1}, {"id": 2}])
+
+    # Interrupted while writing the next batch: a line made it to disk without a checkpoint
+    writer._file.write(json.dumps({"id": 3}) + "\n")
+    writer._file.flush()
+    writer._file.close()
+
+    resumed = CheckpointedWriter(output, "journal.jsonl", resume=True)
+    assert resumed.records_done == 2
+    resumed.write_batch([{"id": 3}, {"id": 4}])
+    resumed.close(finished=True)
+
+    assert read_output(output) == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert CheckpointedWriter(output, "journal.jsonl", resume=True).finished
+
+
+def test_resume_refuses_another_source(tmp_path):
+    output = str(tmp_path / "results.jsonl")
+    CheckpointedWriter(output, "journal.jsonl").close()
+
+    with pytest.raises(ValueError):
+        CheckpointedWriter(output, "other.jsonl", resume=True)
+
+
+def test_without_resume_the_output_starts_over(tmp_path):
+    output = str(tmp_path / "results.jsonl")
+    writer = CheckpointedWriter(output, "journal.jsonl")
+    writer.write_batch([{"id": 1}])
+    writer.close()
+
+    restarted = CheckpointedWriter(output, "journal.jsonl")
+    assert restarted.records_done == 0
+    restarted.close()
+    assert read_output(output) == []
+
+
+def test_read_records_from_jsonl(tmp_path):
+    source = tmp_path / "journal.jsonl"
+    source.write_text(
+        '{"id": "a", "text": "First entry"}\n'
+        '\n'
+        '"Just a string"\n'
+        'not json at all\n'
+        '{"id": "b", "body": "wrong field"}\n',
+        encoding='utf-8'
+    )
+
+    records = list(read_records(str(source)))
+    assert records[:3] == [
+        {"id": "a", "text": "First entry"},
+        {"id": 2, "text": "Just a string"},
+        {"id": 3, "text": "not json at all"},
+    ]
+    assert records[3]["id"] == "b" and "error" in records[3]
+
+
+def test_read_records_from_a_directory_in_sorted_order(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "entry.txt").write_text("Second\n", encoding='utf-8')
+    (tmp_path / "a.md").write_text("First", encoding='utf-8')
+    (tmp_path / "ignored.json").write_text("{}", encoding='utf-8')
+
+    assert list(read_records(str(tmp_path))) == [
+        {"id": "a.md", "text": "First"},
+        {"id": os.path.join("b", "entry.txt"), "text": "Second"},
+    ]
+
+
+def test_batched_does_not_read_ahead():
+    consumed = []
+    source = (consumed.append(i) or i for i in itertools.count())
+
+    batches = batched(source, 3)
+    assert next(batches) == [0, 1, 2]
+    assert consumed == [0, 1, 2]
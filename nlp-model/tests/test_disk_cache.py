@@ -0,0 +1,51 @@
+"""
+Tests for the SQLite result store shared between processes.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from disk_cache import DiskResultStore
+
+
+def test_round_trip(tmp_path):
+    store = DiskResultStore(str(tmp_path / "results.sqlite"))
+    store.set("a", {"summary": "text"}, "summary", "v1")
+
+    assert store.get("a") == {"summary": "text"}
+    assert store.get("missing") is None
+
+
+def test_other_versions_are_kept(tmp_path):
+    # Two processes with different model versions share one file
+    path = str(tmp_path / "results.sqlite")
+    first = DiskResultStore(path)
+    second = DiskResultStore(path)
+
+    first.set("torch-key", {"mood": "calm"}, "mood", "backend=torch")
+    second.set("onnx-key", {"mood": "calm"}, "mood", "backend=onnx")
+    first.set("torch-key-2", {"mood": "sad"}, "mood", "backend=torch")
+
+    assert first.get("onnx-key") == {"mood": "calm"}
+    assert second.get("torch-key") == {"mood": "calm"}
+    assert second.get("torch-key-2") == {"mood": "sad"}
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    store = DiskResultStore(str(tmp_path / "results.sqlite"), max_entries=3, max_bytes=None)
+    store.TOUCH_INTERVAL = 0
+    for i in range(3):
+        store.set(f"k{i}", i, "summary", "v1")
+        # Distinct access times so the LRU order is deterministic
+        store._connection().execute("UPDATE results SET accessed_at = ? WHERE key = ?", (i, f"k{i}"))
+
+    store.get("k0")
+    store.set("k3", 3, "summary", "v1")
+    store.prune()
+
+    assert store.get("k1") is None
+    assert store.get("k0") == 0
+    assert store.get("k3") == 3
+    assert store.get_stats()["entries"] == 3
@@ -0,0 +1,103 @@
+"""
+Tests that a document's summary and key phrases share one sentence split and one
+TF-IDF fit, with a stub linguistic layer instead of spaCy.
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from linguistics import ParsedText
+from summarizer import TextSummarizer
+
+TEXTS = [
+    "Work was stressful this week. The deadline kept moving. My manager asked for updates every day. "
+    "I finally finished the report on Friday.",
+    "We hiked up the hill on Saturday. The weather was perfect. My sister brought sandwiches. "
+    "We stayed until sunset and talked about our plans."
+]
+
+
+class StubLayer:
+    """Linguistic layer stand-in: splits on periods, noun chunks are capitalized words."""
+
+    def __init__(self):
+        self.parsed_texts = []
+        self.lock = threading.Lock()
+
+    def supports(self, feature):
+        return True
+
+    def get_version(self):
+        return "stub"
+
+    def parse_batch(self, texts, features=("sentences",)):
+        with self.lock:
+            self.parsed_texts.append(list(texts))
+        results = []
+        for text in texts:
+            sentences = [s.strip() + "." for s in text.split(".") if s.strip()]
+            chunks = [(word, i) for i, sentence in enumerate(sentences) for word in sentence.split()[1:] if word.istitle()]
+            results.append(ParsedText(sentences=sentences, noun_chunks=chunks))
+        return results
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    summarizer = TextSummarizer(load_abstractive=False)
+    summarizer.linguistics = StubLayer()
+    summarizer.fits = []
+    fit_tfidf = summarizer._fit_tfidf
+
+    def counting_fit(sentences):
+        summarizer.fits.append(list(sentences))
+        return fit_tfidf(sentences)
+
+    monkeypatch.setattr(summarizer, "_fit_tfidf", counting_fit)
+    return summarizer
+
+
+def test_summaries_and_key_phrases_share_one_split_and_fit(summarizer):
+    text = TEXTS[0]
+
+    extractive = summarizer.extractive_summarize(text, 2)
+    graph = summarizer.graph_summarize(text, 2)
+    key_phrases = summarizer.get_key_phrases(text)
+    top_terms = summarizer._top_terms(text, 5)
+
+    assert summarizer.linguistics.parsed_texts == [[text]]
+    assert len(summarizer.fits) == 1
+    assert extractive and graph and key_phrases and top_terms
+
+
+def test_batches_are_parsed_in_one_pass(summarizer):
+    summarizer.smart_summarize_batch(TEXTS, ["extractive", "graph"])
+    summarizer.get_key_phrases_batch(TEXTS)
+
+    assert summarizer.linguistics.parsed_texts == [TEXTS]
+    assert len(summarizer.fits) == 2
+
+
+def test_concurrent_requests_for_one_text_parse_it_once(summarizer):
+    text = TEXTS[1]
+    start = threading.Barrier(8)
+    results = []
+
+    def request(i):
+        start.wait()
+        results.append(summarizer.extractive_summarize(text, 2) if i % 2 else summarizer._top_terms(text, 5))
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert summarizer.linguistics.parsed_texts == [[text]]
+    assert len(summarizer.fits) == 1
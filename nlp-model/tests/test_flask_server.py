@@ -0,0 +1,49 @@
+"""
+Tests for the Flask server's background warm-up and readiness.
+"""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+import component_loader
+
+
+@pytest.fixture
+def flask_server(tmp_path, monkeypatch):
+    started = []
+    monkeypatch.setenv("MODEL_WARMUP", "1")
+    monkeypatch.setenv("NLP_CACHE_DB", str(tmp_path / "results.sqlite"))
+    monkeypatch.setattr(component_loader, "start_background_warmup", lambda components: started.append(list(components)))
+    sys.modules.pop("flask_server", None)
+    module = importlib.import_module("flask_server")
+    module.started = started
+    yield module
+    sys.modules.pop("flask_server", None)
+
+
+def test_warmup_starts_on_import_once_per_process(flask_server):
+    # Imported the way a WSGI server imports it, not run as __main__
+    assert len(flask_server.started) == 1
+
+    flask_server.app.test_client().get("/health")
+    assert len(flask_server.started) == 1
+
+
+def test_ready_reports_the_loaded_components(flask_server):
+    client = flask_server.app.test_client()
+    assert client.get("/ready").status_code == 503
+
+    for component in flask_server.components.values():
+        component._value = object()
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.get_json()["ready"] is True
@@ -0,0 +1,60 @@
+"""
+Tests for the corpus IDF table.
+"""
+
+import os
+import sys
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+
+from idf_table import IdfTable
+
+DOCUMENTS = [["work", "deadline"], ["work", "family"], ["work", "dinner", "family"]]
+
+
+def test_idf_matches_sklearn_smoothing():
+    table = IdfTable()
+    assert table.add_documents(DOCUMENTS) == 3
+
+    vectorizer = TfidfVectorizer(analyzer=lambda tokens: tokens).fit(DOCUMENTS)
+    for term, index in vectorizer.vocabulary_.items():
+        assert np.isclose(table.idf(term), vectorizer.idf_[index])
+    # Unseen terms weigh the most
+    assert table.idf("holiday") > table.idf("deadline")
+
+
+def test_incremental_update_equals_counting_everything_at_once():
+    incremental = IdfTable()
+    incremental.add_documents(DOCUMENTS[:2])
+    incremental.add_documents(DOCUMENTS[2:])
+
+    at_once = IdfTable()
+    at_once.add_documents(DOCUMENTS)
+    assert incremental.document_frequency == at_once.document_frequency
+    assert incremental.num_documents == at_once.num_documents
+
+
+def test_transform_rows_are_normalized():
+    table = IdfTable()
+    table.add_documents(DOCUMENTS)
+
+    matrix, terms = table.transform([["work", "deadline", "work"], ["family"], []])
+    assert list(terms) == ["work", "deadline", "family"]
+    assert np.allclose(np.linalg.norm(matrix[:2], axis=1), 1.0)
+    assert not matrix[2].any()
+    expected = np.array([2 * table.idf("work"), table.idf("deadline"), 0])
+    assert np.allclose(matrix[0], expected / np.linalg.norm(expected))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    table = IdfTable(last_entry_id=42)
+    table.add_documents(DOCUMENTS)
+    path = str(tmp_path / "idf_table.npz")
+    table.save(path)
+
+    loaded = IdfTable.load(path)
+    assert loaded.document_frequency == table.document_frequency
+    assert (loaded.num_documents, loaded.last_entry_id) == (3, 42)
@@ -0,0 +1,82 @@
+"""
+Tests for the sentence-level incremental mode, with a stub classifier instead of the models.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from mood_detector import MoodDetector
+from summarizer import TextSummarizer
+
+ENTRY = "Today was a great day at work. The commute was awful. Dinner was great."
+EDITED = "Today was a great day at work. The commute was fine. Dinner was great."
+
+
+class StubClassifier:
+    """Pipeline-style classifier: "great" sentences are positive, others negative."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, top_k=None, truncation=True, batch_size=1):
+        self.calls.append(list(texts))
+        positive = [1.0 if "great" in text else 0.0 for text in texts]
+        return [[{"label": "positive", "score": p}, {"label": "negative", "score": 1.0 - p}] for p in positive]
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    monkeypatch.setattr(MoodDetector, "_download_nltk_data", lambda self: None)
+    monkeypatch.setattr(MoodDetector, "_initialize_models", lambda self: None)
+    detector = MoodDetector(incremental=True)
+    detector.sentiment_analyzer = StubClassifier()
+    return detector
+
+
+def test_only_new_or_changed_sentences_are_scored(detector):
+    detector.analyze_sentiment_advanced_batch([ENTRY])
+    detector.analyze_sentiment_advanced_batch([EDITED])
+
+    assert detector.sentiment_analyzer.calls == [
+        ["Today was a great day at work.", "The commute was awful.", "Dinner was great."],
+        ["The commute was fine."]
+    ]
+
+
+def test_sentence_scores_are_weighted_by_word_count(detector):
+    distribution = detector._sentence_distributions(
+        ["Today was a great day at work. The commute was awful."],
+        detector.sentiment_analyzer,
+        detector.sentence_sentiment_cache
+    )[0]
+
+    # 7 positive words, 4 negative ones
+    assert distribution["positive"] == pytest.approx(7 / 11)
+    assert detector.analyze_sentiment_advanced("Today was a great day at work. The commute was awful.")["sentiment"] == "positive"
+
+
+def test_mode_is_part_of_the_model_version(detector):
+    incremental = detector.get_model_version()
+    detector.incremental = False
+
+    assert incremental != detector.get_model_version()
+
+
+def test_incremental_summaries_match_and_reuse_sentence_tokens(monkeypatch):
+    document = TextSummarizer(load_abstractive=False)
+    incremental = TextSummarizer(load_abstractive=False, incremental=True)
+    text = " ".join([ENTRY, "I went for a long walk after dinner.", "Tomorrow I will leave earlier."])
+
+    assert incremental.smart_summarize(text, summary_type="extractive") == document.smart_summarize(text, summary_type="extractive")
+
+    tokenized = []
+    analyzer = incremental._analyzer
+    monkeypatch.setattr(incremental, "_analyzer", lambda sentence: tokenized.append(sentence) or analyzer(sentence))
+    edited = text.replace(ENTRY, EDITED)
+    assert incremental.smart_summarize(edited, summary_type="extractive") == document.smart_summarize(edited, summary_type="extractive")
+    assert tokenized == ["The commute was fine."]
@@ -0,0 +1,110 @@
+"""
+Tests for the bounded inference executor and the 503 it turns into in the API.
+"""
+
+import asyncio
+import importlib
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from inference_executor import ExecutorBusyError, InferenceExecutor
+
+
+def test_rejects_jobs_beyond_capacity():
+    executor = InferenceExecutor(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ExecutorBusyError):
+            await executor.run(lambda: "rejected")
+        assert executor.get_stats()["running"] == 1
+        assert executor.get_stats()["queued"] == 1
+
+        release.set()
+        return await running, await queued
+
+    try:
+        assert asyncio.run(scenario()) == (True, "queued")
+        stats = executor.get_stats()
+        assert (stats["completed"], stats["rejected"], stats["running"], stats["queued"]) == (2, 1, 0, 0)
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_cancelled_caller_keeps_the_slot_until_the_job_finishes():
+    executor = InferenceExecutor(max_workers=1, max_queue_size=0)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_job():
+        started.set()
+        release.wait()
+
+    async def scenario():
+        caller = asyncio.ensure_future(executor.run(blocking_job))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        # The worker thread is still busy, so there is still no room for another job
+        with pytest.raises(ExecutorBusyError):
+            await asyncio.wait_for(executor.run(lambda: "too early"), timeout=1)
+
+        release.set()
+        await asyncio.sleep(0.05)
+        return await executor.run(lambda: "after release")
+
+    try:
+        assert asyncio.run(scenario()) == "after release"
+        assert executor.get_stats()["running"] == 0
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_failures_are_counted_and_raised():
+    executor = InferenceExecutor(max_workers=1, max_queue_size=0)
+
+    def failing_job():
+        raise ValueError("model error")
+
+    try:
+        with pytest.raises(ValueError):
+            asyncio.run(executor.run(failing_job))
+        stats = executor.get_stats()
+        assert (stats["failed"], stats["completed"], stats["running"]) == (1, 0, 0)
+    finally:
+        executor.shutdown()
+
+
+def test_busy_executor_answers_503(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("MODEL_WARMUP", "0")
+    monkeypatch.setenv("NLP_CACHE_DB", str(tmp_path / "results.sqlite"))
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(__file__), '..', 'api'))
+    main = importlib.import_module("main")
+
+    async def busy(fn, *args, **kwargs):
+        raise ExecutorBusyError("Inference queue is full (34/34 jobs)")
+
+    monkeypatch.setattr(main.inference_executor, "run", busy)
+    client = TestClient(main.app)
+    response = client.post("/summarize", json={
+        "text": "The presentation went badly today. Tomorrow I will try again and do better.",
+        "summary_type": "extractive"
+    })
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["error"] == "Server busy"
@@ -0,0 +1,66 @@
+"""
+Tests for multi-word key phrase extraction.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+
+from key_phrases import KeyPhraseExtractor
+from linguistics import ParsedText
+
+TEXT = ("The project deadline is killing me. I stayed late to finish the quarterly report. "
+        "My manager praised the quarterly report, but the project deadline moved again.")
+
+
+def test_phrases_split_at_stop_words_and_punctuation():
+    extractor = KeyPhraseExtractor()
+    phrases = extractor.extract(TEXT, num_phrases=5)
+
+    assert "project deadline" in phrases
+    assert "quarterly report" in phrases
+    assert all(len(phrase.split()) <= 3 for phrase in phrases)
+    assert not any(word in ("the", "is", "me") for phrase in phrases for word in phrase.split())
+
+
+def test_long_runs_contribute_their_max_word_grams():
+    extractor = KeyPhraseExtractor(max_words=2)
+    assert extractor._runs("quarterly budget review meeting") == [
+        ("quarterly", "budget"), ("budget", "review"), ("review", "meeting")
+    ]
+
+
+def test_near_duplicate_phrases_are_collapsed():
+    text = "Tight deadlines again. The deadline is tomorrow. Deadlines everywhere."
+    phrases = KeyPhraseExtractor().extract(text, num_phrases=5)
+
+    assert sum("deadline" in phrase for phrase in phrases) == 1
+
+
+def test_batch_scores_each_document_separately():
+    extractor = KeyPhraseExtractor()
+    other = "A long walk in the park with my dog. The dog loved the park."
+
+    batch = extractor.extract_batch([TEXT, other, ""], num_phrases=3)
+    assert batch == [extractor.extract(TEXT, 3), extractor.extract(other, 3), []]
+
+
+def test_candidates_come_from_noun_chunks_when_parsed():
+    parsed = ParsedText(
+        sentences=["I met Anna at the coffee shop."],
+        noun_chunks=[("I", 0), ("Anna", 0), ("the coffee shop", 0)],
+        entities=[("Anna", "PERSON", 0)]
+    )
+    phrases = KeyPhraseExtractor().extract("I met Anna at the coffee shop.", 5, parsed=parsed)
+
+    assert set(phrases) == {"coffee shop", "anna"}
+
+
+def test_corpus_idf_changes_the_ranking():
+    text = "Work meeting. Garden roses bloom."
+    extractor = KeyPhraseExtractor()
+
+    rare_garden = extractor.extract(text, 1, idf=lambda word: 5.0 if word in ("garden", "roses") else 1.0)
+    rare_work = extractor.extract(text, 1, idf=lambda word: 5.0 if word in ("work", "meeting") else 1.0)
+    assert rare_garden != rare_work
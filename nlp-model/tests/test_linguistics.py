@@ -0,0 +1,70 @@
+"""
+Tests for the shared linguistic layer (run with whatever spaCy pipeline is installed).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+
+from linguistics import LEMMAS, NOUN_CHUNKS, SENTENCES, LinguisticLayer, get_linguistic_layer
+
+TEXTS = ["I had a long day. The meeting ran late!", "", "Short one.\n\nAnother line after a blank line."]
+
+
+@pytest.fixture(scope="module")
+def layer():
+    return LinguisticLayer()
+
+
+def test_batch_returns_one_result_per_text_in_order(layer):
+    parsed = layer.parse_batch(TEXTS, (SENTENCES, LEMMAS))
+
+    assert [p.sentences for p in parsed][:2] == [["I had a long day.", "The meeting ran late!"], []]
+    assert all(sentence.strip() for sentence in parsed[2].sentences)
+    assert "meeting" in parsed[0].lemmas
+
+
+def test_features_not_requested_stay_empty(layer):
+    parsed = layer.parse(TEXTS[0], (SENTENCES,))
+    assert parsed.lemmas == [] and parsed.noun_chunks == [] and parsed.entities == []
+
+
+def test_unknown_features_are_rejected(layer):
+    with pytest.raises(ValueError):
+        layer.parse_batch(TEXTS, ("sentiment",))
+
+
+def test_recent_splits_are_reused(layer, monkeypatch):
+    text = "The first sentence. The second sentence."
+    layer.parse(text, (SENTENCES, LEMMAS))
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("text parsed again")
+
+    monkeypatch.setattr(layer, "parse_batch", no_parsing)
+    assert layer.sentences(text) == ["The first sentence.", "The second sentence."]
+
+
+def test_parser_splits_are_not_reused_for_senter_splits():
+    spacy = pytest.importorskip("spacy")
+    layer = LinguisticLayer()
+    # A pipeline whose "parser" sets sentence boundaries, as in en_core_web_sm,
+    # next to the cheaper component that sentences_batch runs
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("sentencizer", name="parser")
+    layer._nlp, layer._sentence_component, layer.backend = nlp, "sentencizer", "spacy:test"
+    text = "The first sentence. The second sentence."
+
+    layer.parse(text, (SENTENCES, NOUN_CHUNKS))
+    assert layer.split_cache.get_many([text])[1] == [0]
+
+    layer.parse(text, (SENTENCES, LEMMAS))
+    assert layer.split_cache.get_many([text])[1] == []
+
+
+def test_layer_is_shared_per_pipeline():
+    assert get_linguistic_layer("en_core_web_sm") is get_linguistic_layer("en_core_web_sm")
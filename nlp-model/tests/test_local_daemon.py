@@ -0,0 +1,70 @@
+"""
+Tests for the local daemon's socket location and owner check.
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+import local_daemon
+from local_daemon import DaemonUnavailable, default_socket_path, request, serve
+
+
+def test_socket_goes_in_the_runtime_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    assert default_socket_path("nlp_test") == str(tmp_path / "nlp_test.sock")
+
+
+def test_socket_falls_back_to_a_private_temp_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+
+    path = default_socket_path("nlp_test")
+
+    directory = os.path.dirname(path)
+    assert directory == str(tmp_path / f"nlp_test-{os.getuid()}")
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+
+def test_shared_socket_dir_is_refused(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+    directory = tmp_path / f"nlp_test-{os.getuid()}"
+    directory.mkdir()
+    directory.chmod(0o777)
+
+    with pytest.raises(RuntimeError):
+        default_socket_path("nlp_test")
+
+
+def test_request_round_trip_and_foreign_owner(tmp_path, monkeypatch):
+    path = str(tmp_path / "daemon.sock")
+    server = threading.Thread(target=serve, args=(path, lambda message: message["text"].upper()), daemon=True)
+    server.start()
+    for _ in range(100):
+        if os.path.exists(path):
+            break
+        time.sleep(0.02)
+
+    try:
+        assert request(path, {"action": "analyze", "text": "hello"}, timeout=5) == "HELLO"
+
+        # Same socket, but this process now runs as another user
+        uid = os.getuid()
+        monkeypatch.setattr(local_daemon.os, "getuid", lambda: uid + 1)
+        with pytest.raises(DaemonUnavailable):
+            request(path, {"action": "analyze", "text": "secret"})
+        monkeypatch.undo()
+    finally:
+        request(path, {"action": "shutdown"}, timeout=5)
+        server.join(timeout=5)
+
+    assert not server.is_alive()
@@ -0,0 +1,76 @@
+"""
+Tests for the command-line analyzer that need no transformer models.
+"""
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import nlp_analyzer
+from nlp_analyzer import AnalysisResult, DaemonAnalyzer, NLPAnalyzer
+
+RESULTS = {
+    "original_text": "The presentation went badly. Tomorrow I will try again.",
+    "analysis_timestamp": "2026-01-02 03:04:05",
+    "summary": {"text": "The presentation went badly.", "method": "extractive",
+                "compression_ratio": 50.0, "key_phrases": ["presentation"]},
+    "mood": {"overall_mood": "stressed", "mood_category": "negative", "confidence": 0.8,
+             "description": "Some stress about work.", "suggestions": ["Take a short walk."]}
+}
+
+
+class CountingAnalyzer:
+    """Analyzer stand-in that counts how often a text is analyzed."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def analyze(self, text, include_summary=True, include_mood=True, include_motivation=True):
+        self.calls += 1
+        return AnalysisResult(dict(RESULTS, original_text=text))
+
+
+def test_daemon_analyzer_falls_back_to_lazy_local_components(tmp_path, monkeypatch):
+    monkeypatch.setenv("NLP_CACHE_DB", "")
+    analyzer = DaemonAnalyzer(str(tmp_path / "missing.sock"))
+
+    assert isinstance(analyzer, NLPAnalyzer)
+    assert not any(component.loaded for component in analyzer._components.values())
+
+    # No daemon is listening, so the motivator is loaded here (and only it)
+    assert "DAILY MOTIVATION" in analyzer.get_daily_motivation()
+    assert [name for name, c in analyzer._components.items() if c.loaded] == ["motivator"]
+
+
+def test_outputs_render_the_same_results(tmp_path):
+    result = AnalysisResult(RESULTS)
+
+    text = result.render_text()
+    assert "The presentation went badly." in text and "stressed (negative)" in text
+    assert json.loads(result.to_json()) == RESULTS
+
+    saved = result.save(str(tmp_path / "analysis.json"))
+    with open(saved, encoding="utf-8") as f:
+        assert json.load(f) == RESULTS
+
+
+def test_default_filename_comes_from_the_analysis_timestamp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert AnalysisResult(RESULTS).save() == "nlp_analysis_2026-01-02_03-04-05.json"
+
+
+def test_cli_analyzes_once_for_json_output_and_save(tmp_path, monkeypatch, capsys):
+    analyzer = CountingAnalyzer()
+    monkeypatch.setattr(nlp_analyzer, "get_analyzer", lambda *args, **kwargs: analyzer)
+    saved = tmp_path / "analysis.json"
+    monkeypatch.setattr(sys, "argv", ["nlp_analyzer.py", RESULTS["original_text"], "--json", "--save", str(saved)])
+
+    nlp_analyzer.main()
+
+    assert analyzer.calls == 1
+    printed = capsys.readouterr().out
+    with open(saved, encoding="utf-8") as f:
+        assert json.loads(printed[:printed.index("\n💾")]) == json.load(f) == RESULTS
@@ -0,0 +1,52 @@
+"""
+Tests for the pre-fork launcher's model loading (no real models or forking).
+"""
+
+import importlib
+import os
+import sys
+import types
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from component_loader import LazyComponent
+
+
+def test_parent_loads_without_warming_up_and_workers_skip_warmup(tmp_path, monkeypatch):
+    monkeypatch.setenv("MODEL_WARMUP", "1")
+    monkeypatch.setenv("NLP_CACHE_DB", str(tmp_path / "results.sqlite"))
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(__file__), '..', 'api'))
+    prefork = importlib.import_module("prefork")
+    main = prefork.main
+
+    warmed = []
+    fake = {name: LazyComponent(name, lambda: types.SimpleNamespace(), warmup=lambda value, name=name: warmed.append(name))
+            for name in main.components}
+    monkeypatch.setattr(main, "components", fake)
+    monkeypatch.setattr(main, "MODEL_WARMUP", True)
+    monkeypatch.setattr(prefork.gc, "freeze", lambda: None)
+
+    prefork.prepare_models_for_fork()
+    assert all(component.loaded for component in fake.values())
+    assert warmed == []
+
+    # What a forked worker does before serving; uvicorn itself is replaced
+    monkeypatch.setitem(sys.modules, "uvicorn", types.SimpleNamespace(
+        Config=lambda app, log_level: None,
+        Server=lambda config: types.SimpleNamespace(run=lambda sockets: main.start_model_warmup())
+    ))
+    prefork._run_worker(None, "info", threads=2)
+    assert warmed == []
+    assert main.MODEL_WARMUP is False
+
+
+def test_worker_threads_split_the_cpus(monkeypatch):
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(__file__), '..', 'api'))
+    prefork = importlib.import_module("prefork")
+    monkeypatch.setattr(prefork.os, "cpu_count", lambda: 8)
+    monkeypatch.delenv("TORCH_NUM_THREADS", raising=False)
+
+    assert prefork._worker_threads(4) == 2
+    assert prefork._worker_threads(16) == 1
+    monkeypatch.setenv("TORCH_NUM_THREADS", "3")
+    assert prefork._worker_threads(4) == 3
@@ -0,0 +1,109 @@
+"""
+Tests for the in-process result cache and its persistent backing store.
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from disk_cache import DiskResultStore
+from result_cache import ResultCache, make_cache_key
+
+
+def key(text: str, version: str = "v1"):
+    return make_cache_key("summary", text, {"summary_type": "auto"}, version)
+
+
+def test_key_ignores_whitespace_but_not_options_or_version():
+    assert key("Hello   world\n") == key("Hello world")
+    assert key("Hello world") != key("Hello world", "v2")
+    assert make_cache_key("summary", "Hi", {"summary_type": "graph"}) != make_cache_key("summary", "Hi", {})
+
+
+def test_lru_eviction():
+    cache = ResultCache(max_entries=2, ttl_seconds=0)
+    cache.set(key("a"), 1)
+    cache.set(key("b"), 2)
+    cache.get(key("a"))
+    cache.set(key("c"), 3)
+
+    assert cache.get(key("b")) is None
+    assert cache.get(key("a")) == 1
+    assert cache.get(key("c")) == 3
+    assert cache.evictions == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = ResultCache(max_entries=10, ttl_seconds=60)
+    cache.set(key("a"), 1)
+
+    now[0] += 59
+    assert cache.get(key("a")) == 1
+    now[0] += 2
+    assert cache.get(key("a")) is None
+    assert cache.expirations == 1
+
+
+def test_results_are_copied_in_and_out():
+    cache = ResultCache(max_entries=10)
+    value = {"key_phrases": ["work"]}
+    cache.set(key("a"), value)
+    value["key_phrases"].append("changed by caller")
+
+    first = cache.get(key("a"))
+    first["key_phrases"].append("changed by caller")
+    assert cache.get(key("a")) == {"key_phrases": ["work"]}
+
+
+def test_disk_hits_are_copied(tmp_path):
+    store = DiskResultStore(str(tmp_path / "results.sqlite"))
+    ResultCache(max_entries=10, backing_store=store).set(key("a"), {"key_phrases": ["work"]})
+
+    # A fresh process: memory is empty, the result comes from the store
+    cache = ResultCache(max_entries=10, backing_store=store)
+    cache.get(key("a"))["key_phrases"].append("changed by caller")
+    assert cache.get(key("a")) == {"key_phrases": ["work"]}
+
+
+def test_expired_results_are_not_served_from_disk(tmp_path):
+    store = DiskResultStore(str(tmp_path / "results.sqlite"))
+    cache = ResultCache(max_entries=10, ttl_seconds=60, backing_store=store)
+    cache.set(key("a"), 1)
+    store._connection().execute("UPDATE results SET created_at = created_at - 61")
+
+    cache.clear()
+    assert cache.get(key("a")) is None
+
+
+def test_disk_hits_keep_their_original_expiry(tmp_path, monkeypatch):
+    store = DiskResultStore(str(tmp_path / "results.sqlite"))
+    ResultCache(max_entries=10, ttl_seconds=60, backing_store=store).set(key("a"), 1)
+    store._connection().execute("UPDATE results SET created_at = created_at - 50")
+
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = ResultCache(max_entries=10, ttl_seconds=60, backing_store=store)
+    assert cache.get(key("a")) == 1
+
+    # 50s of the TTL were used up before the read; the memory copy must not live another 60s
+    now[0] += 15
+    store._connection().execute("DELETE FROM results")
+    assert cache.get(key("a")) is None
+
+
+def test_store_hits_count_as_hits(tmp_path):
+    store = DiskResultStore(str(tmp_path / "results.sqlite"))
+    ResultCache(max_entries=10, backing_store=store).set(key("a"), 1)
+
+    cache = ResultCache(max_entries=10, backing_store=store)
+    assert cache.get(key("a")) == 1
+    assert cache.get(key("a")) == 1
+    assert cache.get(key("b")) is None
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["store_hits"], stats["misses"]) == (2, 1, 1)
+    assert stats["hit_rate"] == 0.667
@@ -0,0 +1,62 @@
+"""
+Tests for LexRank scoring and MMR selection over the sentence graph.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+
+from sentence_graph import lexrank_scores, mmr_select, sentence_similarity
+
+
+def normalized(rows):
+    matrix = np.array(rows, dtype=float)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+# Terms: work, deadline, stress, family, dinner
+SENTENCES = normalized([
+    [1, 1, 1, 0, 0],  # 0: central, shares terms with 1, 2 and 3
+    [1, 1, 0, 0, 0],  # 1
+    [1, 1, 0, 0, 0],  # 2: same as 1
+    [0, 0, 1, 1, 0],  # 3
+    [0, 0, 0, 1, 1],  # 4
+])
+
+
+def test_similarity_graph_is_symmetric_without_self_loops():
+    similarity = sentence_similarity(SENTENCES, threshold=0.5)
+    dense = similarity.toarray()
+
+    assert np.allclose(dense, dense.T)
+    assert np.all(np.diag(dense) == 0)
+    # Weak links (sentences 0 and 3 share one term of three) are dropped
+    assert dense[0, 3] == 0 and dense[1, 2] > 0.99
+
+
+def test_lexrank_scores_the_central_sentence_highest():
+    scores = lexrank_scores(sentence_similarity(SENTENCES, threshold=0))
+
+    assert np.isclose(scores.sum(), 1.0)
+    assert int(np.argmax(scores)) == 0
+    assert lexrank_scores(sentence_similarity(np.zeros((0, 5)))).size == 0
+
+
+def test_mmr_skips_a_repeated_sentence():
+    similarity = sentence_similarity(SENTENCES, threshold=0)
+    scores = np.array([0.3, 0.25, 0.25, 0.1, 0.1])
+
+    by_score = mmr_select(scores, similarity, 3, diversity=0)
+    diverse = mmr_select(scores, similarity, 3, diversity=0.5)
+
+    assert by_score == [0, 1, 2]
+    assert not {1, 2} <= set(diverse)
+    assert diverse == sorted(diverse)
+
+
+def test_mmr_returns_every_sentence_when_asked_for_more():
+    similarity = sentence_similarity(SENTENCES[:2], threshold=0)
+    assert mmr_select(np.array([0.6, 0.4]), similarity, 5) == [0, 1]
@@ -0,0 +1,96 @@
+"""
+Tests for the stage graph executor.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from stage_graph import StageGraph
+
+
+def recording_graph(order, lock):
+    def stage(name, value):
+        def run(inputs):
+            with lock:
+                order.append(name)
+            return value(inputs)
+        return run
+
+    graph = StageGraph()
+    graph.add_stage("summary", stage("summary", lambda _: "summary"))
+    graph.add_stage("mood", stage("mood", lambda _: "calm"))
+    graph.add_stage("motivation", stage("motivation", lambda r: f"for {r['mood']}"), after=["mood"])
+    return graph
+
+
+def test_dependents_run_after_their_dependencies_and_get_their_results():
+    order, lock = [], threading.Lock()
+    result = recording_graph(order, lock).run()
+
+    assert result.get("motivation") == "for calm"
+    assert order.index("motivation") > order.index("mood")
+    assert set(result.get_timings()) == {"summary", "mood", "motivation", "total"}
+
+
+def test_async_run_orders_stages_the_same_way():
+    order, lock = [], threading.Lock()
+    result = asyncio.run(recording_graph(order, lock).run_async())
+
+    assert result.get("motivation") == "for calm"
+    assert order.index("motivation") > order.index("mood")
+
+
+def test_independent_stages_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    graph = StageGraph()
+    # Each stage only finishes once the other one has started
+    graph.add_stage("summary", lambda _: barrier.wait() is not None)
+    graph.add_stage("mood", lambda _: barrier.wait() is not None)
+
+    result = graph.run()
+    assert result.errors == {}
+
+    async def waits_for(event_to_set, event_to_wait):
+        event_to_set.set()
+        await asyncio.wait_for(event_to_wait.wait(), timeout=5)
+        return True
+
+    async def scenario():
+        first, second = asyncio.Event(), asyncio.Event()
+        graph = StageGraph()
+        graph.add_stage("summary", lambda _: waits_for(first, second))
+        graph.add_stage("mood", lambda _: waits_for(second, first))
+        return await graph.run_async()
+
+    assert asyncio.run(scenario()).errors == {}
+
+
+def test_stages_behind_a_failure_are_skipped():
+    def fail(_):
+        raise ValueError("model error")
+
+    graph = StageGraph()
+    graph.add_stage("summary", lambda _: "summary")
+    graph.add_stage("mood", fail)
+    graph.add_stage("motivation", lambda r: "never", after=["mood"])
+
+    result = graph.run()
+    assert result.ok("summary")
+    assert isinstance(result.errors["mood"], ValueError)
+    assert not result.ok("motivation")
+    assert "Skipped" in str(result.errors["motivation"])
+
+
+def test_unknown_or_duplicate_stages_are_rejected():
+    graph = StageGraph().add_stage("mood", lambda _: "calm")
+
+    with pytest.raises(ValueError):
+        graph.add_stage("mood", lambda _: "calm")
+    with pytest.raises(ValueError):
+        graph.add_stage("motivation", lambda r: "", after=["missing"])
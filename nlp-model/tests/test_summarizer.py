@@ -0,0 +1,126 @@
+"""
+Tests for the text summarizer that run without the abstractive model.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'models'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from summarizer import TextSummarizer
+
+SHORT_TEXT = ("I had a really challenging day at work today. The presentation went badly. "
+              "My boss gave tough feedback. Tomorrow I will try again and do better.")
+
+
+@pytest.fixture(scope="module")
+def summarizer():
+    return TextSummarizer(load_abstractive=False)
+
+
+def test_result_version_ignores_abstractive_model_for_extractive_results(summarizer, monkeypatch):
+    long_text = " ".join([SHORT_TEXT] * 10)
+    before = {
+        "extractive": summarizer.get_result_version(SHORT_TEXT, summary_type="extractive"),
+        "graph": summarizer.get_result_version(SHORT_TEXT, summary_type="graph"),
+        "short auto": summarizer.get_result_version(SHORT_TEXT, summary_type="auto"),
+        "key phrases": summarizer.get_result_version(SHORT_TEXT, num_phrases=5),
+        "long auto": summarizer.get_result_version(long_text, summary_type="auto"),
+        "abstractive": summarizer.get_result_version(SHORT_TEXT, summary_type="abstractive"),
+    }
+
+    # The abstractive model loads later (e.g. for another request)
+    monkeypatch.setattr(summarizer, "abstractive_model",
+                        SimpleNamespace(model=SimpleNamespace(name_or_path="facebook/bart-large-cnn")))
+    monkeypatch.setattr(summarizer, "precision", "fp32")
+    after = {
+        "extractive": summarizer.get_result_version(SHORT_TEXT, summary_type="extractive"),
+        "graph": summarizer.get_result_version(SHORT_TEXT, summary_type="graph"),
+        "short auto": summarizer.get_result_version(SHORT_TEXT, summary_type="auto"),
+        "key phrases": summarizer.get_result_version(SHORT_TEXT, num_phrases=5),
+        "long auto": summarizer.get_result_version(long_text, summary_type="auto"),
+        "abstractive": summarizer.get_result_version(SHORT_TEXT, summary_type="abstractive"),
+    }
+
+    for name in ("extractive", "graph", "short auto", "key phrases"):
+        assert before[name] == after[name], name
+    for name in ("long auto", "abstractive"):
+        assert before[name] != after[name], name
+
+
+def test_summary_and_key_phrases_share_one_parse(summarizer, monkeypatch):
+    layer = summarizer.linguistics
+    parse_batch = layer.parse_batch
+    calls = []
+
+    def counting_parse_batch(texts, features=("sentences",)):
+        calls.append((list(texts), set(features)))
+        return parse_batch(texts, features)
+
+    # Pretend the pipeline can produce noun chunks and entities, as en_core_web_sm does
+    monkeypatch.setattr(layer, "supports", lambda feature: True)
+    monkeypatch.setattr(layer, "parse_batch", counting_parse_batch)
+    text = "My sister visited on Sunday. We cooked dinner together and talked about her new job."
+
+    summarizer.smart_summarize(text, summary_type="extractive")
+    summarizer.get_key_phrases(text)
+    layer.sentences(text)
+
+    assert calls == [([text], {"sentences", "noun_chunks", "entities"})]
+
+
+def test_graph_summary_does_not_repeat_a_sentence(summarizer):
+    text = ("Work was stressful because of the deadline. Work was stressful because of the deadline. "
+            "The deadline at work made me anxious all week. I cooked dinner with my family in the evening. "
+            "We laughed a lot at dinner.")
+
+    result = summarizer.smart_summarize(text, summary_type="graph")
+    picked = summarizer.analyze_document(text).graph_sentences(3)
+
+    assert result["method"] == "graph"
+    assert len(picked) == len(set(picked)) == 3
+
+
+def test_concurrent_tfidf_fits_do_not_share_state():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    documents = [
+        [f"Entry {i} was about work and deadlines.", f"Entry {i} also mentioned {topic} with friends.",
+         f"The {topic} on day {i} felt calm."]
+        for i, topic in enumerate(["hiking", "cooking", "reading", "painting", "swimming", "gardening"] * 4)
+    ]
+
+    for incremental in (False, True):
+        summarizer = TextSummarizer(load_abstractive=False, incremental=incremental)
+        expected = [summarizer._fit_tfidf(sentences) for sentences in documents]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(summarizer._fit_tfidf, documents * 5))
+
+        for (matrix, names), (expected_matrix, expected_names) in zip(results, expected * 5):
+            assert list(names) == list(expected_names)
+            assert (matrix != expected_matrix).nnz == 0
+        assert not any(isinstance(value, TfidfVectorizer) for value in vars(summarizer).values())
+
+
+def test_concurrent_summaries_match_sequential_ones():
+    texts = [
+        f"Day {i} started early. I worked on the {topic} project for hours. "
+        f"Lunch with the team about {topic} was fun. The evening was quiet and I slept well."
+        for i, topic in enumerate(["budget", "launch", "hiring", "design", "migration", "review"] * 3)
+    ]
+    sequential = TextSummarizer(load_abstractive=False)
+    expected = [(sequential.extractive_summarize(text, 2), sequential.get_key_phrases(text)) for text in texts]
+
+    summarizer = TextSummarizer(load_abstractive=False)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        summaries = pool.map(lambda text: summarizer.extractive_summarize(text, 2), texts)
+        phrases = pool.map(summarizer.get_key_phrases, texts)
+        results = list(zip(summaries, phrases))
+
+    assert results == expected
@@ -0,0 +1,127 @@
+"""
+Micro-batching Scheduler
+Coalesces concurrent single-item requests into batched model calls.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class MicroBatcher:
+    """
+    Gathers items submitted by concurrent requests and processes them together.
+
+    A batch is flushed as soon as it reaches ``max_batch_size`` items or when
+    the oldest waiting item has waited ``max_wait_ms`` milliseconds, whichever
+    comes first. ``process_batch`` receives the list of items and must return
+    one result per item in the same order; each result is handed back to the
+    request that submitted it.
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any]], List[Any]],
+                 max_batch_size: int = 16, max_wait_ms: float = 10.0,
+                 name: str = "batcher", runner: Optional[Callable[..., Awaitable]] = None):
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch (Callable): Blocking function mapping a list of items to a list of results
+            max_batch_size (int): Maximum number of items per batch
+            max_wait_ms (float): Maximum time an item waits for others to join its batch
+            name (str): Name used in log messages and statistics
+            runner (Callable): Coroutine ``runner(fn, items)`` used to run the blocking
+                batch function (defaults to the event loop's default executor)
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.name = name
+        self.runner = runner
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+        self.batches_processed = 0
+        self.items_processed = 0
+        self.largest_batch = 0
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item for the next batch and wait for its result.
+
+        Args:
+            item: Input passed to ``process_batch`` together with other queued items
+
+        Returns:
+            The result produced for this item
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Start processing everything queued so far, in chunks of at most max_batch_size."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size:]
+
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run one batch and fan the results back out to the waiting requests."""
+        items = [item for item, _ in batch]
+
+        try:
+            results = await self._run(items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"{self.name}: expected {len(items)} results, got {len(results)}"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches_processed += 1
+        self.items_processed += len(items)
+        self.largest_batch = max(self.largest_batch, len(items))
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self, items: List[Any]) -> List[Any]:
+        """Run the blocking batch function off the event loop."""
+        if self.runner is not None:
+            return await self.runner(self.process_batch, items)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.process_batch, items)
+
+    def get_stats(self) -> Dict:
+        """Get batching statistics."""
+        return {
+            "name": self.name,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "pending": len(self._pending),
+            "batches_processed": self.batches_processed,
+            "items_processed": self.items_processed,
+            "largest_batch": self.largest_batch,
+            "average_batch_size": round(self.items_processed / self.batches_processed, 2)
+            if self.batches_processed else 0
+        }
@@ -0,0 +1,206 @@
+"""
+Component Loader
+Loads model components lazily and independently, with optional background warm-up.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# Representative input the components are warmed up with
+WARMUP_TEXT = (
+    "I had a long day at work. The meeting ran late and I felt tired and a bit stressed, "
+    "but my team finished the project and I'm proud of what we achieved together."
+)
+
+
+class LazyComponent:
+    """
+    A model component that is built on first use.
+
+    ``get()`` builds the component if needed (callers arriving while it loads
+    wait for the same load) and returns it. After loading, an optional
+    warm-up function runs representative inputs through it so the first real
+    request does not pay for lazy initialization inside the libraries.
+
+    States: "not_loaded" -> "loading" -> "loaded" -> "warming" -> "ready",
+    or "failed" if the factory raised.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any],
+                 warmup: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize the component.
+
+        Args:
+            name (str): Component name used in status reports
+            factory (Callable): Builds and returns the component
+            warmup (Callable): Optional function called with the built component
+        """
+        self.name = name
+        self.factory = factory
+        self.warmup_fn = warmup
+
+        self.state = "not_loaded"
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+
+        self._value = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+
+    def peek(self) -> Optional[Any]:
+        """The component if it is already loaded, without loading it."""
+        return self._value
+
+    def get(self) -> Any:
+        """Return the component, building it first if needed."""
+        if self._value is not None:
+            return self._value
+
+        with self._lock:
+            if self._value is None:
+                self.state = "loading"
+                print(f"Loading {self.name}...")
+                start_time = time.perf_counter()
+                try:
+                    value = self.factory()
+                except Exception as e:
+                    self.state = "failed"
+                    self.error = str(e)
+                    raise
+                self.load_seconds = round(time.perf_counter() - start_time, 2)
+                self.error = None
+                self.state = "loaded"
+                self._value = value
+                print(f"{self.name} ready in {self.load_seconds}s")
+
+        return self._value
+
+    def warm_up(self):
+        """Load the component if needed and run its warm-up once."""
+        value = self.get()
+        if self.warmup_fn is None or self.state != "loaded":
+            if self.state == "loaded":
+                self.state = "ready"
+            return
+
+        self.state = "warming"
+        start_time = time.perf_counter()
+        try:
+            self.warmup_fn(value)
+        except Exception as e:
+            # A failed warm-up does not make the component unusable
+            print(f"Warning: Warm-up of {self.name} failed: {e}")
+        self.warmup_seconds = round(time.perf_counter() - start_time, 2)
+        self.state = "ready"
+
+    def status(self) -> Dict:
+        """Current state and timings."""
+        status = {
+            "state": self.state,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds
+        }
+        if self.error:
+            status["error"] = self.error
+        return status
+
+
+def start_background_warmup(components: Iterable[LazyComponent]) -> threading.Thread:
+    """
+    Load and warm up components one after another on a daemon thread.
+
+    Components are processed in the given order, so list the cheap ones
+    first to make them available as early as possible.
+    """
+    components = list(components)
+
+    def run():
+        for component in components:
+            try:
+                component.warm_up()
+            except Exception as e:
+                print(f"Warning: Could not load {component.name}: {e}")
+
+    thread = threading.Thread(target=run, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def env_flag(name: str, default: str = "0") -> bool:
+    """Whether a yes/no environment variable is on ("1", "true" or "yes")."""
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+def model_settings() -> Dict[str, Any]:
+    """
+    Model options from the environment, shared by the API servers and the CLI.
+
+    Returns:
+        Dict: incremental (NLP_INCREMENTAL), inference_backend (INFERENCE_BACKEND),
+        fused_mood (MOOD_FUSED), quantize_summarizer (SUMMARIZER_QUANTIZE) and
+        corpus_idf (SUMMARIZER_CORPUS_IDF)
+    """
+    return {
+        # Score entries sentence by sentence so edits only re-run the models on changed sentences
+        "incremental": env_flag("NLP_INCREMENTAL"),
+        "inference_backend": os.getenv("INFERENCE_BACKEND", "torch").lower(),
+        "fused_mood": env_flag("MOOD_FUSED"),
+        "quantize_summarizer": env_flag("SUMMARIZER_QUANTIZE"),
+        "corpus_idf": env_flag("SUMMARIZER_CORPUS_IDF"),
+    }
+
+
+def create_components(settings: Optional[Dict[str, Any]] = None) -> Dict[str, LazyComponent]:
+    """
+    The model components, each loading independently on first use, so cheap
+    requests (motivation, extractive summaries) never wait for the large models.
+
+    Args:
+        settings (Dict): Model options (defaults to model_settings())
+
+    Returns:
+        Dict[str, LazyComponent]: "motivator", "summarizer", "mood_detector" and
+        "abstractive_model" (the summarizer with its abstractive model loaded)
+    """
+    from summarizer import TextSummarizer
+    from mood_detector import MoodDetector
+    from motivator import Motivator
+
+    settings = settings or model_settings()
+    components = {
+        "motivator": LazyComponent(
+            "motivator",
+            Motivator,
+            warmup=lambda m: m.get_motivational_content("neutral")
+        ),
+        "summarizer": LazyComponent(
+            "summarizer",
+            lambda: TextSummarizer(
+                incremental=settings["incremental"], quantize=settings["quantize_summarizer"],
+                load_abstractive=False, corpus_idf=settings["corpus_idf"]
+            ),
+            warmup=lambda s: (s.extractive_summarize(WARMUP_TEXT), s.get_key_phrases(WARMUP_TEXT))
+        ),
+        "mood_detector": LazyComponent(
+            "mood_detector",
+            lambda: MoodDetector(
+                incremental=settings["incremental"], backend=settings["inference_backend"],
+                fused=settings["fused_mood"]
+            ),
+            warmup=lambda d: d.comprehensive_mood_analysis(WARMUP_TEXT)
+        ),
+    }
+    # The abstractive model lives inside the summarizer but loads separately
+    components["abstractive_model"] = LazyComponent(
+        "abstractive_model",
+        lambda: components["summarizer"].get().load_abstractive_model(),
+        warmup=lambda s: s.abstractive_summarize(WARMUP_TEXT)
+    )
+    return components
@@ -0,0 +1,196 @@
+"""
+Corpus Streaming
+Reads analysis inputs one record at a time and writes results incrementally with resumable checkpoints.
+"""
+
+import itertools
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+TEXT_FILE_EXTENSIONS = (".txt", ".md")
+
+
+def _record_from_line(line: str, number: int, text_field: str, id_field: str) -> Dict[str, Any]:
+    """Turn one JSONL line into a record; lines that are not JSON are taken as plain text."""
+    try:
+        value = json.loads(line)
+    except ValueError:
+        return {"id": number, "text": line}
+
+    if isinstance(value, str):
+        return {"id": number, "text": value}
+    if not isinstance(value, dict):
+        return {"id": number, "error": "Record is neither an object nor a string"}
+    if not isinstance(value.get(text_field), str):
+        return {"id": value.get(id_field, number), "error": f"Record has no '{text_field}' text"}
+    return {"id": value.get(id_field, number), "text": value[text_field]}
+
+
+def _iter_lines(stream: TextIO, text_field: str, id_field: str) -> Iterator[Dict[str, Any]]:
+    number = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        number += 1
+        yield _record_from_line(line, number, text_field, id_field)
+
+
+def _iter_directory(path: str) -> Iterator[Dict[str, Any]]:
+    # Sorted walk so a resumed run sees the records in the same order
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.lower().endswith(TEXT_FILE_EXTENSIONS):
+                continue
+            file_path = os.path.join(root, name)
+            record_id = os.path.relpath(file_path, path)
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    yield {"id": record_id, "text": f.read().strip()}
+            except (OSError, UnicodeDecodeError) as e:
+                yield {"id": record_id, "error": f"Could not read file: {e}"}
+
+
+def read_records(source: str, text_field: str = "text", id_field: str = "id") -> Iterator[Dict[str, Any]]:
+    """
+    Stream input records, one at a time, from a JSONL file, a directory of
+    text files or stdin.
+
+    Args:
+        source (str): Path of a .jsonl file or a directory, or "-" for JSONL on stdin
+        text_field (str): JSONL field holding the text
+        id_field (str): JSONL field holding the record id (defaults to the line number)
+
+    Yields:
+        Dict: {"id", "text"}, or {"id", "error"} for a record that cannot be analyzed
+    """
+    if source == "-":
+        yield from _iter_lines(sys.stdin, text_field, id_field)
+    elif os.path.isdir(source):
+        yield from _iter_directory(source)
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from _iter_lines(f, text_field, id_field)
+
+
+def batched(records: Iterable, size: int) -> Iterator[List]:
+    """Group an iterable into lists of at most ``size`` items without reading ahead."""
+    iterator = iter(records)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class CheckpointedWriter:
+    """
+    Appends result records to a JSONL file and records progress next to it.
+
+    After each ``write_batch`` the output is flushed to disk and a checkpoint
+    (``<output>.checkpoint``) stores how many input records are done and the
+    output size at that point. Resuming truncates anything written after the
+    last checkpoint and skips the records it covers, so an interrupted run
+    continues without duplicates or gaps.
+    """
+
+    def __init__(self, output_path: str, source: str, resume: bool = False):
+        """
+        Open the output file.
+
+        Args:
+            output_path (str): Results JSONL file
+            source (str): Input being processed, recorded in the checkpoint
+            resume (bool): Continue from an existing checkpoint instead of starting over
+        """
+        self.output_path = output_path
+        self.checkpoint_path = f"{output_path}.checkpoint"
+        self.source = source
+        self.records_done = 0
+        self.finished = False
+
+        checkpoint = self._load_checkpoint() if resume else None
+        if checkpoint is not None:
+            if checkpoint.get("source") != source:
+                raise ValueError(
+                    f"Checkpoint {self.checkpoint_path} belongs to {checkpoint.get('source')!r}, not {source!r}"
+                )
+            if not os.path.exists(output_path) or os.path.getsize(output_path) < checkpoint["output_bytes"]:
+                raise ValueError(f"{output_path} is missing results recorded in {self.checkpoint_path}")
+            self.records_done = checkpoint["records_done"]
+            self.finished = checkpoint.get("finished", False)
+            self._file = open(output_path, 'a+', encoding='utf-8')
+            self._file.truncate(checkpoint["output_bytes"])
+            self._file.seek(checkpoint["output_bytes"])
+        else:
+            self._file = open(output_path, 'w', encoding='utf-8')
+            self._save_checkpoint()
+
+    def _load_checkpoint(self) -> Optional[Dict]:
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_checkpoint(self):
+        checkpoint = {
+            "source": self.source,
+            "records_done": self.records_done,
+            "output_bytes": self._file.tell(),
+            "finished": self.finished
+        }
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def write_batch(self, results: List[Dict[str, Any]]):
+        """Append one batch of results and checkpoint after it."""
+        for result in results:
+            self._file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.records_done += len(results)
+        self._save_checkpoint()
+
+    def close(self, finished: bool = False):
+        """Close the output; ``finished`` marks the whole input as processed."""
+        if finished:
+            self.finished = True
+            self._save_checkpoint()
+        self._file.close()
+
+
+class ProgressReporter:
+    """Prints records processed and throughput to stderr at most every ``interval`` seconds."""
+
+    def __init__(self, interval: float = 5.0, already_done: int = 0):
+        self.interval = interval
+        self.already_done = already_done
+        self.records = 0
+        self.failed = 0
+        self.start_time = time.perf_counter()
+        self._last_report = self.start_time
+
+    def update(self, records: int, failed: int = 0):
+        self.records += records
+        self.failed += failed
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def report(self, final: bool = False):
+        elapsed = time.perf_counter() - self.start_time
+        rate = self.records / elapsed if elapsed > 0 else 0.0
+        label = "Done" if final else "Progress"
+        print(
+            f"{label}: {self.already_done + self.records} records "
+            f"({self.records} this run, {self.failed} failed) in {elapsed:.1f}s, {rate:.1f} records/s",
+            file=sys.stderr
+        )
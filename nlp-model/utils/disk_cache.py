@@ -0,0 +1,215 @@
+"""
+Disk Result Store
+SQLite-backed analysis result store that survives restarts and is shared across worker processes.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class DiskResultStore:
+    """
+    Persistent key/value store for analysis results.
+
+    Uses SQLite in WAL mode so several server workers (and the CLI) can read
+    and write the same file concurrently. Each row remembers the namespace and
+    model version that produced it. Processes with different model versions
+    (e.g. the CLI next to a server running ONNX or the fused mood engine) share
+    the store, so writes never delete other versions' rows: the version is part
+    of every key, and rows of versions nobody reads any more simply age out.
+    The store is kept bounded by pruning least recently used rows once it grows
+    past ``max_entries`` or ``max_bytes``, and freed pages are returned to the
+    file system with incremental vacuuming.
+    """
+
+    PRUNE_EVERY = 100
+    TOUCH_INTERVAL = 60.0
+
+    def __init__(self, path: str, max_entries: int = 50000, max_bytes: Optional[int] = 256 * 1024 * 1024):
+        """
+        Open (or create) the store.
+
+        Args:
+            path (str): Path of the SQLite database file
+            max_entries (int): Maximum number of stored results
+            max_bytes (int): Maximum size of the database file, or None for no limit
+        """
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._create_schema()
+
+        # SQLite connections must not be used across fork(); forked server
+        # workers open their own on first use
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_connections)
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite connections must not be shared across threads."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _reset_connections(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _create_schema(self):
+        connection = self._connection()
+        # auto_vacuum must be chosen before the first table is created
+        connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                namespace TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_results_accessed_at ON results (accessed_at)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_results_namespace ON results (namespace, model_version)")
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Look up a stored result.
+
+        Args:
+            key (str): Result key
+            max_age (float): Ignore results written more than this many seconds ago
+
+        Returns:
+            The stored value, or None if absent or too old
+        """
+        entry = self.get_entry(key, max_age)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str, max_age: Optional[float] = None) -> Optional[Tuple[Any, float]]:
+        """
+        Look up a stored result together with the time it was written.
+
+        Args:
+            key (str): Result key
+            max_age (float): Ignore results written more than this many seconds ago
+
+        Returns:
+            Tuple: The stored value and its ``time.time()`` write time, or None if absent or too old
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, created_at, accessed_at FROM results WHERE key = ?", (key,)
+        ).fetchone()
+
+        now = time.time()
+        if row is None or (max_age and now - row[1] > max_age):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # Only refresh the LRU timestamp occasionally to keep reads cheap
+        if now - row[2] > self.TOUCH_INTERVAL:
+            connection.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, namespace: str = "", model_version: str = ""):
+        """
+        Store a result.
+
+        Args:
+            key (str): Result key
+            value: JSON-serializable result
+            namespace (str): Kind of result, e.g. "summary" or "mood"
+            model_version (str): Identifier of the models that produced the result
+        """
+        now = time.time()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO results (key, namespace, model_version, value, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, namespace, model_version, json.dumps(value, ensure_ascii=False), now, now)
+        )
+
+        with self._lock:
+            self._writes_since_prune += 1
+            should_prune = self._writes_since_prune >= self.PRUNE_EVERY
+            if should_prune:
+                self._writes_since_prune = 0
+
+        if should_prune:
+            self.prune()
+
+    def _file_size(self) -> int:
+        size = 0
+        for suffix in ("", "-wal"):
+            try:
+                size += os.path.getsize(self.path + suffix)
+            except OSError:
+                pass
+        return size
+
+    def prune(self):
+        """Evict least recently used rows until the store is within its limits."""
+        connection = self._connection()
+        count = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+        excess = count - self.max_entries
+        if self.max_bytes and self._file_size() > self.max_bytes:
+            # Drop an extra tenth so we are not pruning again on the next write
+            excess = max(excess, count // 10)
+
+        if excess <= 0:
+            return
+
+        cursor = connection.execute(
+            "DELETE FROM results WHERE key IN "
+            "(SELECT key FROM results ORDER BY accessed_at ASC LIMIT ?)",
+            (excess,)
+        )
+        self.pruned += max(cursor.rowcount, 0)
+        connection.execute("PRAGMA incremental_vacuum")
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def vacuum(self):
+        """Rebuild the database file to reclaim all free space."""
+        connection = self._connection()
+        connection.execute("VACUUM")
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def clear(self):
+        """Remove all stored results."""
+        self._connection().execute("DELETE FROM results")
+        self.vacuum()
+
+    def get_stats(self) -> Dict:
+        """Get store statistics."""
+        count = self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {
+            "path": self.path,
+            "entries": count,
+            "max_entries": self.max_entries,
+            "size_bytes": self._file_size(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "pruned": self.pruned
+        }
@@ -0,0 +1,113 @@
+"""
+Inference Executor
+Runs blocking model inference off the asyncio event loop with a bounded queue.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class ExecutorBusyError(Exception):
+    """Raised when the inference queue is full and a new job cannot be accepted."""
+
+
+class InferenceExecutor:
+    """
+    Dedicated thread pool for model inference.
+
+    At most ``max_workers`` jobs run at once and at most ``max_queue_size``
+    more wait for a free worker. Jobs submitted beyond that are rejected with
+    ``ExecutorBusyError`` instead of piling up behind long-running summaries,
+    so callers can shed load (e.g. answer 503) while the event loop stays free
+    for cheap requests.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue_size: int = 32, name: str = "inference"):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers (int): Number of inference threads
+            max_queue_size (int): Number of jobs allowed to wait for a free thread
+            name (str): Thread name prefix
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self.name = name
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of running plus queued jobs."""
+        return self.max_workers + self.max_queue_size
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the inference pool and await its result.
+
+        Args:
+            fn (Callable): Blocking function to run
+            *args, **kwargs: Arguments passed to ``fn``
+
+        Returns:
+            The value returned by ``fn``
+
+        Raises:
+            ExecutorBusyError: If the pool and its queue are already full
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.rejected += 1
+                raise ExecutorBusyError(
+                    f"Inference queue is full ({self._in_flight}/{self.capacity} jobs)"
+                )
+            self._in_flight += 1
+
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        # The slot is held until the job itself finishes: a caller that is cancelled
+        # while its job runs must not free the slot of a thread that is still busy
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future):
+        """Free the slot of a finished (or cancelled before it started) job."""
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def get_stats(self) -> Dict:
+        """Get executor statistics."""
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "running": min(in_flight, self.max_workers),
+            "queued": max(0, in_flight - self.max_workers),
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=wait)
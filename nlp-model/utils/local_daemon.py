@@ -0,0 +1,157 @@
+"""
+Local Daemon
+Serves JSON requests over a Unix socket so a process with loaded models can be reused.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class DaemonUnavailable(Exception):
+    """Raised when no daemon is listening on the socket."""
+
+
+class DaemonError(Exception):
+    """Raised when the daemon received a request but failed to handle it."""
+
+
+def default_socket_path(name: str) -> str:
+    """
+    Per-user socket path that other users cannot create or replace.
+
+    Uses $XDG_RUNTIME_DIR when set, else a 0700 directory of this user's in
+    the temp directory (Unix socket paths must be short).
+
+    Raises:
+        RuntimeError: If the per-user directory exists but another user owns it
+            or can write to it
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, f"{name}.sock")
+
+    uid = os.getuid()
+    directory = os.path.join(tempfile.gettempdir(), f"{name}-{uid}")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != uid or info.st_mode & 0o077:
+        raise RuntimeError(f"{directory} is not a private directory of this user; set NLP_DAEMON_SOCKET")
+    return os.path.join(directory, "daemon.sock")
+
+
+def _send(sock: socket.socket, message: Dict):
+    sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+def _receive(sock_file) -> Optional[Dict]:
+    line = sock_file.readline()
+    return json.loads(line) if line else None
+
+
+def is_running(path: str) -> bool:
+    """Whether a daemon answers on the socket."""
+    try:
+        return request(path, {"action": "ping"}, timeout=2.0) == "pong"
+    except (DaemonUnavailable, DaemonError):
+        return False
+
+
+def request(path: str, payload: Dict, timeout: Optional[float] = None) -> Any:
+    """
+    Send one request to the daemon and return its result.
+
+    Args:
+        path (str): Socket path
+        payload (Dict): JSON-serializable request with an "action" key
+        timeout (float): Seconds to wait for the answer (None waits indefinitely)
+
+    Returns:
+        The handler's result
+
+    Raises:
+        DaemonUnavailable: If nothing is listening on the socket, or another user owns it
+        DaemonError: If the daemon failed to handle the request
+    """
+    # Never send text to a socket another user could have put in place
+    try:
+        owner = os.stat(path).st_uid
+    except FileNotFoundError as e:
+        raise DaemonUnavailable(str(e))
+    if owner != os.getuid():
+        raise DaemonUnavailable(f"{path} is owned by another user")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(2.0)
+        try:
+            sock.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError, socket.timeout) as e:
+            raise DaemonUnavailable(str(e))
+        sock.settimeout(timeout)
+
+        _send(sock, payload)
+        with sock.makefile("r", encoding="utf-8") as sock_file:
+            response = _receive(sock_file)
+    finally:
+        sock.close()
+
+    if response is None:
+        raise DaemonError("Daemon closed the connection without answering")
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "Unknown daemon error"))
+    return response.get("result")
+
+
+def serve(path: str, handler: Callable[[Dict], Any]):
+    """
+    Serve requests on a Unix socket until a "shutdown" request arrives.
+
+    Each connection carries one newline-delimited JSON request and gets one
+    JSON response. "ping" and "shutdown" are answered here; every other
+    request is passed to ``handler`` and its return value sent back.
+
+    Args:
+        path (str): Socket path; a stale socket file left by a dead daemon is replaced
+        handler (Callable): Called with the request dict, returns a JSON-serializable result
+    """
+    if os.path.exists(path):
+        if is_running(path):
+            raise RuntimeError(f"A daemon is already running on {path}")
+        os.unlink(path)
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            message = json.loads(self.rfile.readline() or b"{}")
+            action = message.get("action")
+
+            if action == "ping":
+                response = {"ok": True, "result": "pong"}
+            elif action == "shutdown":
+                response = {"ok": True, "result": "stopping"}
+            else:
+                try:
+                    response = {"ok": True, "result": handler(message)}
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+
+            _send(self.connection, response)
+            if action == "shutdown":
+                # Answer first: the process exits as soon as serve_forever returns
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    server = socketserver.ThreadingUnixStreamServer(path, RequestHandler)
+    server.daemon_threads = True
+    os.chmod(path, 0o600)
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
@@ -0,0 +1,52 @@
+"""
+Process Memory
+Shared versus private resident memory of a process, read from /proc (Linux only).
+"""
+
+import os
+from typing import Dict, Union
+
+_FIELDS = {
+    "Rss": "rss_mb",
+    "Pss": "pss_mb",
+    "Shared_Clean": "shared_clean_mb",
+    "Shared_Dirty": "shared_dirty_mb",
+    "Private_Clean": "private_clean_mb",
+    "Private_Dirty": "private_dirty_mb",
+}
+
+
+def process_memory(pid: Union[int, str] = "self") -> Dict:
+    """
+    Break down a process's resident memory.
+
+    Pages still shared copy-on-write with the pre-fork parent (e.g. model
+    weights) show up as shared; pages the process has written to are private.
+    PSS splits each shared page evenly between the processes mapping it, so
+    summing PSS over all workers gives their true combined footprint.
+
+    Args:
+        pid: Process id, or "self" for the calling process
+
+    Returns:
+        Dict: Sizes in megabytes, plus "shared_mb" and "private_mb" totals;
+            empty if /proc is not available
+    """
+    rollup = f"/proc/{pid}/smaps_rollup"
+    path = rollup if os.path.exists(rollup) else f"/proc/{pid}/smaps"
+
+    totals = {key: 0 for key in _FIELDS.values()}
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if name in _FIELDS:
+                    # Values are reported in kB
+                    totals[_FIELDS[name]] += int(value.split()[0])
+    except (OSError, ValueError):
+        return {}
+
+    stats = {key: round(kb / 1024, 1) for key, kb in totals.items()}
+    stats["shared_mb"] = round((totals["shared_clean_mb"] + totals["shared_dirty_mb"]) / 1024, 1)
+    stats["private_mb"] = round((totals["private_clean_mb"] + totals["private_dirty_mb"]) / 1024, 1)
+    return stats
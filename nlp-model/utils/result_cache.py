@@ -0,0 +1,268 @@
+"""
+Result Cache
+Content-addressed in-process cache for analysis results with LRU and TTL eviction.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+DEFAULT_CACHE_DB = os.path.join(os.path.dirname(__file__), '..', 'cache', 'analysis_cache.sqlite')
+
+
+class CacheKey(NamedTuple):
+    """A result key together with what produced it, recorded alongside persisted results."""
+    digest: str
+    namespace: str
+    model_version: str
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so that re-saving an entry with different whitespace hits the same key."""
+    text = unicodedata.normalize("NFC", text or "")
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def make_cache_key(namespace: str, text: str, options: Optional[Dict] = None, model_version: str = "") -> CacheKey:
+    """
+    Build a cache key from the analysis type, the normalized text, the request
+    options and the version of the models that produce the result.
+
+    Args:
+        namespace (str): Kind of result, e.g. "summary" or "mood"
+        text (str): Input text
+        options (Dict): Options that change the result (e.g. summary type)
+        model_version (str): Identifier of the models used
+
+    Returns:
+        CacheKey: Hex SHA-256 digest plus namespace and model version
+    """
+    payload = json.dumps(
+        [namespace, normalize_text(text), options or {}, model_version],
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return CacheKey(hashlib.sha256(payload.encode("utf-8")).hexdigest(), namespace, model_version)
+
+
+def result_model_version(component, text: str, options: Optional[Dict] = None) -> str:
+    """
+    Model version to key one result of ``component`` with.
+
+    Components that have a ``get_result_version(text, **options)`` narrow it to
+    the models that result actually depends on; others use ``get_model_version()``.
+    """
+    get_result_version = getattr(component, "get_result_version", None)
+    if get_result_version is not None:
+        return get_result_version(text, **(options or {}))
+    return component.get_model_version()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with a per-entry time-to-live.
+
+    Values are deep-copied on the way in and out so callers can never
+    mutate a cached result. An optional persistent ``backing_store`` (see
+    ``disk_cache.DiskResultStore``) is consulted on memory misses and written
+    through on every store, so results survive restarts and are shared
+    between processes. The TTL counts from when a result was first computed,
+    so a result read back from the store expires at the same time as the
+    memory copy it replaces.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600, backing_store=None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of cached results; 0 disables caching
+            ttl_seconds (float): Seconds a result stays valid; 0 means no expiry
+            backing_store: Optional persistent store with ``get_entry(key, max_age)`` and
+                ``set(key, value, namespace, model_version)``
+        """
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = max(0, ttl_seconds)
+        self.backing_store = backing_store
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            key (CacheKey): Cache key from ``make_cache_key``
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        value = self._get_from_memory(key.digest)
+        if value is not None:
+            self._count(hit=True)
+            return copy.deepcopy(value)
+
+        if self.backing_store is not None:
+            try:
+                entry = self.backing_store.get_entry(key.digest, max_age=self.ttl_seconds or None)
+            except Exception as e:
+                print(f"Result store read failed: {e}")
+                entry = None
+
+            if entry is not None:
+                value, created_at = entry
+                self._set_in_memory(key.digest, value, age=max(0.0, time.time() - created_at))
+                self._count(hit=True, from_store=True)
+                return copy.deepcopy(value)
+
+        self._count(hit=False)
+        return None
+
+    def _count(self, hit: bool, from_store: bool = False):
+        # A result read back from the store is a hit too; only misses in both layers count as misses
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self.store_hits += from_store
+            else:
+                self.misses += 1
+
+    def _get_from_memory(self, digest: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[digest]
+                self.expirations += 1
+                return None
+
+            self._entries.move_to_end(digest)
+            return value
+
+    def set(self, key: CacheKey, value: Any):
+        """
+        Store a result, evicting the least recently used entries if full.
+
+        Args:
+            key (CacheKey): Cache key from ``make_cache_key``
+            value: Result to cache
+        """
+        if not self.enabled:
+            return
+
+        self._set_in_memory(key.digest, copy.deepcopy(value))
+
+        if self.backing_store is not None:
+            try:
+                self.backing_store.set(key.digest, value, key.namespace, key.model_version)
+            except Exception as e:
+                print(f"Result store write failed: {e}")
+
+    def get_or_compute(self, key: CacheKey, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Return the cached result for ``key``, or call ``fn`` and cache what it returns.
+
+        Args:
+            key (CacheKey): Cache key from ``make_cache_key``
+            fn (Callable): Function producing the result on a miss
+            *args, **kwargs: Arguments passed to ``fn``
+
+        Returns:
+            The cached or freshly computed result
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        value = fn(*args, **kwargs)
+        self.set(key, value)
+        return value
+
+    def _set_in_memory(self, digest: str, value: Any, age: float = 0.0):
+        expires_at = time.monotonic() + self.ttl_seconds - age if self.ttl_seconds else None
+
+        with self._lock:
+            self._entries[digest] = (expires_at, value)
+            self._entries.move_to_end(digest)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics."""
+        with self._lock:
+            size = len(self._entries)
+        lookups = self.hits + self.misses
+        stats = {
+            "size": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+        if self.backing_store is not None:
+            stats["disk"] = self.backing_store.get_stats()
+        return stats
+
+
+def create_result_cache() -> ResultCache:
+    """
+    Build the result cache from environment settings.
+
+    RESULT_CACHE_SIZE / RESULT_CACHE_TTL size the in-memory layer. NLP_CACHE_DB
+    is the path of the persistent SQLite store (set it to an empty string to
+    disable it); NLP_CACHE_DB_MAX_ENTRIES and NLP_CACHE_DB_MAX_MB bound it.
+    """
+    backing_store = None
+    db_path = os.getenv("NLP_CACHE_DB", DEFAULT_CACHE_DB)
+
+    if db_path:
+        try:
+            from disk_cache import DiskResultStore
+            backing_store = DiskResultStore(
+                db_path,
+                max_entries=int(os.getenv("NLP_CACHE_DB_MAX_ENTRIES", "50000")),
+                max_bytes=int(float(os.getenv("NLP_CACHE_DB_MAX_MB", "256")) * 1024 * 1024)
+            )
+        except Exception as e:
+            print(f"Warning: Could not open result store at {db_path}: {e}")
+
+    return ResultCache(
+        max_entries=int(os.getenv("RESULT_CACHE_SIZE", "1024")),
+        ttl_seconds=float(os.getenv("RESULT_CACHE_TTL", "3600")),
+        backing_store=backing_store
+    )
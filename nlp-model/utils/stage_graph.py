@@ -0,0 +1,192 @@
+"""
+Stage Graph Executor
+Runs analysis stages concurrently, starting each stage as soon as its dependencies finish.
+"""
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+
+class StageGraphResult:
+    """Outcome of a stage graph run."""
+
+    def __init__(self):
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.timings: Dict[str, float] = {}
+        self.total_time = 0.0
+
+    def ok(self, name: str) -> bool:
+        """Whether the stage ran and produced a result."""
+        return name in self.results
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get a stage result, or ``default`` if it failed or was skipped."""
+        return self.results.get(name, default)
+
+    def get_timings(self) -> Dict[str, float]:
+        """Per-stage wall time in seconds, plus the end-to-end total."""
+        timings = dict(self.timings)
+        timings["total"] = self.total_time
+        return timings
+
+
+class StageGraph:
+    """
+    A small dependency graph of named stages.
+
+    Each stage is a callable that receives a dict with the results of the
+    stages it depends on. Independent stages run in parallel, so end-to-end
+    latency approaches that of the slowest dependency chain rather than the
+    sum of all stages. A stage whose dependency failed is skipped.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._dependencies: Dict[str, List[str]] = {}
+
+    def add_stage(self, name: str, fn: Callable[[Dict[str, Any]], Any],
+                  after: Optional[List[str]] = None) -> "StageGraph":
+        """
+        Add a stage to the graph.
+
+        Args:
+            name (str): Unique stage name
+            fn (Callable): Stage function; called with the results of its dependencies.
+                In ``run_async`` it may be a coroutine function or return an awaitable.
+            after (List[str]): Names of stages that must finish first
+
+        Returns:
+            StageGraph: The graph itself, for chaining
+        """
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name}")
+
+        dependencies = list(after or [])
+        for dependency in dependencies:
+            if dependency not in self._stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dependency}'")
+
+        self._stages[name] = fn
+        self._dependencies[name] = dependencies
+        return self
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._stages
+
+    def _ready_stages(self, done: set, started: set, result: StageGraphResult) -> List[str]:
+        """
+        Mark and return stages whose dependencies are all finished.
+        Stages behind a failed dependency are recorded as skipped instead.
+        """
+        ready = []
+        skipped_any = True
+        while skipped_any:
+            skipped_any = False
+            for name, dependencies in self._dependencies.items():
+                if name in started or not all(d in done for d in dependencies):
+                    continue
+
+                started.add(name)
+                failed = [d for d in dependencies if d not in result.results]
+                if failed:
+                    result.errors[name] = RuntimeError(f"Skipped because '{failed[0]}' failed")
+                    done.add(name)
+                    skipped_any = True
+                else:
+                    ready.append(name)
+
+        return ready
+
+    def _dependency_results(self, name: str, result: StageGraphResult) -> Dict[str, Any]:
+        return {d: result.results[d] for d in self._dependencies[name]}
+
+    def run(self, max_workers: Optional[int] = None) -> StageGraphResult:
+        """
+        Run the graph on a thread pool and wait for all stages.
+
+        Args:
+            max_workers (int): Thread pool size (defaults to the number of stages)
+
+        Returns:
+            StageGraphResult: Stage results, errors and timings
+        """
+        result = StageGraphResult()
+        start_time = time.perf_counter()
+        done, started = set(), set()
+
+        def timed(name: str, inputs: Dict[str, Any]):
+            stage_start = time.perf_counter()
+            try:
+                return self._stages[name](inputs)
+            finally:
+                result.timings[name] = round(time.perf_counter() - stage_start, 3)
+
+        with ThreadPoolExecutor(max_workers=max_workers or max(1, len(self._stages))) as executor:
+            running = {}
+            while len(done) < len(self._stages):
+                for name in self._ready_stages(done, started, result):
+                    running[executor.submit(timed, name, self._dependency_results(name, result))] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        result.results[name] = future.result()
+                    except Exception as e:
+                        result.errors[name] = e
+                    done.add(name)
+
+        result.total_time = round(time.perf_counter() - start_time, 3)
+        return result
+
+    async def run_async(self) -> StageGraphResult:
+        """
+        Run the graph on the current event loop.
+
+        Coroutine stages run concurrently; plain functions run inline, so
+        blocking work should be handed to an executor by the stage itself.
+
+        Returns:
+            StageGraphResult: Stage results, errors and timings
+        """
+        result = StageGraphResult()
+        start_time = time.perf_counter()
+        done, started = set(), set()
+
+        async def timed(name: str, inputs: Dict[str, Any]):
+            stage_start = time.perf_counter()
+            try:
+                value = self._stages[name](inputs)
+                if inspect.isawaitable(value):
+                    value = await value
+                return value
+            finally:
+                result.timings[name] = round(time.perf_counter() - stage_start, 3)
+
+        running = {}
+        while len(done) < len(self._stages):
+            for name in self._ready_stages(done, started, result):
+                task = asyncio.ensure_future(timed(name, self._dependency_results(name, result)))
+                running[task] = name
+
+            if not running:
+                break
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                name = running.pop(task)
+                try:
+                    result.results[name] = task.result()
+                except Exception as e:
+                    result.errors[name] = e
+                done.add(name)
+
+        result.total_time = round(time.perf_counter() - start_time, 3)
+        return result